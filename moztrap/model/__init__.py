@@ -10,7 +10,10 @@ from .mtmodel import ConcurrencyError
 from .core.models import Product, ProductVersion, ApiKey
 from .core.auth import User, Role, Permission
 from .environments.models import Environment, Profile, Element, Category
-from .execution.models import Run, RunSuite, RunCaseVersion, Result, StepResult
+from .execution.models import (
+    Run, RunSuite, RunCaseVersion, Result, LatestResult, StepResult,
+    ResultSummary, RunLockJob, LockChange, Watermark, ResultRollup, BugURL,
+    CaseFlakiness)
 from .library.bulk import BulkParser
 from .library.models import (
     Case, CaseVersion, CaseAttachment, CaseStep, Suite, SuiteCase)
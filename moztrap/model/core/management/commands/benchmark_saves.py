@@ -0,0 +1,123 @@
+"""
+Management command to benchmark the size of the UPDATE sent by saves.
+
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from moztrap.model.core.models import Product, ProductVersion
+from moztrap.model.execution.models import Run
+from moztrap.model.library.models import Case, CaseStep, CaseVersion, Suite
+
+
+
+class Command(BaseCommand):
+    args = "[<text_length>]"
+    help = (
+        "Save instances with text fields of the given length (default 10000) "
+        "after changing one short field, and report the bytes of UPDATE SQL "
+        "sent per save when writing all fields (as for an instance not "
+        "loaded from the database) and when writing only changed fields. "
+        "The benchmark data is deleted afterwards.")
+
+    def handle(self, *args, **options):
+        try:
+            if len(args) > 1:
+                raise ValueError()
+            length = int(args[0]) if args else 10000
+        except ValueError:
+            raise CommandError("Usage: {0}".format(self.args))
+
+        text = "x" * length
+        product = Product.objects.create(name="Benchmark", description=text)
+        try:
+            pv = ProductVersion.objects.create(product=product, version="1")
+            cv = CaseVersion.objects.create(
+                productversion=pv,
+                case=Case.objects.create(product=product),
+                name="Benchmark",
+                description=text,
+                )
+            saves = [
+                (
+                    "run status",
+                    Run.objects.create(
+                        productversion=pv, name="Benchmark", description=text),
+                    "status",
+                    Run.STATUS.disabled,
+                    {},
+                    ),
+                (
+                    "suite status",
+                    Suite.objects.create(
+                        product=product, name="Benchmark", description=text),
+                    "status",
+                    Suite.STATUS.active,
+                    {},
+                    ),
+                (
+                    "caseversion name",
+                    cv,
+                    "name",
+                    "Renamed",
+                    {"skip_set_latest": True, "skip_sync_name": True},
+                    ),
+                (
+                    "casestep number",
+                    CaseStep.objects.create(
+                        caseversion=cv,
+                        number=1,
+                        instruction=text,
+                        expected=text,
+                        ),
+                    "number",
+                    2,
+                    {},
+                    ),
+                (
+                    "productversion order",
+                    pv,
+                    "order",
+                    2,
+                    {"skip_reorder": True, "notrack": True},
+                    ),
+                ]
+
+            self.stdout.write(
+                "{0:<22} {1:>10} {2:>10}\n".format("save", "all", "changed"))
+            for label, obj, field, value, kwargs in saves:
+                self.stdout.write(
+                    "{0:<22} {1:>10} {2:>10}\n".format(
+                        label,
+                        self.measure(obj, field, value, True, **kwargs),
+                        self.measure(obj, field, value, False, **kwargs),
+                        )
+                    )
+        finally:
+            product.delete(permanent=True)
+
+
+    def measure(self, obj, field, value, write_all, **kwargs):
+        """
+        Set ``field`` of a fresh copy of ``obj`` to ``value`` and save it.
+
+        Returns bytes of SQL of UPDATEs of the ``obj`` table. If ``write_all``,
+        the copy is saved as if not loaded from the database.
+
+        """
+        obj = obj.__class__.everything.get(pk=obj.pk)
+        if write_all:
+            obj._loaded_values = {}
+        setattr(obj, field, value)
+        table = obj._meta.db_table
+        connection.use_debug_cursor = True
+        connection.queries = []
+        try:
+            obj.save(**kwargs)
+            return sum(
+                len(q["sql"]) for q in connection.queries
+                if q["sql"].startswith("UPDATE")
+                and table in q["sql"].split(" SET ", 1)[0]
+                )
+        finally:
+            connection.use_debug_cursor = None
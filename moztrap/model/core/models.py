@@ -11,7 +11,7 @@ from pkg_resources import parse_version
 from preferences.models import Preferences
 
 from ..environments.models import HasEnvironmentsModel
-from ..mtmodel import MTModel, MTManager, TeamModel
+from ..mtmodel import ConcurrencyError, MTModel, MTManager, TeamModel
 from .auth import Role, User
 
 
@@ -33,15 +33,17 @@ class Product(MTModel, TeamModel):
         ordering = ["name"]
 
 
-    def clone(self, *args, **kwargs):
+    def clone_defaults(self, cascade, overrides):
         """
         Clone Product, with team.
 
         """
-        kwargs.setdefault("cascade", ["team"])
-        overrides = kwargs.setdefault("overrides", {})
+        if cascade is None:
+            cascade = ["team"]
+        cascade, overrides = super(Product, self).clone_defaults(
+            cascade, overrides)
         overrides.setdefault("name", "Cloned: {0}".format(self.name))
-        return super(Product, self).clone(*args, **kwargs)
+        return cascade, overrides
 
 
     def reorder_versions(self, update_instance=None):
@@ -56,7 +58,12 @@ class Product(MTModel, TeamModel):
         for i, version in enumerate(ordered, 1):
             version.order = i
             version.latest = (i == len(ordered))
-            version.save(force_update=True, skip_reorder=True, notrack=True)
+        if ProductVersion.objects.bulk_update(
+                ordered, ["order", "latest"], notrack=True):
+            raise ConcurrencyError(
+                "Versions of {0} were changed while reordering them.".format(
+                    self))
+        for version in ordered:
             if version == update_instance:
                 update_instance.order = version.order
                 update_instance.latest = version.latest
@@ -101,14 +108,16 @@ class ProductVersion(MTModel, TeamModel, HasEnvironmentsModel):
 
     def delete(self, *args, **kwargs):
         """Delete productversion, updating latest version."""
-        super(ProductVersion, self).delete(*args, **kwargs)
+        counts = super(ProductVersion, self).delete(*args, **kwargs)
         self.product.reorder_versions()
+        return counts
 
 
     def undelete(self, *args, **kwargs):
         """Undelete productversion, updating latest version."""
-        super(ProductVersion, self).undelete(*args, **kwargs)
+        counts = super(ProductVersion, self).undelete(*args, **kwargs)
         self.product.reorder_versions()
+        return counts
 
 
     def clean(self):
@@ -156,16 +165,18 @@ class ProductVersion(MTModel, TeamModel, HasEnvironmentsModel):
         return {Run: runs, CaseVersion: caseversions}
 
 
-    def clone(self, *args, **kwargs):
+    def clone_defaults(self, cascade, overrides):
         """
         Clone ProductVersion, with ".next" version and "Cloned:" codename.
 
         """
-        overrides = kwargs.setdefault("overrides", {})
+        if cascade is None:
+            cascade = ["environments", "team"]
+        cascade, overrides = super(ProductVersion, self).clone_defaults(
+            cascade, overrides)
         overrides["version"] = "%s.next" % self.version
         overrides["codename"] = "Cloned: %s" % self.codename
-        kwargs.setdefault("cascade", ["environments", "team"])
-        return super(ProductVersion, self).clone(*args, **kwargs)
+        return cascade, overrides
 
 
 
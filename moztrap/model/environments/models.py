@@ -49,12 +49,14 @@ class Profile(MTModel):
         return new
 
 
-    def clone(self, *args, **kwargs):
+    def clone_defaults(self, cascade, overrides):
         """Clone profile, with environments."""
-        kwargs.setdefault("cascade", ["environments"])
-        overrides = kwargs.setdefault("overrides", {})
+        if cascade is None:
+            cascade = ["environments"]
+        cascade, overrides = super(Profile, self).clone_defaults(
+            cascade, overrides)
         overrides.setdefault("name", "Cloned: {0}".format(self.name))
-        return super(Profile, self).clone(*args, **kwargs)
+        return cascade, overrides
 
 
     def categories(self):
@@ -181,10 +183,11 @@ class Environment(MTModel):
         return iter(self.elements.order_by("category__name"))
 
 
-    def clone(self, *args, **kwargs):
+    def clone_defaults(self, cascade, overrides):
         """Clone environment, including element relationships."""
-        kwargs.setdefault("cascade", ["elements"])
-        return super(Environment, self).clone(*args, **kwargs)
+        if cascade is None:
+            cascade = ["elements"]
+        return super(Environment, self).clone_defaults(cascade, overrides)
 
 
     # @@@ there should be some way to annotate this onto a queryset efficiently
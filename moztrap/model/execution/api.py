@@ -7,8 +7,10 @@ from tastypie.bundle import Bundle
 import json
 
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
+from django.db import transaction
 from django.http import HttpResponse
 
+from .ingest import record_results
 from .models import Run, RunCaseVersion, RunSuite, Result
 from ..mtapi import MTResource, MTApiKeyAuthentication, MTAuthorization
 from ..core.api import (ProductVersionResource, ProductResource,
@@ -248,6 +250,20 @@ class ResultResource(ModelResource):
             ]
         }
 
+    With ``bulk=1`` in the querystring, results are recorded in a fixed
+    number of queries, and results that can't be recorded don't fail the
+    whole request; instead the response lists them by index::
+
+        {
+            "recorded": 2,
+            "errors": [
+                {
+                    "index": 1,
+                    "error": "Specified environment does not exist: 99"
+                }
+            ]
+        }
+
     """
 
     class Meta:
@@ -305,6 +321,37 @@ class ResultResource(ModelResource):
         return bundle
 
 
+    def patch_list(self, request, **kwargs):
+        """Record results in bulk if ``bulk`` querystring param is given."""
+        if not request.GET.get("bulk"):
+            return super(ResultResource, self).patch_list(request, **kwargs)
+
+        deserialized = self.deserialize(
+            request,
+            request.raw_post_data,
+            format=request.META.get("CONTENT_TYPE", "application/json"))
+
+        objects = deserialized.get("objects")
+        if not isinstance(objects, list):
+            error_msg = "PATCH request must contain objects list."
+            logger.error(error_msg)
+            raise ImmediateHttpResponse(
+                response=http.HttpBadRequest(error_msg))
+
+        with transaction.commit_on_success():
+            errors = record_results(objects, request.user)
+
+        data = {
+            "recorded": len(objects) - len(errors),
+            "errors": [
+                {"index": i, "error": msg}
+                for i, msg in sorted(errors.items())
+                ],
+            }
+        return self.create_response(
+            request, data, response_class=http.HttpAccepted)
+
+
 
 class RunSuiteResource(MTResource):
     """
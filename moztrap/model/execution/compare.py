@@ -0,0 +1,167 @@
+"""Build-over-build comparison of results in a run series."""
+
+from django.core.cache import cache
+from django.db.models import Count, Sum
+
+from .models import Run, LatestResult, Result
+
+
+
+# completed statuses, most severe first; the status of a case in an
+# environment is the most severe of all testers' latest results there
+SEVERITY = [
+    Result.STATUS.failed,
+    Result.STATUS.blocked,
+    Result.STATUS.invalidated,
+    Result.STATUS.passed,
+    ]
+
+# seconds the statuses of a finished run stay cached
+CACHE_TIMEOUT = 24 * 60 * 60
+
+
+
+def series_members(series):
+    """Return non-draft member runs of ``series``, in build order."""
+    return list(
+        Run.objects.filter(series=series).exclude(
+            status=Run.STATUS.draft).order_by("start", "id"))
+
+
+
+def run_statuses(runs):
+    """
+    Return dict mapping each run ID to its {(case id, env id): status}.
+
+    Statuses of all ``runs`` not found in the cache are read in one grouped
+    query. Statuses of finished (disabled) runs are cached, keyed by the run's
+    version and a watermark of its latest results (read for all finished runs
+    in one aggregate query), so results recorded, edited or deleted after a
+    run is finished aren't served stale.
+
+    """
+    finished = [run for run in runs if run.status == Run.STATUS.disabled]
+    watermarks = _watermarks(finished)
+    keys = dict(
+        (run.id, _cache_key(run, watermarks.get(run.id))) for run in finished)
+    cached = cache.get_many(keys.values())
+    statuses = dict(
+        (run_id, cached[key]) for run_id, key in keys.items() if key in cached)
+
+    missing = [run.id for run in runs if run.id not in statuses]
+    if not missing:
+        return statuses
+
+    fresh = dict((run_id, {}) for run_id in missing)
+    for run_id, case_id, env_id, status in LatestResult.objects.filter(
+            runcaseversion__run__in=missing,
+            runcaseversion__deleted_on__isnull=True,
+            status__in=SEVERITY,
+            ).values_list(
+                "runcaseversion__run",
+                "runcaseversion__caseversion__case",
+                "environment",
+                "status",
+                ).distinct():
+        current = fresh[run_id].get((case_id, env_id))
+        if current is None or SEVERITY.index(status) < SEVERITY.index(current):
+            fresh[run_id][(case_id, env_id)] = status
+
+    cache.set_many(
+        dict((keys[run_id], fresh[run_id]) for run_id in missing
+             if run_id in keys),
+        CACHE_TIMEOUT,
+        )
+    statuses.update(fresh)
+    return statuses
+
+
+
+def compare_runs(runs):
+    """
+    Compare statuses of ``runs``, in the given order, build over build.
+
+    Returns a list with a dictionary for each consecutive pair of runs::
+
+        {
+            "from": <Run>,
+            "to": <Run>,
+            "regressed": [(case id, env id, old status, new status), ...],
+            "new_failures": [...],
+            "fixed": [...],
+        }
+
+    A case/environment regressed if it passed in the earlier run and failed
+    or was blocked in the later one; it's a new failure if it failed or was
+    blocked in the later run with no completed result in the earlier one; it
+    was fixed if it failed or was blocked in the earlier run and passed in
+    the later one. Each list is sorted by case and environment ID.
+
+    """
+    statuses = run_statuses(runs)
+    comparisons = []
+    for old_run, new_run in zip(runs, runs[1:]):
+        old, new = statuses[old_run.id], statuses[new_run.id]
+        comparison = {
+            "from": old_run,
+            "to": new_run,
+            "regressed": [],
+            "new_failures": [],
+            "fixed": [],
+            }
+        for key in sorted(set(old) | set(new)):
+            before, after = old.get(key), new.get(key)
+            if after in Result.FAILED_STATES:
+                if before is None:
+                    kind = "new_failures"
+                elif before == Result.STATUS.passed:
+                    kind = "regressed"
+                else:
+                    continue
+            elif (after == Result.STATUS.passed and
+                  before in Result.FAILED_STATES):
+                kind = "fixed"
+            else:
+                continue
+            comparison[kind].append(key + (before, after))
+        comparisons.append(comparison)
+    return comparisons
+
+
+
+def _watermarks(runs):
+    """
+    Return dict mapping each of ``runs`` IDs to a watermark of its results.
+
+    The watermark is the number of latest-result pointers of the run's live
+    runcaseversions, the sum of the result IDs they point to (which changes
+    whenever a pointer moves) and the sum of those results' versions (which
+    changes whenever one of them is edited).
+
+    """
+    if not runs:
+        return {}
+    return dict(
+        (
+            row["runcaseversion__run"],
+            (row["count"], row["ids"], row["versions"]),
+            )
+        for row in LatestResult.objects.filter(
+            runcaseversion__run__in=[run.id for run in runs],
+            runcaseversion__deleted_on__isnull=True,
+            ).values("runcaseversion__run").annotate(
+                count=Count("id"),
+                ids=Sum("result"),
+                versions=Sum("result__cc_version"),
+                ).order_by()
+        )
+
+
+
+def _cache_key(run, watermark):
+    """Return cache key for statuses of ``run``, as of ``watermark``."""
+    return "moztrap-run-statuses-{0}-{1}-{2}".format(
+        run.id,
+        run.cc_version,
+        "-".join(str(part) for part in watermark or (0,)),
+        )
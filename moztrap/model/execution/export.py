@@ -0,0 +1,153 @@
+"""Streaming export of run results."""
+
+import csv
+import json
+from cStringIO import StringIO
+
+from ..environments.models import Environment
+from .models import Result, StepResult
+
+
+
+# number of results read by each query of an export
+EXPORT_CHUNK_SIZE = 1000
+
+# fields of each exported result, in CSV column order
+FIELDS = [
+    "result_id",
+    "case_id",
+    "case_name",
+    "environment",
+    "tester",
+    "status",
+    "is_latest",
+    "comment",
+    "bug_urls",
+    "created_on",
+    "modified_on",
+    ]
+
+
+
+def result_rows(run, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Generate a dictionary of ``FIELDS`` for each result of ``run``, by ID.
+
+    Results are read ``chunk_size`` at a time, each chunk by a keyset query
+    on result ID, so memory use doesn't grow with the number of results.
+    Environment labels and bug URLs are read per chunk.
+
+    """
+    labels = {}
+    last = 0
+    while True:
+        chunk = list(
+            Result.objects.filter(
+                runcaseversion__run=run, id__gt=last).order_by(
+                    "id").values_list(
+                        "id",
+                        "runcaseversion__caseversion__case",
+                        "runcaseversion__caseversion__name",
+                        "environment",
+                        "tester__username",
+                        "status",
+                        "is_latest",
+                        "comment",
+                        "created_on",
+                        "modified_on",
+                        )[:chunk_size]
+            )
+        if not chunk:
+            return
+        last = chunk[-1][0]
+
+        new_envs = set(r[3] for r in chunk).difference(labels)
+        if new_envs:
+            labels.update(environment_labels(new_envs))
+        bugs = {}
+        for result_id, bug_url in StepResult.objects.filter(
+                result__in=[r[0] for r in chunk]).exclude(
+                    bug_url="").order_by("id").values_list(
+                        "result", "bug_url"):
+            bugs.setdefault(result_id, []).append(bug_url)
+
+        for (result_id, case_id, name, env_id, tester, status, is_latest,
+             comment, created_on, modified_on) in chunk:
+            yield {
+                "result_id": result_id,
+                "case_id": case_id,
+                "case_name": name,
+                "environment": labels.get(env_id, u""),
+                "tester": tester,
+                "status": status,
+                "is_latest": is_latest,
+                "comment": comment,
+                "bug_urls": bugs.get(result_id, []),
+                "created_on": created_on,
+                "modified_on": modified_on,
+                }
+
+        if len(chunk) < chunk_size:
+            return
+
+
+
+def environment_labels(environment_ids):
+    """
+    Return dict mapping given environment IDs to their labels.
+
+    Labels are as ``Environment.__unicode__`` gives them, but all read in
+    one query.
+
+    """
+    names = dict((env_id, []) for env_id in environment_ids)
+    for env_id, name in Environment.elements.through.objects.filter(
+            environment__in=environment_ids,
+            element__deleted_on__isnull=True,
+            ).order_by("element__category__name").values_list(
+                "environment", "element__name"):
+        names[env_id].append(name)
+    return dict(
+        (env_id, u", ".join(env_names)) for env_id, env_names in names.items())
+
+
+
+def export_csv(run, chunk_size=EXPORT_CHUNK_SIZE):
+    """Generate UTF-8 CSV of results of ``run``, a chunk of lines at a time."""
+    out = StringIO()
+    writer = csv.writer(out)
+    writer.writerow(FIELDS)
+    for i, row in enumerate(result_rows(run, chunk_size), 1):
+        writer.writerow([_csv_value(row[field]) for field in FIELDS])
+        if not i % chunk_size:
+            yield out.getvalue()
+            out = StringIO()
+            writer = csv.writer(out)
+    yield out.getvalue()
+
+
+
+def export_json(run, chunk_size=EXPORT_CHUNK_SIZE):
+    """Generate JSON list of results of ``run``, a chunk of objects at a time."""
+    parts = ["["]
+    for i, row in enumerate(result_rows(run, chunk_size)):
+        row["created_on"] = row["created_on"].isoformat()
+        row["modified_on"] = row["modified_on"].isoformat()
+        parts.append((",\n" if i else "\n") + json.dumps(row))
+        if not (i + 1) % chunk_size:
+            yield "".join(parts)
+            parts = []
+    parts.append("\n]\n")
+    yield "".join(parts)
+
+
+
+def _csv_value(value):
+    """Return ``value`` as a UTF-8 string for a CSV field."""
+    if isinstance(value, list):
+        value = u" ".join(value)
+    elif hasattr(value, "isoformat"):
+        value = value.isoformat()
+    elif isinstance(value, bool):
+        value = int(value)
+    return unicode(value).encode("utf-8")
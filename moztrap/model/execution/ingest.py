@@ -0,0 +1,461 @@
+"""Batched recording of results."""
+import uuid
+
+from django.db import connection, transaction, IntegrityError
+
+from ..environments.models import Environment
+from ..mtmodel import utcnow
+from .models import (
+    RunCaseVersion, Result, LatestResult, StepResult, ResultSummary, BugURL,
+    step_map, combo_completion, update_combo_completion)
+
+
+
+RECORDABLE_STATES = [
+    Result.STATUS.passed,
+    Result.STATUS.failed,
+    Result.STATUS.invalidated,
+    Result.STATUS.blocked,
+    Result.STATUS.skipped,
+    ]
+
+# maps runtests action names to the status of the result they record
+ACTION_STATES = {
+    "start": Result.STATUS.started,
+    "result_pass": Result.STATUS.passed,
+    "result_invalid": Result.STATUS.invalidated,
+    "result_skip": Result.STATUS.skipped,
+    "result_block": Result.STATUS.blocked,
+    "result_fail": Result.STATUS.failed,
+    }
+
+# maximum number of pointers moved by a single UPDATE statement
+REPOINT_CHUNK_SIZE = 500
+
+
+
+def record_results(items, user):
+    """
+    Record results for ``items`` in a fixed number of queries.
+
+    Each item is a dictionary like those submitted to ``ResultResource``::
+
+        {
+            "run_id": "1",
+            "case": "326",
+            "environment": "23",
+            "status": "failed",
+            "comment": "why u no pass?",
+            "stepnumber": 1,
+            "bug": "http://www.deathvalleydogs.com"
+        }
+
+    ``comment`` is only used for failed, invalidated and blocked results, and
+    ``stepnumber`` and ``bug`` only for failed results. As with
+    ``RunCaseVersion.result_skip``, a skipped result is recorded for all
+    environments of the runcaseversion.
+
+    Items that can't be recorded are skipped without affecting the others.
+    Returns a dictionary mapping the index of each skipped item to an error
+    message.
+
+    Must be called within a managed transaction.
+
+    """
+    errors = {}
+    parsed = []
+    for i, item in enumerate(items):
+        try:
+            run_id = int(item["run_id"])
+            case_id = int(item["case"])
+            env_id = int(item["environment"])
+            status = item["status"]
+        except KeyError as e:
+            errors[i] = "bad result object data missing key: {0}".format(e)
+            continue
+        except (TypeError, ValueError) as e:
+            errors[i] = "bad result object data: {0}".format(e)
+            continue
+        if status not in RECORDABLE_STATES:
+            errors[i] = "bad result status: {0}".format(status)
+            continue
+        parsed.append((i, run_id, case_id, env_id, status, item))
+
+    if not parsed:
+        return errors
+
+    env_ids = set(
+        Environment.objects.filter(
+            pk__in=set(p[3] for p in parsed)).values_list("id", flat=True))
+
+    rcvs = {}
+    for rcv_id, run_id, case_id, cv_id in RunCaseVersion.objects.filter(
+            run__in=set(p[1] for p in parsed),
+            caseversion__case__in=set(p[2] for p in parsed),
+            ).values_list(
+                "id", "run", "caseversion__case", "caseversion").order_by("id"):
+        rcvs.setdefault((run_id, case_id), (rcv_id, cv_id))
+
+    rcv_envs = {}
+    for rcv_id, env_id in RunCaseVersion.environments.through.objects.filter(
+            runcaseversion__in=[r[0] for r in rcvs.values()],
+            environment__deleted_on__isnull=True,
+            ).values_list(
+                "runcaseversion", "environment").order_by("environment"):
+        rcv_envs.setdefault(rcv_id, []).append(env_id)
+
+    # (item index, run id, rcv id, caseversion id, env id, status, item)
+    records = []
+    for i, run_id, case_id, env_id, status, item in parsed:
+        if env_id not in env_ids:
+            errors[i] = "Specified environment does not exist: {0}".format(
+                env_id)
+            continue
+        rcv_id, cv_id = rcvs.get((run_id, case_id), (None, None))
+        if env_id not in rcv_envs.get(rcv_id, []):
+            errors[i] = (
+                "RunCaseVersion not found for run: {0}, case: {1}, "
+                "environment: {2}".format(run_id, case_id, env_id)
+                )
+            continue
+        if status == Result.STATUS.skipped:
+            envs = rcv_envs[rcv_id]
+        else:
+            envs = [env_id]
+        for env in envs:
+            records.append((i, run_id, rcv_id, cv_id, env, status, item))
+
+    if not records:
+        return errors
+
+    results = _create_results(
+        [
+            (run_id, rcv_id, env_id, status, _comment(status, item))
+            for i, run_id, rcv_id, cv_id, env_id, status, item in records
+            ],
+        user,
+        )
+    _create_stepresults(
+        results, [(r[1], r[3], r[6]) for r in records], user)
+
+    return errors
+
+
+
+def record_actions(run, environment, actions, user):
+    """
+    Apply runtests ``actions`` in a fixed number of queries.
+
+    Each action is a dictionary naming a runcaseversion of ``run`` and one of
+    the actions in ``ACTION_STATES``, with any parameters of that action::
+
+        {
+            "runcaseversion": 12,
+            "action": "result_fail",
+            "comment": "why u no pass?",
+            "stepnumber": 1,
+            "bug": "http://www.deathvalleydogs.com"
+        }
+
+    Actions are applied in ``environment``, in order, as the
+    ``RunCaseVersion`` methods of the same name would: skipping a case skips
+    it in all its environments, and starting a case this tester skipped
+    restarts it in all its environments.
+
+    Returns a tuple of (set of IDs of affected runcaseversions, dictionary
+    mapping the index of each action that couldn't be applied to an error
+    message).
+
+    Must be called within a managed transaction.
+
+    """
+    errors = {}
+    parsed = []
+    for i, item in enumerate(actions):
+        try:
+            rcv_id = int(item["runcaseversion"])
+            action = item["action"]
+        except KeyError as e:
+            errors[i] = "bad action data missing key: {0}".format(e)
+            continue
+        except (TypeError, ValueError) as e:
+            errors[i] = "bad action data: {0}".format(e)
+            continue
+        if action not in ACTION_STATES:
+            errors[i] = "{0} is not a valid action.".format(action)
+            continue
+        parsed.append((i, rcv_id, ACTION_STATES[action], item))
+
+    if not parsed:
+        return set(), errors
+
+    rcv_envs = {}
+    cvs = {}
+    through = RunCaseVersion.environments.through
+    for rcv_id, cv_id, env_id in through.objects.filter(
+            runcaseversion__run=run,
+            runcaseversion__in=set(p[1] for p in parsed),
+            environment__deleted_on__isnull=True,
+            ).values_list(
+                "runcaseversion",
+                "runcaseversion__caseversion",
+                "environment",
+                ).order_by("environment"):
+        rcv_envs.setdefault(rcv_id, []).append(env_id)
+        cvs[rcv_id] = cv_id
+
+    # cases this tester has skipped here, so starting them restarts all envs
+    skipped = set(
+        LatestResult.objects.filter(
+            tester=user,
+            environment=environment,
+            runcaseversion__in=rcv_envs.keys(),
+            status=Result.STATUS.skipped,
+            ).values_list("runcaseversion", flat=True))
+
+    # (run id, caseversion id, item), parallel to records for _create_results
+    records = []
+    items = []
+    for i, rcv_id, status, item in parsed:
+        if environment.id not in rcv_envs.get(rcv_id, []):
+            errors[i] = "{0} is not a valid run/caseversion ID.".format(
+                rcv_id)
+            continue
+        if status == Result.STATUS.skipped or (
+                status == Result.STATUS.started and rcv_id in skipped):
+            envs = rcv_envs[rcv_id]
+        else:
+            envs = [environment.id]
+        if status == Result.STATUS.skipped:
+            skipped.add(rcv_id)
+        else:
+            skipped.discard(rcv_id)
+        for env_id in envs:
+            records.append(
+                (run.id, rcv_id, env_id, status, _comment(status, item)))
+            items.append((run.id, cvs[rcv_id], item))
+
+    if not records:
+        return set(), errors
+
+    results = _create_results(records, user)
+    _create_stepresults(results, items, user)
+
+    return set(r[1] for r in records), errors
+
+
+
+def create_results(runcaseversion, environments, status, user, comment=""):
+    """
+    Record a ``status`` result for ``runcaseversion`` in each environment.
+
+    ``environments`` is an iterable of environments or their IDs. Results are
+    recorded in a fixed number of queries, whatever the number of
+    environments. Returns the new results.
+
+    Must be called within a managed transaction.
+
+    """
+    env_ids = [getattr(env, "id", env) for env in environments]
+    if not env_ids:
+        return []
+    return _create_results(
+        [
+            (runcaseversion.run_id, runcaseversion.id, env_id, status, comment)
+            for env_id in env_ids
+            ],
+        user,
+        )
+
+
+
+def _comment(status, item):
+    """Return comment of ``item``, if results of ``status`` have comments."""
+    if status in [
+            Result.STATUS.failed,
+            Result.STATUS.invalidated,
+            Result.STATUS.blocked,
+            ]:
+        return item.get("comment", "")
+    return ""
+
+
+
+def _create_results(records, user):
+    """
+    Bulk-create results for ``records``; return them in order, with IDs.
+
+    Each record is a tuple of (run id, runcaseversion id, environment id,
+    status, comment). The last result for each runcaseversion and
+    environment becomes the latest, superseding any previous; result
+    summaries and stored completion are updated to match.
+
+    """
+    # the last record for each runcaseversion and environment is the latest
+    latest = {}
+    for position, record in enumerate(records):
+        latest[(record[1], record[2])] = position
+    before = combo_completion(latest.keys())
+
+    now = utcnow()
+    batch = uuid.uuid4().hex
+    results = [
+        Result(
+            runcaseversion_id=rcv_id,
+            environment_id=env_id,
+            tester=user,
+            status=status,
+            comment=comment,
+            is_latest=(latest[(rcv_id, env_id)] == position),
+            created_on=now,
+            ingest_batch=batch,
+            )
+        for position, (run_id, rcv_id, env_id, status, comment) in enumerate(
+            records)
+        ]
+    Result.objects.bulk_create(results, user=user)
+    # bulk_create doesn't set primary keys; read them back in insert order,
+    # by the batch token only these rows have, then clear it
+    rcv_ids = set(r.runcaseversion_id for r in results)
+    ids = list(
+        Result.everything.filter(
+            runcaseversion__in=rcv_ids, ingest_batch=batch,
+            ).order_by("id").values_list("id", flat=True))
+    Result._base_manager.filter(pk__in=ids).update(ingest_batch=None)
+    for result, pk in zip(results, ids):
+        result.id = pk
+        result.ingest_batch = None
+
+    previous = _point_to([results[position] for position in latest.values()])
+
+    deltas = {}
+    for (rcv_id, env_id), position in latest.items():
+        run_id = records[position][0]
+        key = (run_id, env_id, results[position].status)
+        deltas[key] = deltas.get(key, 0) + 1
+        pointer = previous.get((rcv_id, env_id))
+        if pointer is not None:
+            key = (run_id, env_id, pointer.status)
+            deltas[key] = deltas.get(key, 0) - 1
+    ResultSummary.adjust_many(deltas)
+    if previous:
+        Result.objects.filter(
+            pk__in=[p.result_id for p in previous.values()]).update(
+            is_latest=False)
+
+    update_combo_completion(latest.keys(), before)
+
+    return results
+
+
+
+def _create_stepresults(results, items, user):
+    """
+    Bulk-create failed step results for failed ``results`` naming a step.
+
+    ``items`` are parallel to ``results``: tuples of (run id, caseversion id,
+    item), where item is a dictionary that may have ``stepnumber`` and
+    ``bug``. Bug URLs are recorded in the run's bug URL index.
+
+    """
+    steps = step_map(
+        set(
+            cv_id for result, (run_id, cv_id, item) in zip(results, items)
+            if result.status == Result.STATUS.failed and
+            item.get("stepnumber") is not None
+            )
+        )
+    stepresults = []
+    bugs = []
+    for result, (run_id, cv_id, item) in zip(results, items):
+        if (result.status != Result.STATUS.failed or
+                item.get("stepnumber") is None):
+            continue
+        try:
+            step = steps[cv_id].get(int(item["stepnumber"]))
+        except (TypeError, ValueError):
+            step = None
+        if step is None:
+            continue
+        stepresults.append(
+            StepResult(
+                result_id=result.id,
+                step=step,
+                status=StepResult.STATUS.failed,
+                bug_url=item.get("bug", ""),
+                created_on=result.created_on,
+                )
+            )
+        bugs.append((run_id, cv_id, item.get("bug", "")))
+    StepResult.objects.bulk_create(stepresults, user=user)
+    BugURL.record(bugs)
+
+
+
+def _point_to(results):
+    """
+    Make each of ``results`` the latest for its runcaseversion/env/tester.
+
+    ``results`` are saved, and have distinct runcaseversion/env/tester keys.
+    Returns dictionary mapping (runcaseversion id, environment id) to the
+    previous ``LatestResult`` pointer for that key, for keys that had one.
+    Pointer rows are locked until the end of the transaction (along with
+    other pointers of the tester for the same runcaseversions and envs).
+
+    """
+    tester = results[0].tester
+    keys = set((r.runcaseversion_id, r.environment_id) for r in results)
+    while True:
+        # the query matches every runcaseversion/env combination of the
+        # batch; keep only the pointers for keys actually in it
+        previous = dict(
+            ((lr.runcaseversion_id, lr.environment_id), lr)
+            for lr in LatestResult.objects.select_for_update().filter(
+                tester=tester,
+                runcaseversion__in=set(rcv_id for rcv_id, env_id in keys),
+                environment__in=set(env_id for rcv_id, env_id in keys),
+                )
+            if (lr.runcaseversion_id, lr.environment_id) in keys
+            )
+        new = [
+            LatestResult(
+                runcaseversion_id=r.runcaseversion_id,
+                environment_id=r.environment_id,
+                tester=tester,
+                result_id=r.id,
+                status=r.status,
+                )
+            for r in results
+            if (r.runcaseversion_id, r.environment_id) not in previous
+            ]
+        # other testers' results may have inserted some pointers meanwhile
+        sid = transaction.savepoint()
+        try:
+            LatestResult.objects.bulk_create(new)
+        except IntegrityError:
+            transaction.savepoint_rollback(sid)
+            continue
+        transaction.savepoint_commit(sid)
+        break
+
+    moves = [
+        (previous[(r.runcaseversion_id, r.environment_id)].id, r)
+        for r in results
+        if (r.runcaseversion_id, r.environment_id) in previous
+        ]
+    cursor = connection.cursor()
+    for start in range(0, len(moves), REPOINT_CHUNK_SIZE):
+        chunk = moves[start:start + REPOINT_CHUNK_SIZE]
+        cases = " ".join(["WHEN %s THEN %s"] * len(chunk))
+        cursor.execute(
+            """UPDATE execution_latestresult
+            SET result_id = CASE id {cases} END,
+                status = CASE id {cases} END
+            WHERE id IN ({ids})
+            """.format(cases=cases, ids=", ".join(["%s"] * len(chunk))),
+            [v for pk, r in chunk for v in (pk, r.id)] +
+            [v for pk, r in chunk for v in (pk, r.status)] +
+            [pk for pk, r in chunk]
+            )
+
+    return previous
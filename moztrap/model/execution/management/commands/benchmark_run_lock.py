@@ -0,0 +1,109 @@
+"""
+Management command to benchmark activating and refreshing large runs.
+
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models
+
+from moztrap.model.core.models import Product, ProductVersion
+from moztrap.model.environments.models import Environment
+from moztrap.model.execution.models import Run, RunSuite
+from moztrap.model.library.models import Case, CaseVersion, Suite, SuiteCase
+
+
+
+class Command(BaseCommand):
+    args = "[<number_of_cases> ...]"
+    help = (
+        "Create runs with the given numbers of cases (default 100, 1000 and "
+        "10000), and report query count and wall time for activating them "
+        "and for refreshing them after their cases are reordered. The "
+        "benchmark data is deleted afterwards.")
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(a) for a in args] or [100, 1000, 10000]
+        except ValueError:
+            raise CommandError("Usage: {0}".format(self.args))
+
+        self.stdout.write(
+            "{0:>8} {1:>10} {2:>8} {3:>10} {4:>8}\n".format(
+                "cases", "activate", "queries", "refresh", "queries"))
+        for size in sizes:
+            product = Product.objects.create(name="Benchmark {0}".format(size))
+            env = Environment.objects.create()
+            try:
+                run = self.create_run(product, env, size)
+
+                # lock directly; activate and refresh may only queue the lock
+                # for the background worker
+                activate = self.measure(run._lock_case_versions)
+                # reverse the suite's case order, so all rcvs are reordered
+                SuiteCase.objects.filter(suite__product=product).update(
+                    order=models.F("order") * -1)
+                refresh = self.measure(run._lock_case_versions)
+            finally:
+                product.delete(permanent=True)
+                env.delete(permanent=True)
+
+            self.stdout.write(
+                "{0:>8} {1:>9.2f}s {2:>8} {3:>9.2f}s {4:>8}\n".format(
+                    size, activate[0], activate[1], refresh[0], refresh[1]))
+
+
+    def create_run(self, product, env, size):
+        """Return a draft run of one suite with ``size`` active cases."""
+        pv = ProductVersion.objects.create(product=product, version="1")
+        Case.objects.bulk_create([Case(product=product) for i in range(size)])
+        case_ids = list(
+            Case.objects.filter(product=product).order_by("id").values_list(
+                "id", flat=True))
+
+        CaseVersion.objects.bulk_create(
+            [
+                CaseVersion(
+                    productversion=pv,
+                    case_id=case_id,
+                    name="Case {0}".format(i),
+                    status=CaseVersion.STATUS.active,
+                    latest=True,
+                    )
+                for i, case_id in enumerate(case_ids)
+                ]
+            )
+        CaseVersion.environments.through.objects.bulk_create(
+            [
+                CaseVersion.environments.through(
+                    caseversion_id=cv_id, environment=env)
+                for cv_id in CaseVersion.objects.filter(
+                    productversion=pv).values_list("id", flat=True)
+                ]
+            )
+
+        suite = Suite.objects.create(
+            product=product, name="Benchmark", status=Suite.STATUS.active)
+        SuiteCase.objects.bulk_create(
+            [
+                SuiteCase(suite=suite, case_id=case_id, order=i)
+                for i, case_id in enumerate(case_ids)
+                ]
+            )
+
+        run = Run.objects.create(productversion=pv, name="Benchmark")
+        run.environments.add(env)
+        RunSuite.objects.create(run=run, suite=suite)
+        return run
+
+
+    def measure(self, func):
+        """Call ``func``, return tuple of (wall time, number of queries)."""
+        connection.use_debug_cursor = True
+        connection.queries = []
+        try:
+            start = time.time()
+            func()
+            return (time.time() - start, len(connection.queries))
+        finally:
+            connection.use_debug_cursor = None
@@ -0,0 +1,54 @@
+"""
+Management command to update flakiness scores of cases run in series.
+
+"""
+import datetime
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from moztrap.model.execution.models import (
+    CaseFlakiness, ROLLUP_LAG, FLAKY_BUILDS)
+
+
+
+class Command(BaseCommand):
+    help = (
+        "Update the flakiness score, per environment, of cases with results "
+        "recorded in series runs since the last update. Run it regularly "
+        "(e.g. hourly from cron); each run only processes new results.")
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            "--lag",
+            action="store",
+            type="int",
+            dest="lag",
+            default=ROLLUP_LAG.seconds // 60,
+            help=(
+                "Leave results created in the last LAG minutes for the next "
+                "update (default %default).")),
+        make_option(
+            "--builds",
+            action="store",
+            type="int",
+            dest="builds",
+            default=FLAKY_BUILDS,
+            help=(
+                "Measure flakiness over the last BUILDS runs of each series "
+                "(default %default).")),
+        )
+
+    @transaction.commit_on_success
+    def handle(self, *args, **options):
+        verbosity = int(options.get("verbosity", 1))
+
+        stored = CaseFlakiness.analyze(
+            lag=datetime.timedelta(minutes=options["lag"]),
+            builds=options["builds"],
+            )
+
+        if verbosity:
+            self.stdout.write(
+                "Updated {0} flakiness score(s).\n".format(stored))
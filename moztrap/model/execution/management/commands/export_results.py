@@ -0,0 +1,61 @@
+"""
+Management command to export all results of a run.
+
+"""
+from optparse import make_option
+
+from django.core.management.base import BaseCommand, CommandError
+
+from moztrap.model.execution.models import Run
+from moztrap.model.execution.export import export_csv, export_json
+
+
+
+class Command(BaseCommand):
+    args = "<run_id>"
+    help = (
+        "Write all results of the given run to stdout (or a file) as CSV or "
+        "JSON, a chunk of results at a time.")
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            "--format",
+            action="store",
+            dest="format",
+            default="csv",
+            help="csv (default) or json."),
+        make_option(
+            "--output",
+            action="store",
+            dest="output",
+            default=None,
+            help="File to write to, rather than stdout."),
+        )
+
+    def handle(self, *args, **options):
+        try:
+            [run_id] = [int(a) for a in args]
+        except ValueError:
+            raise CommandError("Usage: {0}".format(self.args))
+        try:
+            run = Run.objects.get(pk=run_id)
+        except Run.DoesNotExist:
+            raise CommandError("Run {0} does not exist.".format(run_id))
+
+        exports = {"csv": export_csv, "json": export_json}
+        try:
+            generate = exports[options["format"]]
+        except KeyError:
+            raise CommandError(
+                "Unknown format: {0}".format(options["format"]))
+
+        if options["output"]:
+            out = open(options["output"], "wb")
+        else:
+            out = self.stdout
+        try:
+            for chunk in generate(run):
+                out.write(chunk)
+        finally:
+            if options["output"]:
+                out.close()
@@ -0,0 +1,29 @@
+"""
+Management command to rebuild the denormalized run bug URL index.
+
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from moztrap.model.execution.models import Run, BugURL
+
+
+
+class Command(BaseCommand):
+    args = "[<run_id> ...]"
+    help = (
+        "Rebuild the bug URL index from the bug URLs of step results, for the "
+        "given runs or (if none are given) for all runs.")
+
+    @transaction.commit_on_success
+    def handle(self, *args, **options):
+        verbosity = int(options.get("verbosity", 1))
+
+        runs = None
+        if args:
+            runs = Run.everything.filter(pk__in=[int(a) for a in args])
+
+        BugURL.rebuild(runs=runs)
+
+        if verbosity:
+            self.stdout.write("Bug URL index rebuilt.\n")
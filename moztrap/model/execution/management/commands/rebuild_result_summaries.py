@@ -0,0 +1,39 @@
+"""
+Management command to rebuild the denormalized run result summaries.
+
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from moztrap.model.execution.models import (
+    Run, RunCaseVersion, ResultSummary, update_completion)
+
+
+
+class Command(BaseCommand):
+    args = "[<run_id> ...]"
+    help = (
+        "Rebuild result summary counts and stored completion from the results "
+        "table, for the given runs or (if none are given) for all runs.")
+
+    @transaction.commit_on_success
+    def handle(self, *args, **options):
+        verbosity = int(options.get("verbosity", 1))
+
+        runs = None
+        if args:
+            runs = Run.everything.filter(pk__in=[int(a) for a in args])
+
+        ResultSummary.rebuild(runs=runs)
+
+        if runs is None:
+            runs = Run.everything.all()
+        for run_id in runs.values_list("id", flat=True):
+            update_completion(
+                runs=[run_id],
+                runcaseversions=RunCaseVersion.everything.filter(
+                    run=run_id).values_list("id", flat=True),
+                )
+
+        if verbosity:
+            self.stdout.write("Result summaries rebuilt.\n")
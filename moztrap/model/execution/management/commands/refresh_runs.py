@@ -0,0 +1,44 @@
+"""
+Management command to apply recorded suite and case changes to active runs.
+
+"""
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from moztrap.model.execution.models import Run, LockChange
+
+
+
+class Command(BaseCommand):
+    help = (
+        "Apply suite and case changes recorded since each active run was last "
+        "locked to its runcaseversions, then prune changes all runs have "
+        "applied. With --full, reconcile every active run with its suites "
+        "from scratch (e.g. nightly), catching changes that weren't recorded.")
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            "--full",
+            action="store_true",
+            dest="full",
+            default=False,
+            help="Fully re-lock every active run."),
+        )
+
+    def handle(self, *args, **options):
+        verbosity = int(options.get("verbosity", 1))
+
+        runs = Run.objects.filter(
+            status=Run.STATUS.active, is_series=False).order_by("id")
+        count = 0
+        for run in runs:
+            run._lock_case_versions(full=options["full"])
+            count += 1
+
+        LockChange.prune()
+
+        if verbosity:
+            self.stdout.write(
+                "{0} {1} run(s).\n".format(
+                    "Reconciled" if options["full"] else "Refreshed", count))
@@ -0,0 +1,39 @@
+"""
+Management command to roll up newly recorded results into daily counts.
+
+"""
+import datetime
+from optparse import make_option
+
+from django.core.management.base import BaseCommand
+
+from moztrap.model.execution.models import ResultRollup, ROLLUP_LAG
+
+
+
+class Command(BaseCommand):
+    help = (
+        "Add daily counts of results created since the last roll-up to the "
+        "result rollup table read by trend charts. Run it regularly (e.g. "
+        "every few minutes from cron); each run only processes new results.")
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            "--lag",
+            action="store",
+            type="int",
+            dest="lag",
+            default=ROLLUP_LAG.seconds // 60,
+            help=(
+                "Leave results created in the last LAG minutes for the next "
+                "roll-up (default %default).")),
+        )
+
+    def handle(self, *args, **options):
+        verbosity = int(options.get("verbosity", 1))
+
+        added = ResultRollup.roll_up(
+            lag=datetime.timedelta(minutes=options["lag"]))
+
+        if verbosity:
+            self.stdout.write("Added {0} daily count(s).\n".format(added))
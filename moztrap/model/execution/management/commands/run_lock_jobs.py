@@ -0,0 +1,49 @@
+"""
+Management command to run queued activations and refreshes of runs.
+
+"""
+from optparse import make_option
+import time
+
+from django.core.management.base import BaseCommand
+
+from moztrap.model.execution.models import RunLockJob
+
+
+
+class Command(BaseCommand):
+    help = (
+        "Worker that locks in the runcaseversions of runs queued for "
+        "activation or refresh (with BACKGROUND_RUN_LOCK enabled), polling "
+        "for new jobs until interrupted.")
+
+    option_list = BaseCommand.option_list + (
+        make_option(
+            "--once",
+            action="store_true",
+            dest="once",
+            default=False,
+            help="Exit once no jobs are queued, rather than polling."),
+        make_option(
+            "--interval",
+            dest="interval",
+            type="float",
+            default=2.0,
+            help="Seconds to wait between polls for new jobs (default 2)."),
+        )
+
+    def handle(self, *args, **options):
+        verbosity = int(options.get("verbosity", 1))
+
+        while True:
+            job = RunLockJob.claim()
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+                continue
+
+            job.execute()
+            if verbosity:
+                self.stdout.write(
+                    "Lock of run {0}: {1}.\n".format(job.run_id, job.status))
@@ -3,18 +3,40 @@ Models for test execution (runs, results).
 
 """
 import datetime
+import traceback
 
-from django.core.exceptions import ValidationError, ObjectDoesNotExist
-from django.db import connection, transaction, models
-from django.db.models import Q, Count, Max
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import (
+    connection, load_backend, transaction, models, IntegrityError,
+    DatabaseError)
+from django.db.models import Count, Max, Min, Q, Sum
 
 from model_utils import Choices
 
-from ..mtmodel import MTModel, TeamModel, DraftStatusModel
+from ..mtmodel import MTModel, TeamModel, DraftStatusModel, utcnow
 from ..core.auth import User
 from ..core.models import ProductVersion
 from ..environments.models import Environment, HasEnvironmentsModel
-from ..library.models import CaseVersion, Suite, CaseStep
+from ..library.models import Case, CaseVersion, Suite, CaseStep
+
+
+
+# maximum number of runcaseversions reordered by a single UPDATE statement
+REORDER_CHUNK_SIZE = 500
+
+# approximate number of runcaseversion environment rows compared at once
+ENV_SYNC_CHUNK_SIZE = 5000
+
+# results newer than this are left for the next roll-up, so that results
+# committed late by concurrent transactions aren't skipped by the watermark
+ROLLUP_LAG = datetime.timedelta(minutes=5)
+
+# number of most recent builds of a series in which flakiness is measured
+FLAKY_BUILDS = 10
+
+# number of cases whose flakiness is computed at once
+FLAKY_CHUNK_SIZE = 500
 
 
 
@@ -28,12 +50,26 @@ class Run(MTModel, TeamModel, DraftStatusModel, HasEnvironmentsModel):
     build = models.TextField(null=True, blank=True)
     is_series = models.BooleanField(default=False)
     series = models.ForeignKey("self", null=True, blank=True)
+    # fraction of case/env combos completed; see ``update_completion``
+    completion_cache = models.FloatField(default=0, db_index=True)
+    # completed and countable (not skipped) combos it's the fraction of
+    completion_done = models.IntegerField(default=0)
+    completion_total = models.IntegerField(default=0)
+    # id of the last ``LockChange`` the runcaseversions are up to date with
+    last_lockchange = models.IntegerField(default=0)
 
     caseversions = models.ManyToManyField(
         CaseVersion, through="RunCaseVersion", related_name="runs")
     suites = models.ManyToManyField(
         Suite, through="RunSuite", related_name="runs")
 
+    denormalized_fields = [
+        "completion_cache",
+        "completion_done",
+        "completion_total",
+        "last_lockchange",
+        ]
+
 
     def __unicode__(self):
         """Return unicode representation."""
@@ -62,14 +98,15 @@ class Run(MTModel, TeamModel, DraftStatusModel, HasEnvironmentsModel):
         return {RunCaseVersion: RunCaseVersion.objects.filter(run__in=objs)}
 
 
-    def clone(self, *args, **kwargs):
+    def clone_defaults(self, cascade, overrides):
         """Clone this Run with default cascade behavior."""
-        kwargs.setdefault(
-            "cascade", ["runsuites", "environments", "team"])
-        overrides = kwargs.setdefault("overrides", {})
+        if cascade is None:
+            cascade = ["runsuites", "environments", "team"]
+        cascade, overrides = super(Run, self).clone_defaults(
+            cascade, overrides)
         overrides["status"] = self.STATUS.draft
         overrides.setdefault("name", "Cloned: {0}".format(self.name))
-        return super(Run, self).clone(*args, **kwargs)
+        return cascade, overrides
 
 
     def clone_for_series(self, *args, **kwargs):
@@ -92,42 +129,124 @@ class Run(MTModel, TeamModel, DraftStatusModel, HasEnvironmentsModel):
 
 
     def activate(self, *args, **kwargs):
-        """Make run active, locking in runcaseversions for all suites."""
-        if self.status == self.STATUS.draft:
-            self.update_case_versions()
+        """
+        Make run active, locking in runcaseversions for all suites.
+
+        With ``BACKGROUND_RUN_LOCK``, a draft run is only queued for locking
+        and stays in draft until the lock job completes and activates it.
+
+        """
+        if self.status == self.STATUS.draft and not self.is_series:
+            if settings.BACKGROUND_RUN_LOCK:
+                RunLockJob.enqueue(self, activate=True)
+                return
+            self._lock_case_versions()
         super(Run, self).activate(*args, **kwargs)
 
 
     def refresh(self, *args, **kwargs):
-        """Update all the runcaseversions while the run is active."""
+        """
+        Update the runcaseversions while the run is active.
+
+        Only the changes recorded (as ``LockChange``) since the last lock are
+        applied, unless ``full=True`` is given.
+
+        """
+        full = kwargs.pop("full", False)
         if self.status == self.STATUS.active:
-            self.update_case_versions()
+            self.update_case_versions(full=full)
+
+
+    def add_envs(self, *envs):
+        """Add environments, recording the change for the next refresh."""
+        super(Run, self).add_envs(*envs)
+        LockChange.record(runs=[self.id])
+
+
+    @classmethod
+    def _remove_envs(cls, objs, envs):
+        """Remove environments, recording the change for the next refresh."""
+        super(Run, cls)._remove_envs(objs, envs)
+        LockChange.record(runs=[run.id for run in objs])
 
 
-    def update_case_versions(self):
+    def update_case_versions(self, full=True):
         """
         Update the runcaseversions with any changes to suites.
 
-        This can happen while the run is still active.
+        This can happen while the run is still active. Unless ``full`` is
+        True, only recorded changes since the last lock are applied.
         """
         # we don't need all the runcaseversions for a series.  It is the
         # series member runs that will use them.  So only lock the caseversions
         # if this is NOT a series.
         if not self.is_series:
-            self._lock_case_versions()
+            if settings.BACKGROUND_RUN_LOCK:
+                RunLockJob.enqueue(self, full=full)
+            else:
+                self._lock_case_versions(full=full)
+
+
+    def pending_lock(self):
+        """Return the queued or running ``RunLockJob`` for this run, or None."""
+        try:
+            return self.lockjobs.filter(
+                status__in=[
+                    RunLockJob.STATUS.queued, RunLockJob.STATUS.running],
+                ).order_by("-id")[0]
+        except IndexError:
+            return None
 
 
     @transaction.commit_on_success
-    def _lock_case_versions(self):
+    def _lock_case_versions(self, progress=None, full=True):
         """
         Select caseversions from suites, create runcaseversions.
 
+        If given, ``progress`` is called with the name of each stage of the
+        lock and the percentage done as it starts.
+
+        Unless ``full`` is True, this is skipped if no ``LockChange`` recorded
+        since the last lock concerns this run, and environments and
+        completion are only updated for new runcaseversions and those of
+        changed cases.
+
         WARNING: Testing this code in the PyCharm debugger will give an
         incorrect number of queries, because for the debugger to show all the
         information it wants, it must do queries itself.  When testing with
         assertNumQueries, don't use the PyCharm debugger.
 
         """
+        if progress is None:
+            progress = lambda stage, percent: None
+
+        progress("selecting cases", 0)
+
+        # changes recorded from here on are applied by the next lock
+        last_lockchange = LockChange.objects.aggregate(
+            last=Max("id"))["last"] or 0
+        changed_cases = None
+        if not full:
+            changes = self._lock_changes(last_lockchange)
+            if changes is None:
+                self._set_last_lockchange(last_lockchange)
+                return
+            full, changed_cases = changes
+        else:
+            # a new member of a series usually locks in just what the
+            # previous member did; if so, copy that member's runcaseversions
+            # in bulk and apply only the changes recorded since it was locked
+            source = self._series_lock_source(last_lockchange)
+            if source is not None:
+                previous, changes = source
+                self._copy_series_lock(previous)
+                if changes is None:
+                    progress("computing completion", 90)
+                    update_completion(runs=[self])
+                    self._set_last_lockchange(last_lockchange)
+                    self._lock_caseversions_complete()
+                    return
+                full, changed_cases = changes
 
         # get the list of environments for this run
         run_env_ids = self.environments.values_list("id", flat=True)
@@ -137,7 +256,7 @@ class Run(MTModel, TeamModel, DraftStatusModel, HasEnvironmentsModel):
         # no knowledge of any possibly existing runcaseversions yet.
         if len(run_env_ids):
             cursor = connection.cursor()
-            sql = """SELECT DISTINCT cv.id as id
+            sql = """SELECT cv.id as id
                 FROM execution_run as r
                     INNER JOIN execution_runsuite as rs
                         ON rs.run_id = r.id
@@ -155,61 +274,42 @@ class Run(MTModel, TeamModel, DraftStatusModel, HasEnvironmentsModel):
                     AND s.status = 'active'
                     AND rs.run_id = {0}
                     AND cve.environment_id IN ({1})
-                ORDER BY rs.order, sc.order
+                GROUP BY cv.id
+                ORDER BY MIN(rs.order), MIN(sc.order)
                 """.format(self.id, ",".join(map(str, run_env_ids)))
             cursor.execute(sql)
 
             cv_list = [x[0] for x in cursor.fetchall()]
 
-            # @@@ do we need to check for duplicates?
-            # use itertools.unique_everseen
-            #if len(set(cv_list)) != len(cv_list):
-            #    cv_list = itertools.unique_everseen(cv_list)
-
         else:
             cv_list = []
 
+        progress("removing cases", 10)
+
         # delete rcvs that we won't be needing anymore
         self._delete_runcaseversions(cv_list)
 
-        # audit for duplicate rcvs for the same cv.id
-        dups = self.runcaseversions.values("caseversion_id").annotate(
-            num_records=Count("caseversion")).filter(num_records__gt=1)
-        if len(dups) > 0:
-            for dup in dups:
-                # get the runcaseversions, and sort descending by the id
-                # of the results.  So the first one is the one with the latest
-                # result.  We keep that one and delete the rest.
-                rcv_to_save = self.runcaseversions.annotate(
-                    latest_result=Max("results__id")).filter(
-                        caseversion=dup["caseversion_id"]).order_by(
-                            "-latest_result")[0]
-                self.runcaseversions.filter(
-                    caseversion=dup["caseversion_id"]).exclude(
-                        id=rcv_to_save.id).delete()
-
         # remaining rcvs should be ones we want to keep, and we need to inject
         # those ids into the insert/update list for bulk_insert.  So create
-        # a dict mapping cv_id: rcv_id.  If one exists, its order field will
-        # be updated in the build_update cmd.
-        existing_rcv_map = {}
-        for map_item in self.runcaseversions.values("id", "caseversion_id"):
-            existing_rcv_map[map_item["caseversion_id"]] = map_item["id"]
+        # a dict mapping cv_id: (rcv_id, order).  If one exists, its order
+        # field will be updated in _reorder_runcaseversions.
+        existing_rcv_map = self._dedupe_runcaseversions()
 
         # build the list of rcvs that we DO need.  Be sure to include the ids
         # for rcvs that already exist so that we will just be updating the
-        # order and not replacing it.  We will use a special manager that does
-        # an update on insert error.
+        # order and not replacing it.
 
         # runcaseversion objects we will use to bulk create
-        rcv_to_update = []
+        rcv_orders = {}
         rcv_proxies_to_create = []
 
         order = 1
         for cv in cv_list:
             if cv in existing_rcv_map:
-                # we will just update the order value
-                rcv_to_update.append({"caseversion_id": cv, "order": order})
+                # we will just update the order value, if it changed
+                rcv_id, old_order = existing_rcv_map[cv]
+                if old_order != order:
+                    rcv_orders[rcv_id] = order
             else:
                 # we need to create a new one
                 kwargs = {
@@ -220,23 +320,262 @@ class Run(MTModel, TeamModel, DraftStatusModel, HasEnvironmentsModel):
                 rcv_proxies_to_create.append(RunCaseVersion(**kwargs))
             order += 1
 
+        progress("ordering cases", 20)
+
         # update existing rcvs
-        for rcv in rcv_to_update:
-            self.runcaseversions.filter(
-                caseversion=rcv["caseversion_id"]).update(order=rcv["order"])
+        self._reorder_runcaseversions(rcv_orders)
+
+        progress("adding cases", 30)
 
         # insert these rcvs in bulk
         self._bulk_insert_new_runcaseversions(rcv_proxies_to_create)
 
-        self._bulk_update_runcaseversion_environments_for_lock()
+        progress("setting environments", 40)
 
+        if full:
+            rcvs = self.runcaseversions.all()
+        else:
+            rcvs = self.runcaseversions.filter(
+                Q(caseversion__case__in=changed_cases) |
+                Q(caseversion__in=[
+                    rcv.caseversion_id for rcv in rcv_proxies_to_create])
+                )
+        self._bulk_update_runcaseversion_environments_for_lock(
+            progress=lambda synced: progress(
+                "setting environments",
+                40 + 50 * synced // max(1, len(cv_list)),
+                ),
+            runcaseversions=rcvs,
+            )
+
+        progress("computing completion", 90)
+
+        update_completion(
+            runs=[self],
+            runcaseversions=rcvs.values_list("id", flat=True),
+            )
+
+        self._set_last_lockchange(last_lockchange)
         self._lock_caseversions_complete()
 
 
+    def _lock_changes(self, last_lockchange, source=None):
+        """
+        Return changes to apply to lock this run up to ``last_lockchange``.
+
+        Returns None if no ``LockChange`` recorded since the last lock
+        concerns this run. Otherwise returns tuple (full, case ids): ``full``
+        is True if the run's own suites or environments changed, and case ids
+        are of changed cases whose runcaseversions need their environments
+        updated.
+
+        If ``source`` (a run with the same suites and environments) is given,
+        changes are those since ``source`` was last locked, and it's the
+        suites or environments of ``source`` that must not have changed.
+
+        """
+        if source is None:
+            source = self
+        run_ids, suite_ids, case_ids = set(), set(), set()
+        for run_id, suite_id, case_id in LockChange.objects.filter(
+                id__gt=source.last_lockchange, id__lte=last_lockchange,
+                ).values_list("run_id", "suite_id", "case_id"):
+            run_ids.add(run_id)
+            suite_ids.add(suite_id)
+            case_ids.add(case_id)
+        suite_ids.discard(None)
+        case_ids.discard(None)
+
+        if source.id in run_ids:
+            return (True, case_ids)
+        if not (suite_ids or case_ids):
+            return None
+
+        run_suite_ids = set(
+            RunSuite.everything.filter(run=self).values_list(
+                "suite", flat=True))
+        if suite_ids & run_suite_ids:
+            return (False, case_ids)
+        if case_ids and (
+                self.runcaseversions.filter(
+                    caseversion__case__in=case_ids).exists() or
+                Suite.cases.through.objects.filter(
+                    suite__in=run_suite_ids, case__in=case_ids).exists()):
+            return (False, case_ids)
+        return None
+
+
+    def _set_last_lockchange(self, last_lockchange):
+        """Record that runcaseversions are up to date with given change id."""
+        Run._base_manager.filter(pk=self.pk).update(
+            last_lockchange=last_lockchange)
+        self.last_lockchange = last_lockchange
+        self._loaded_values["last_lockchange"] = last_lockchange
+
+
+    def _series_lock_source(self, last_lockchange):
+        """
+        Return the previous member of this run's series to copy a lock from.
+
+        Only for a series member with no runcaseversions yet, when the latest
+        other locked member of the series has the same suites (in the same
+        order) and environments, and they haven't changed since it was
+        locked. Returns tuple (previous member, changes since it was locked
+        as returned by ``_lock_changes``), or None if a full lock is needed.
+
+        """
+        if self.series_id is None or self.runcaseversions.exists():
+            return None
+        try:
+            previous = Run.objects.filter(
+                series=self.series_id,
+                productversion=self.productversion_id,
+                ).exclude(pk=self.pk).exclude(
+                status=Run.STATUS.draft).exclude(
+                lockjobs__status__in=[
+                    RunLockJob.STATUS.queued, RunLockJob.STATUS.running],
+                ).order_by("-id")[0]
+        except IndexError:
+            return None
+
+        def suites(run):
+            return list(
+                RunSuite.objects.filter(run=run).order_by(
+                    "order", "suite").values_list("suite", "order"))
+
+        def environments(run):
+            return set(run.environments.values_list("id", flat=True))
+
+        if suites(self) != suites(previous) or not suites(self):
+            return None
+        if environments(self) != environments(previous):
+            return None
+        changes = self._lock_changes(last_lockchange, source=previous)
+        if changes is not None and changes[0]:
+            return None
+        return previous, changes
+
+
+    def _copy_series_lock(self, previous):
+        """
+        Copy runcaseversions from ``previous`` member of this run's series.
+
+        Runcaseversions are copied, and their environments set from the run
+        and caseversion environments, with an ``INSERT ... SELECT`` each.
+
+        """
+        cursor = connection.cursor()
+        now = utcnow()
+        cursor.execute(
+            """INSERT INTO execution_runcaseversion
+                (run_id, caseversion_id, {order}, completion_cache,
+                 created_on, modified_on, cc_version)
+            SELECT %s, rcv.caseversion_id, rcv.{order}, 0, %s, %s, 0
+            FROM execution_runcaseversion as rcv
+            WHERE rcv.run_id = %s
+                AND rcv.deleted_on IS NULL
+            """.format(order=connection.ops.quote_name("order")),
+            [self.id, now, now, previous.id]
+            )
+        cursor.execute(
+            """INSERT INTO execution_runcaseversion_environments
+                (runcaseversion_id, environment_id)
+            SELECT rcv.id, cve.environment_id
+            FROM execution_runcaseversion as rcv
+                INNER JOIN library_caseversion_environments as cve
+                    ON cve.caseversion_id = rcv.caseversion_id
+                INNER JOIN execution_run_environments as re
+                    ON re.environment_id = cve.environment_id
+                    AND re.run_id = rcv.run_id
+            WHERE rcv.run_id = %s
+            """,
+            [self.id]
+            )
+        transaction.set_dirty()
+
+
+    def _dedupe_runcaseversions(self):
+        """
+        Delete duplicate rcvs for the same caseversion; return remaining.
+
+        Of duplicates, the one with the latest result is kept. Returns a dict
+        mapping caseversion id to (rcv id, order) of the remaining rcvs.
+
+        """
+        by_cv = {}
+        for rcv_id, cv_id, order in self.runcaseversions.values_list(
+                "id", "caseversion_id", "order").order_by("id"):
+            by_cv.setdefault(cv_id, []).append((rcv_id, order))
+
+        dup_ids = [
+            rcv_id for rcvs in by_cv.values() if len(rcvs) > 1
+            for rcv_id, order in rcvs
+            ]
+        if dup_ids:
+            latest_result = dict(
+                RunCaseVersion.objects.filter(id__in=dup_ids).annotate(
+                    latest_result=Max("results__id")).values_list(
+                        "id", "latest_result")
+                )
+            doomed = []
+            for cv_id, rcvs in by_cv.items():
+                if len(rcvs) > 1:
+                    # keep the one with the latest result (or the first)
+                    keep = max(
+                        rcvs,
+                        key=lambda r: (latest_result.get(r[0]) or 0, -r[0]),
+                        )
+                    doomed.extend(r[0] for r in rcvs if r != keep)
+                    by_cv[cv_id] = [keep]
+            RunCaseVersion.objects.filter(id__in=doomed).delete()
+
+        return dict((cv_id, rcvs[0]) for cv_id, rcvs in by_cv.items())
+
+
+    def _reorder_runcaseversions(self, rcv_orders):
+        """
+        Set order of existing rcvs from ``rcv_orders`` dict of id: order.
+
+        Written with one ``CASE`` update per chunk of ``REORDER_CHUNK_SIZE``
+        rcvs, rather than one update per rcv.
+
+        """
+        rcv_orders = sorted(rcv_orders.items())
+        if not rcv_orders:
+            return
+        cursor = connection.cursor()
+        qn = connection.ops.quote_name
+        for start in range(0, len(rcv_orders), REORDER_CHUNK_SIZE):
+            chunk = rcv_orders[start:start + REORDER_CHUNK_SIZE]
+            cursor.execute(
+                """UPDATE execution_runcaseversion
+                SET {order} = CASE id {cases} END,
+                    cc_version = cc_version + 1,
+                    modified_on = %s,
+                    modified_by_id = NULL
+                WHERE id IN ({ids})
+                """.format(
+                    order=qn("order"),
+                    cases=" ".join(["WHEN %s THEN %s"] * len(chunk)),
+                    ids=", ".join(["%s"] * len(chunk)),
+                    ),
+                [v for item in chunk for v in item] +
+                [utcnow()] +
+                [rcv_id for rcv_id, order in chunk]
+                )
+        transaction.set_dirty()
+
+
     def _delete_runcaseversions(self, cv_list):
         """Hook to delete runcaseversions we know we don't need anymore."""
-        self.runcaseversions.exclude(caseversion__in=cv_list).delete(
-            permanent=True)
+        doomed = self.runcaseversions.exclude(caseversion__in=cv_list)
+        # results go with their runcaseversions, so the summary needs
+        # recomputing if any of them had results.
+        had_results = Result.objects.filter(
+            runcaseversion__in=doomed).exists()
+        doomed.delete(permanent=True)
+        if had_results:
+            ResultSummary.rebuild(runs=[self])
 
 
     def _bulk_insert_new_runcaseversions(self, rcv_proxies):
@@ -244,61 +583,83 @@ class Run(MTModel, TeamModel, DraftStatusModel, HasEnvironmentsModel):
         self.runcaseversions.bulk_create(rcv_proxies)
 
 
-    def _bulk_update_runcaseversion_environments_for_lock(self):
+    def _bulk_update_runcaseversion_environments_for_lock(
+            self, progress=None, runcaseversions=None):
         """
         update runcaseversion_environment records with latest state.
 
         Approach:
-          do another raw sql query to get all existing_rcv_envs for this run
+          walk the rcvs of this run in chunks of about
+          ``ENV_SYNC_CHUNK_SIZE`` (rcv, env) rows; for each chunk, query
+          existing_rcv_envs and needed_rcv_envs (intersection of run and
+          caseversion environments)
           existing_rcv_envs - needed_rcv_envs = list to delete (no longer needed)
           needed_rcv_envs - existing_rcv_envs = list to create
-        build a list of RunCaseVersion_environment objects
-        and use bulk_create.
-
-        """
-
-        # re-query all the rcvs (including newly created) for this run
-        final_rcvs = RunCaseVersion.objects.filter(run=self).select_related(
-            "caseversion").prefetch_related("caseversion__environments")
-
-        final_rcv_ids = [x.id for x in final_rcvs]
+        delete by id and bulk_create, so memory use and statement size are
+        bounded whatever the size of the run.
 
-        # runcaseversion_environments that were there prior to our changes
-        prev_rcv_envs_set = set(RunCaseVersion.environments.through.objects.filter(
-            runcaseversion_id__in=final_rcv_ids).values_list(
-                "runcaseversion_id", "environment_id"))
+        If given, ``progress`` is called with the number of rcvs synced so far
+        after each chunk. If given, only ``runcaseversions`` (a queryset of
+        this run's rcvs) are synced.
 
-        # runcaseversion_environment objects we will use to bulk create
-        # loop through all cvs and fetch the env intersection with this run
-        needed_rcv_envs_tuples = []
-        run_env_ids = set(
-            self.environments.values_list("id", flat=True))
-        for rcv in final_rcvs:
-            case_env_ids = set([x.id for x in rcv.caseversion.environments.all()])
-            for env in run_env_ids.intersection(case_env_ids):
-                needed_rcv_envs_tuples.append((rcv.id, env))
-        needed_rcv_envs_set = set(needed_rcv_envs_tuples)
-
-        # get the set of rcv_envs we need to delete because they don't belong
-        # to the needed set.
-        delete_rcv_envs = prev_rcv_envs_set - needed_rcv_envs_set
-        if len(delete_rcv_envs):
-            delquery = Q()
-            for combo in delete_rcv_envs:
-                delquery = delquery | Q(
-                    **{"runcaseversion_id": combo[0],
-                       "environment_id": combo[1]})
-            RunCaseVersion.environments.through.objects.filter(delquery).delete()
+        """
+        if runcaseversions is None:
+            runcaseversions = self.runcaseversions.all()
+        through = RunCaseVersion.environments.through
+        run_env_ids = list(self.environments.values_list("id", flat=True))
+        chunk_size = max(1, ENV_SYNC_CHUNK_SIZE // max(1, len(run_env_ids)))
+
+        last_id = 0
+        synced = 0
+        while True:
+            rcv_ids = list(
+                runcaseversions.filter(id__gt=last_id).order_by(
+                    "id").values_list("id", flat=True)[:chunk_size])
+            if not rcv_ids:
+                break
+            last_id = rcv_ids[-1]
+
+            # runcaseversion_environments that were there prior to our changes
+            prev_rcv_envs = dict(
+                ((rcv_id, env_id), pk)
+                for pk, rcv_id, env_id in through.objects.filter(
+                    runcaseversion__in=rcv_ids).values_list(
+                    "id", "runcaseversion_id", "environment_id")
+                )
 
-        # get the set of rcv_envs we need to create that don't already exist
-        needed_rcv_envs_set = needed_rcv_envs_set - prev_rcv_envs_set
+            # the env intersection of this run with each rcv's caseversion
+            needed_rcv_envs = set()
+            if run_env_ids:
+                needed_rcv_envs.update(
+                    RunCaseVersion.objects.filter(
+                        id__in=rcv_ids,
+                        caseversion__environments__in=run_env_ids,
+                        ).values_list("id", "caseversion__environments")
+                    )
+
+            # delete the rcv_envs that don't belong to the needed set.
+            delete_ids = [
+                pk for combo, pk in prev_rcv_envs.items()
+                if combo not in needed_rcv_envs
+                ]
+            if delete_ids:
+                through.objects.filter(id__in=delete_ids).delete()
+
+            # create the rcv_envs that don't already exist
+            through.objects.bulk_create(
+                [
+                    through(runcaseversion_id=rcv_id, environment_id=env_id)
+                    for rcv_id, env_id in needed_rcv_envs
+                    if (rcv_id, env_id) not in prev_rcv_envs
+                    ]
+                )
 
-        # build all the objects to pass to bulk_create
-        needed_rcv_envs = [RunCaseVersion.environments.through(
-            runcaseversion_id=needed[0],
-            environment_id=needed[1]) for needed in needed_rcv_envs_set]
+            synced += len(rcv_ids)
+            if progress is not None:
+                progress(synced)
 
-        RunCaseVersion.environments.through.objects.bulk_create(needed_rcv_envs)
+            if len(rcv_ids) < chunk_size:
+                break
 
 
     def _lock_caseversions_complete(self):
@@ -308,57 +669,17 @@ class Run(MTModel, TeamModel, DraftStatusModel, HasEnvironmentsModel):
 
     def result_summary(self):
         """Return a dict summarizing status of results."""
-        return result_summary(Result.objects.filter(runcaseversion__run=self))
+        return ResultSummary.summary_for(self)
 
 
     def completion(self):
-        """
-        Return fraction of case/env combos that have a completed result.
-
-        Have to specify deleted_on=None for the through, because the
-        default manager doesn't go through our MT model manager.
-        """
-        total = RunCaseVersion.environments.through.objects.filter(
-            runcaseversion__run=self,
-            runcaseversion__deleted_on=None,
-            ).count()
-        skipped = Result.objects.filter(
-            runcaseversion__run=self,
-            is_latest=True,
-            status=Result.STATUS.skipped).count()
-        completed = Result.objects.filter(
-            status__in=Result.COMPLETED_STATES,
-            is_latest=True,
-            runcaseversion__run=self).values(
-            "runcaseversion", "environment").distinct().count()
-
-        try:
-            return float(completed) / (total - skipped)
-        except ZeroDivisionError:
-            return 0
+        """Return fraction of case/env combos that have a completed result."""
+        return run_completion([self])[self.id]
 
 
     def completion_single_env(self, env_id):
         """Return fraction of cases that have a completed result for an env."""
-        total = RunCaseVersion.objects.filter(
-            environments=env_id,
-            run=self).count()
-        skipped = Result.objects.filter(
-            runcaseversion__run=self,
-            environment=env_id,
-            is_latest=True,
-            status=Result.STATUS.skipped).count()
-        completed = Result.objects.filter(
-            status__in=Result.COMPLETED_STATES,
-            is_latest=True,
-            environment=env_id,
-            runcaseversion__run=self).values(
-            "runcaseversion", "environment").distinct().count()
-
-        try:
-            return float(completed) / (total - skipped)
-        except ZeroDivisionError:
-            return 0.0
+        return run_completion([self], environment=env_id)[self.id]
 
 
 
@@ -384,6 +705,10 @@ class RunCaseVersion(HasEnvironmentsModel, MTModel):
     run = models.ForeignKey(Run, related_name="runcaseversions")
     caseversion = models.ForeignKey(CaseVersion, related_name="runcaseversions")
     order = models.IntegerField(default=0, db_index=True)
+    # fraction of environments completed; see ``update_completion``
+    completion_cache = models.FloatField(default=0, db_index=True)
+
+    denormalized_fields = ["completion_cache"]
 
 
     def __unicode__(self):
@@ -394,9 +719,9 @@ class RunCaseVersion(HasEnvironmentsModel, MTModel):
     def bug_urls(self):
         """Returns set of bug URLs associated with this run/caseversion."""
         return set(
-            StepResult.objects.filter(
-                result__runcaseversion=self).exclude(
-                bug_url="").values_list("bug_url", flat=True).distinct()
+            BugURL.objects.filter(
+                run=self.run_id, caseversion=self.caseversion_id,
+                ).values_list("bug_url", flat=True)
             )
 
 
@@ -420,32 +745,50 @@ class RunCaseVersion(HasEnvironmentsModel, MTModel):
         ret = super(RunCaseVersion, self).save(*args, **kwargs)
 
         if adding and inherit_envs:
-            self.environments.add(
-                *_environment_intersection(self.run, self.caseversion))
+            env_ids = _environment_intersection(self.run, self.caseversion)
+            self.environments.add(*env_ids)
+            update_combo_completion(
+                [(self.id, env_id) for env_id in env_ids], {})
 
         return ret
 
 
+    @classmethod
+    def _remove_envs(cls, objs, envs):
+        """Remove environments, recomputing completion of those affected."""
+        affected = list(
+            cls.environments.through._base_manager.filter(
+                runcaseversion__in=objs, environment__in=envs).values_list(
+                    "runcaseversion", "runcaseversion__run").distinct())
+        super(RunCaseVersion, cls)._remove_envs(objs, envs)
+        update_completion(
+            runs=set(run_id for rcv_id, run_id in affected),
+            runcaseversions=set(rcv_id for rcv_id, run_id in affected),
+            )
+
+
+    @classmethod
+    def bulk_updated(cls, objs, fields):
+        """Recompute completion of runs with deleted or undeleted rcvs."""
+        if "deleted_on" in fields:
+            _refresh_live_runs(
+                [cls._base_manager.filter(id__in=[rcv.id for rcv in objs])])
+
+
+    @classmethod
+    def deletion_cascaded(cls, querysets):
+        """Recompute completion of runs with deleted or undeleted rcvs."""
+        _refresh_live_runs(querysets)
+
+
     def result_summary(self):
         """Return a dict summarizing status of results."""
-        return result_summary(self.results.values())
+        return result_summary(self.latestresults.all())
 
 
     def completion(self):
         """Return fraction of environments that have a completed result."""
-        total = self.environments.count()
-        skipped = self.results.filter(
-            is_latest=True,
-            status=Result.STATUS.skipped).count()
-        completed = self.results.filter(
-            is_latest=True,
-            status__in=Result.COMPLETED_STATES).values(
-            "environment").distinct().count()
-
-        try:
-            return float(completed) / (total - skipped)
-        except ZeroDivisionError:
-            return 0
+        return runcaseversion_completion([self])[self.id]
 
 
     def testers(self):
@@ -456,28 +799,19 @@ class RunCaseVersion(HasEnvironmentsModel, MTModel):
 
     def start(self, environment=None, user=None):
         """Mark this result started."""
+        from .ingest import create_results
         # if we are restarted a case that was skipped, we want to restart
         # for ALL envs, not just this one.
         envs = [environment]
-        try:
-            latest = self.results.get(
-                is_latest=True,
+        if self.latestresults.filter(
                 tester=user,
                 environment=environment,
-                )
-            if latest.status == Result.STATUS.skipped:
-                envs = self.environments.all()
-        except ObjectDoesNotExist:
-            pass
+                status=Result.STATUS.skipped,
+                ).exists():
+            envs = self.environments.values_list("id", flat=True)
 
-        for env in envs:
-            Result.objects.create(
-                runcaseversion=self,
-                tester=user,
-                environment=env,
-                status=Result.STATUS.started,
-                user=user
-                )
+        # one bulk insert for all environments, rather than one per env
+        create_results(self, envs, Result.STATUS.started, user)
 
 
     def get_result_method(self, status):
@@ -511,15 +845,13 @@ class RunCaseVersion(HasEnvironmentsModel, MTModel):
 
         If no environment is specified, then skip for all envs.
         """
-        envs = self.environments.all()
-
-        for env in envs:
-            Result.objects.create(
-                runcaseversion=self,
-                tester=user,
-                environment=env,
-                status=Result.STATUS.skipped,
-                user=user
+        from .ingest import create_results
+        # one bulk insert for all environments, rather than one per env
+        create_results(
+            self,
+            self.environments.values_list("id", flat=True),
+            Result.STATUS.skipped,
+            user,
             )
 
 
@@ -558,17 +890,32 @@ class RunCaseVersion(HasEnvironmentsModel, MTModel):
             user=user,
             )
         if stepnumber is not None:
-            try:
-                step = self.caseversion.steps.get(
-                    number=stepnumber)
-            except CaseStep.DoesNotExist:
-                pass
-            else:
+            step = self.step_for(stepnumber)
+            if step is not None:
                 stepresult = StepResult(result=result, step=step)
                 stepresult.status = StepResult.STATUS.failed
                 stepresult.bug_url = bug
                 stepresult.save(user=user)
-        self.save(force_update=True, user=user)
+
+
+    def step_for(self, stepnumber):
+        """
+        Return the step of this caseversion with given number, or None.
+
+        Steps are loaded once per instance, so recording several results
+        against the same runcaseversion doesn't query steps each time.
+
+        """
+        try:
+            stepnumber = int(stepnumber)
+        except (TypeError, ValueError):
+            return None
+        try:
+            steps = self._steps
+        except AttributeError:
+            steps = self._steps = step_map(
+                [self.caseversion_id])[self.caseversion_id]
+        return steps.get(stepnumber)
 
 
 
@@ -594,6 +941,204 @@ class RunSuite(MTModel):
         ordering = ["order"]
 
 
+    def save(self, *args, **kwargs):
+        """Save, recording the change to the run's suites."""
+        super(RunSuite, self).save(*args, **kwargs)
+        LockChange.record(runs=[self.run_id])
+
+
+    @classmethod
+    def bulk_created(cls, objs):
+        """Record the change to the runs of new runsuites."""
+        LockChange.record(runs=set(rs.run_id for rs in objs))
+
+
+    def delete(self, *args, **kwargs):
+        """Delete, recording the change to the run's suites."""
+        counts = super(RunSuite, self).delete(*args, **kwargs)
+        LockChange.record(runs=[self.run_id])
+        return counts
+
+
+    def undelete(self, *args, **kwargs):
+        """Undelete, recording the change to the run's suites."""
+        counts = super(RunSuite, self).undelete(*args, **kwargs)
+        LockChange.record(runs=[self.run_id])
+        return counts
+
+
+
+class RunLockJob(models.Model):
+    """
+    A queued activation or refresh of a run, for a background worker.
+
+    With ``BACKGROUND_RUN_LOCK`` enabled, activating or refreshing a run
+    enqueues one of these instead of locking its runcaseversions in the
+    request; the ``run_lock_jobs`` command claims and runs them, reporting
+    the stage and percentage done as it goes. A run being activated stays in
+    draft until its job is done.
+
+    """
+    STATUS = Choices("queued", "running", "done", "failed")
+
+    run = models.ForeignKey(Run, related_name="lockjobs")
+    status = models.CharField(
+        max_length=30, choices=STATUS, default=STATUS.queued, db_index=True)
+    stage = models.CharField(max_length=50, blank=True)
+    progress = models.IntegerField(default=0)
+    # if False, only recorded changes are applied; see ``Run.refresh``
+    full = models.BooleanField(default=True)
+    # if True, the (draft) run is activated once locked; see ``Run.activate``
+    activate = models.BooleanField(default=False)
+    error = models.TextField(blank=True)
+    queued_on = models.DateTimeField(default=utcnow)
+    started_on = models.DateTimeField(blank=True, null=True)
+    finished_on = models.DateTimeField(blank=True, null=True)
+
+
+    def __unicode__(self):
+        """Return unicode representation."""
+        return "Lock of run '%s' (%s)" % (self.run, self.status)
+
+
+    @classmethod
+    def enqueue(cls, run, full=True, activate=False):
+        """Queue a lock of ``run``, unless one is already queued; return it."""
+        try:
+            job = cls.objects.filter(
+                run=run, status=cls.STATUS.queued).order_by("-id")[0]
+        except IndexError:
+            return cls.objects.create(run=run, full=full, activate=activate)
+        if (full and not job.full) or (activate and not job.activate):
+            job.full = job.full or full
+            job.activate = job.activate or activate
+            job.save()
+        return job
+
+
+    @classmethod
+    @transaction.commit_on_success
+    def claim(cls):
+        """
+        Mark the oldest queued job running and return it, or None.
+
+        Jobs for runs that already have a running job are left queued, so a
+        run is never locked by two workers at once.
+
+        """
+        running = cls.objects.filter(status=cls.STATUS.running).values("run")
+        try:
+            job = cls.objects.select_for_update().filter(
+                status=cls.STATUS.queued).exclude(
+                run__in=running).order_by("id")[0]
+        except IndexError:
+            return None
+        job.status = cls.STATUS.running
+        job.started_on = utcnow()
+        job.save()
+        return job
+
+
+    def execute(self):
+        """Lock the run, then record success or failure of the job."""
+        self._report_connection = None
+        try:
+            self.run._lock_case_versions(
+                progress=self.report, full=self.full)
+        except Exception:
+            self.status = self.STATUS.failed
+            self.error = traceback.format_exc()
+        else:
+            if self.activate:
+                # unless it was changed from draft meanwhile
+                Run.objects.filter(
+                    pk=self.run_id, status=Run.STATUS.draft).update(
+                        status=Run.STATUS.active)
+            self.status = self.STATUS.done
+            self.progress = 100
+        finally:
+            if self._report_connection is not None:
+                self._report_connection.close()
+        self.finished_on = utcnow()
+        self.save()
+
+
+    def report(self, stage, progress):
+        """
+        Record ``stage`` and ``progress`` percentage of this running job.
+
+        The lock runs in a single transaction, so progress is written through
+        a separate database connection to be visible before it commits.
+        Progress is advisory; failing to record it doesn't fail the job.
+
+        """
+        self.stage = stage
+        self.progress = progress
+        try:
+            if getattr(self, "_report_connection", None) is None:
+                backend = load_backend(connection.settings_dict["ENGINE"])
+                self._report_connection = backend.DatabaseWrapper(
+                    connection.settings_dict, "lockjob-progress")
+            cursor = self._report_connection.cursor()
+            cursor.execute(
+                "UPDATE execution_runlockjob SET stage = %s, progress = %s "
+                "WHERE id = %s",
+                [stage, progress, self.id],
+                )
+            self._report_connection.connection.commit()
+        except DatabaseError:
+            pass
+
+
+
+class LockChange(models.Model):
+    """
+    A recorded change that runs' locked-in runcaseversions may need.
+
+    Each change names a run whose suites or environments changed, a suite
+    whose cases changed, or a case whose versions changed. Refreshing a run
+    applies the changes recorded since its last lock (see
+    ``Run.last_lockchange``); the ``refresh_runs`` command applies them to
+    all active runs, does a full reconcile with ``--full``, and prunes
+    changes all runs are up to date with.
+
+    Plain integer IDs rather than foreign keys, so a change outlives a
+    permanently deleted suite or case.
+
+    """
+    run_id = models.IntegerField(blank=True, null=True)
+    suite_id = models.IntegerField(blank=True, null=True)
+    case_id = models.IntegerField(blank=True, null=True)
+    created_on = models.DateTimeField(default=utcnow)
+
+
+    def __unicode__(self):
+        """Return unicode representation."""
+        return "Change to run %s, suite %s, case %s" % (
+            self.run_id, self.suite_id, self.case_id)
+
+
+    @classmethod
+    def record(cls, runs=(), suites=(), cases=()):
+        """Record changes to given run, suite and case IDs."""
+        cls.objects.bulk_create(
+            [cls(run_id=run_id) for run_id in set(runs)] +
+            [cls(suite_id=suite_id) for suite_id in set(suites)] +
+            [cls(case_id=case_id) for case_id in set(cases)]
+            )
+
+
+    @classmethod
+    def prune(cls):
+        """Delete changes that all active runs are up to date with."""
+        runs = Run.objects.filter(status=Run.STATUS.active, is_series=False)
+        if runs.exists():
+            last = runs.aggregate(last=Min("last_lockchange"))["last"]
+        else:
+            last = cls.objects.aggregate(last=Max("id"))["last"] or 0
+        cls.objects.filter(id__lte=last).delete()
+
+
 
 class Result(MTModel):
     """A result of a User running a RunCaseVersion in an Environment."""
@@ -614,12 +1159,18 @@ class Result(MTModel):
     status = models.CharField(
         max_length=50, db_index=True, choices=STATUS, default=STATUS.assigned)
     comment = models.TextField(blank=True)
+    # (runcaseversion, environment, is_latest, status) also has a composite
+    # index (see migration 0015) covering the runtests list's lookup of other
+    # testers' latest completed results for a page of cases.
     is_latest = models.BooleanField(default=True)
 
     review = models.CharField(
         max_length=50, db_index=True, choices=REVIEW, default=REVIEW.pending)
     reviewed_by = models.ForeignKey(
         User, related_name="reviews", blank=True, null=True)
+    # set only while a bulk insert reads back the IDs of the rows it created
+    ingest_batch = models.CharField(
+        max_length=32, blank=True, null=True, editable=False)
 
 
     def __unicode__(self):
@@ -641,28 +1192,196 @@ class Result(MTModel):
 
 
     def save(self, *args, **kwargs):
-        if self.pk is None:
-            self.set_latest()
+        """
+        Save, keeping latest results, summaries and stored completion current.
+
+        A new result becomes the latest; a change to the status of an existing
+        result is carried to its latest-result pointer and summary, if it's
+        the latest.
+
+        """
+        adding = self.pk is None
+        status_changed = (
+            not adding and
+            self._loaded_values.get("status") != self.status
+            )
+        combos = [(self.runcaseversion_id, self.environment_id)]
+        before = combo_completion(combos)
         super(Result, self).save(*args, **kwargs)
+        if adding:
+            self._make_latest()
+        elif status_changed and self.deleted_on is None:
+            self._update_latest_status()
+        update_combo_completion(combos, before)
+
+
+    def _update_latest_status(self):
+        """Carry a changed status to the pointer and summary, if latest."""
+        previous = list(
+            LatestResult.objects.filter(result=self).exclude(
+                status=self.status).values_list("status", flat=True))
+        if previous:
+            LatestResult.objects.filter(result=self).update(
+                status=self.status)
+            run_id = self.runcaseversion.run_id
+            ResultSummary.adjust(
+                run_id, self.environment_id, previous[0], -1)
+            ResultSummary.adjust(run_id, self.environment_id, self.status, 1)
+
+
+    @classmethod
+    def bulk_updated(cls, objs, fields):
+        """Carry changes to latest results, summaries and completion."""
+        if not set(fields) & set(["status", "is_latest", "deleted_on"]):
+            return
+        if "is_latest" in fields:
+            for result in objs:
+                if result.is_latest:
+                    LatestResult.point_to(result)
+        if "status" in fields:
+            by_status = {}
+            for result in objs:
+                by_status.setdefault(result.status, []).append(result.id)
+            for status, ids in by_status.items():
+                LatestResult.objects.filter(result__in=ids).exclude(
+                    status=status).update(status=status)
+        cls._results_changed(set(result.runcaseversion_id for result in objs))
+
+
+    @classmethod
+    def deletion_cascaded(cls, querysets):
+        """Recompute summaries and completion of runs with changed results."""
+        rcv_ids = set()
+        for results in querysets:
+            rcv_ids.update(
+                results.values_list("runcaseversion", flat=True).distinct(
+                    ).order_by())
+        cls._results_changed(rcv_ids)
+
+
+    @classmethod
+    def _results_changed(cls, rcv_ids):
+        """Recompute summaries and completion for results in given rcvs."""
+        if not rcv_ids:
+            return
+        _refresh_live_runs(
+            [RunCaseVersion._base_manager.filter(id__in=rcv_ids)],
+            summaries=True,
+            )
+
+
+    def _make_latest(self):
+        """
+        Point this result's ``LatestResult`` at it, superseding the previous.
+
+        Only the single previously-latest result is flagged as no longer
+        latest, so the cost of recording a result doesn't depend on result
+        history, and concurrent results for the same case, environment and
+        tester are serialized on the pointer row.
+
+        """
+        run_id = self.runcaseversion.run_id
+        previous = LatestResult.point_to(self)
+        if previous is not None:
+            Result.objects.filter(pk=previous.result_id).update(
+                is_latest=False)
+            ResultSummary.adjust(
+                run_id, self.environment_id, previous.status, -1)
+        ResultSummary.adjust(run_id, self.environment_id, self.status, 1)
+        self.is_latest = True
 
 
     def set_latest(self):
         """
         Set this result to latest, and unset all others with this env/user/rcv
 
-        """
+        Recording a new result already makes it latest; this repairs cases
+        where several results with this env/user/rcv are flagged latest.
 
-        Result.objects.filter(
+        """
+        superseded = Result.objects.filter(
             tester=self.tester,
             runcaseversion=self.runcaseversion,
             environment=self.environment,
             is_latest=True,
-            ).exclude(pk=self.pk).update(is_latest=False)
+            ).exclude(pk=self.pk)
+        superseded.update(is_latest=False)
+
+        if self.pk is not None:
+            run_id = self.runcaseversion.run_id
+            previous = LatestResult.point_to(self)
+            if previous is None or previous.result_id != self.pk:
+                if previous is not None:
+                    ResultSummary.adjust(
+                        run_id, self.environment_id, previous.status, -1)
+                ResultSummary.adjust(
+                    run_id, self.environment_id, self.status, 1)
 
         self.is_latest = True
 
 
 
+class LatestResult(models.Model):
+    """
+    Pointer to the latest result for a runcaseversion, environment and tester.
+
+    Upserted whenever a result is recorded; readers that need only latest
+    results (summaries, completion, filtering by result status) use this
+    rather than the ``is_latest`` flag on ``Result``.
+
+    """
+    runcaseversion = models.ForeignKey(
+        RunCaseVersion, related_name="latestresults")
+    environment = models.ForeignKey(Environment, related_name="+")
+    tester = models.ForeignKey(User, related_name="+")
+    result = models.ForeignKey(Result, related_name="+")
+    status = models.CharField(max_length=50, choices=Result.STATUS)
+
+
+    def __unicode__(self):
+        """Return unicode representation."""
+        return "Latest: %s" % self.result
+
+
+    class Meta:
+        unique_together = [("runcaseversion", "environment", "tester")]
+
+
+    @classmethod
+    def point_to(cls, result):
+        """
+        Make ``result`` the latest for its runcaseversion, env and tester.
+
+        Returns the previous pointer (with its previous result and status), or
+        None if there wasn't one. The pointer row is locked until the end of
+        the transaction.
+
+        """
+        key = dict(
+            runcaseversion_id=result.runcaseversion_id,
+            environment_id=result.environment_id,
+            tester_id=result.tester_id,
+            )
+        while True:
+            try:
+                previous = cls.objects.select_for_update().get(**key)
+            except cls.DoesNotExist:
+                # another tester may have inserted this pointer meanwhile
+                sid = transaction.savepoint()
+                try:
+                    cls.objects.create(
+                        result=result, status=result.status, **key)
+                except IntegrityError:
+                    transaction.savepoint_rollback(sid)
+                    continue
+                transaction.savepoint_commit(sid)
+                return None
+            cls.objects.filter(pk=previous.pk).update(
+                result=result, status=result.status)
+            return previous
+
+
+
 class StepResult(MTModel):
     """A result of a particular step in a test case."""
     STATUS = Choices("passed", "failed", "invalidated", "skipped", "blocked")
@@ -679,25 +1398,893 @@ class StepResult(MTModel):
         return "%s (%s: %s)" % (self.result, self.step, self.status)
 
 
+    def save(self, *args, **kwargs):
+        """Save, and record the bug URL in the run's bug URL index."""
+        previous = None
+        if self.pk is not None:
+            previous = StepResult.everything.filter(pk=self.pk).values_list(
+                "bug_url", flat=True)[:1]
+            previous = previous[0] if previous else None
+        super(StepResult, self).save(*args, **kwargs)
+        if self.bug_url:
+            BugURL.record([self._bug_key(self.bug_url)])
+        if previous and previous != self.bug_url:
+            BugURL.sync([self._bug_key(previous)])
+
+
+    def delete(self, *args, **kwargs):
+        """Delete, dropping the bug URL from the index if no longer used."""
+        counts = super(StepResult, self).delete(*args, **kwargs)
+        if self.bug_url:
+            BugURL.sync([self._bug_key(self.bug_url)])
+        return counts
+
+
+    def undelete(self, *args, **kwargs):
+        """Undelete, recording the bug URL in the index again."""
+        counts = super(StepResult, self).undelete(*args, **kwargs)
+        if self.bug_url:
+            BugURL.sync([self._bug_key(self.bug_url)])
+        return counts
+
+
+    def _bug_key(self, bug_url):
+        """Return (run id, caseversion id, bug_url) bug URL index key."""
+        rcv = self.result.runcaseversion
+        return (rcv.run_id, rcv.caseversion_id, bug_url)
+
+
+
+class ResultSummary(models.Model):
+    """
+    Count of latest results for one run, environment and status.
+
+    Denormalized from ``Result`` so that run summaries don't have to scan all
+    the run's results; kept current as results are recorded, and can be
+    rebuilt from scratch with the ``rebuild_result_summaries`` management
+    command.
+
+    """
+    run = models.ForeignKey(Run, related_name="resultsummaries")
+    environment = models.ForeignKey(Environment, related_name="+")
+    status = models.CharField(max_length=50, choices=Result.STATUS)
+    count = models.IntegerField(default=0)
+
+
+    def __unicode__(self):
+        """Return unicode representation."""
+        return "%s in %s: %s %s" % (
+            self.run, self.environment, self.count, self.status)
+
+
+    class Meta:
+        unique_together = [("run", "environment", "status")]
+
+
+    @classmethod
+    def adjust(cls, run_id, environment_id, status, delta):
+        """Add ``delta`` to the count for given run, environment and status."""
+        filters = dict(
+            run_id=run_id, environment_id=environment_id, status=status)
+        counts = cls.objects.filter(**filters)
+        if not counts.update(count=models.F("count") + delta):
+            cls.objects.get_or_create(defaults={"count": 0}, **filters)
+            counts.update(count=models.F("count") + delta)
+
+
+    @classmethod
+    def adjust_many(cls, deltas):
+        """
+        Apply ``deltas``, a dict mapping (run id, environment id, status) to
+        the delta to add to its count.
+
+        Takes a fixed number of queries however many counts are adjusted: one
+        update per distinct delta, after creating any missing counts in bulk.
+
+        """
+        deltas = dict((k, d) for k, d in deltas.items() if d)
+        if not deltas:
+            return
+
+        def existing():
+            keys = set(deltas)
+            return dict(
+                ((run_id, env_id, status), pk)
+                for pk, run_id, env_id, status in cls.objects.filter(
+                    run__in=set(k[0] for k in keys),
+                    environment__in=set(k[1] for k in keys),
+                    status__in=set(k[2] for k in keys),
+                    ).values_list("id", "run", "environment", "status")
+                if (run_id, env_id, status) in keys
+                )
+
+        ids = existing()
+        missing = [k for k in deltas if k not in ids]
+        if missing:
+            # counts may be created concurrently; then fall back to one by one
+            sid = transaction.savepoint()
+            try:
+                cls.objects.bulk_create(
+                    [
+                        cls(run_id=run_id, environment_id=env_id,
+                            status=status, count=0)
+                        for run_id, env_id, status in missing
+                        ]
+                    )
+            except IntegrityError:
+                transaction.savepoint_rollback(sid)
+                for run_id, env_id, status in missing:
+                    cls.objects.get_or_create(
+                        run_id=run_id,
+                        environment_id=env_id,
+                        status=status,
+                        defaults={"count": 0},
+                        )
+            else:
+                transaction.savepoint_commit(sid)
+            ids = existing()
+
+        by_delta = {}
+        for key, delta in deltas.items():
+            by_delta.setdefault(delta, []).append(ids[key])
+        for delta, pks in sorted(by_delta.items()):
+            cls.objects.filter(id__in=pks).update(
+                count=models.F("count") + delta)
+
+
+    @classmethod
+    def summary_for(cls, run):
+        """Return a dict summarizing status of latest results in ``run``."""
+        states = Result.COMPLETED_STATES
+        summary = dict((s, 0) for s in states)
+        summary.update(
+            cls.objects.filter(run=run, status__in=states).values_list(
+                "status").annotate(Sum("count")).order_by()
+            )
+        return summary
+
+
+    @classmethod
+    def rebuild(cls, runs=None):
+        """
+        Recompute summaries from the latest-result pointers.
+
+        If ``runs`` is given, only summaries for those runs are rebuilt;
+        otherwise summaries for all runs are.
+
+        """
+        results = LatestResult.objects.filter(result__deleted_on__isnull=True)
+        summaries = cls.objects.all()
+        if runs is not None:
+            results = results.filter(runcaseversion__run__in=runs)
+            summaries = summaries.filter(run__in=runs)
+
+        summaries.delete()
+        cls.objects.bulk_create(
+            [
+                cls(
+                    run_id=row["runcaseversion__run"],
+                    environment_id=row["environment"],
+                    status=row["status"],
+                    count=row["num"],
+                    )
+                for row in results.values(
+                    "runcaseversion__run", "environment", "status").annotate(
+                        num=Count("id")).order_by()
+                ]
+            )
+
+
+
+class Watermark(models.Model):
+    """The last row ID processed by a named incremental job."""
+    name = models.CharField(max_length=100, unique=True)
+    last_id = models.IntegerField(default=0)
+
+
+    def __unicode__(self):
+        """Return unicode representation."""
+        return "%s: %s" % (self.name, self.last_id)
+
+
+    @classmethod
+    def lock(cls, name):
+        """
+        Return watermark with given name, creating it if need be.
+
+        The watermark row is locked until the end of the transaction, so
+        concurrent runs of the same job process rows one after the other.
+
+        """
+        cls.objects.get_or_create(name=name)
+        return cls.objects.select_for_update().get(name=name)
+
+
+
+class ResultRollup(models.Model):
+    """
+    Count of results recorded on one day in one run, environment and status.
+
+    Lets trend charts read daily counts rather than scanning all results.
+    Append-only: the ``rollup_results`` management command adds rows for the
+    results created since its watermark, so there may be several rows for
+    the same day, run, environment and status; ``trends`` sums them. Results
+    deleted after they are rolled up stay counted. Pending results are not
+    counted.
+
+    """
+    day = models.DateField(db_index=True)
+    productversion = models.ForeignKey(ProductVersion, related_name="+")
+    run = models.ForeignKey(Run, related_name="+")
+    environment = models.ForeignKey(Environment, related_name="+")
+    status = models.CharField(max_length=50, choices=Result.STATUS)
+    count = models.IntegerField(default=0)
+
+
+    def __unicode__(self):
+        """Return unicode representation."""
+        return "%s in %s on %s: %s %s" % (
+            self.run, self.environment, self.day, self.count, self.status)
+
+
+    @classmethod
+    @transaction.commit_on_success
+    def roll_up(cls, lag=ROLLUP_LAG):
+        """
+        Add counts of results created since the last roll-up.
+
+        Results created within ``lag`` of now are left for the next roll-up.
+        Returns the number of rows added.
+
+        """
+        watermark = Watermark.lock("resultrollup")
+        last = Result.everything.filter(
+            id__gt=watermark.last_id, created_on__lte=utcnow() - lag,
+            ).aggregate(last=Max("id"))["last"]
+        if last is None:
+            return 0
+
+        cursor = connection.cursor()
+        cursor.execute(
+            """INSERT INTO execution_resultrollup
+            (day, productversion_id, run_id, environment_id, status, count)
+            SELECT DATE(r.created_on), run.productversion_id, rcv.run_id,
+                r.environment_id, r.status, COUNT(*)
+            FROM execution_result r
+            INNER JOIN execution_runcaseversion rcv
+                ON rcv.id = r.runcaseversion_id
+            INNER JOIN execution_run run ON run.id = rcv.run_id
+            WHERE r.id > %s AND r.id <= %s
+            AND r.deleted_on IS NULL
+            AND r.status NOT IN ({pending})
+            GROUP BY DATE(r.created_on), run.productversion_id, rcv.run_id,
+                r.environment_id, r.status
+            """.format(
+                pending=", ".join(["%s"] * len(Result.PENDING_STATES))),
+            [watermark.last_id, last] + Result.PENDING_STATES
+            )
+        added = cursor.rowcount
+        transaction.set_dirty()
+
+        watermark.last_id = last
+        watermark.save()
+        return added
+
+
+    @classmethod
+    def trends(cls, statuses, start=None, end=None, **filters):
+        """
+        Return daily counts of results with ``statuses``.
+
+        Counts are of rollups matching ``filters`` (e.g. ``productversion``
+        or ``run__series``), from ``start`` to ``end`` dates inclusive; these
+        default to the first and last days with counts. Returns a tuple of
+        (list of days, dictionary mapping each status to a list of counts
+        parallel to the days).
+
+        """
+        rollups = cls.objects.filter(status__in=statuses, **filters)
+        if start is not None:
+            rollups = rollups.filter(day__gte=start)
+        if end is not None:
+            rollups = rollups.filter(day__lte=end)
+
+        totals = dict(
+            ((day, status), total)
+            for day, status, total in rollups.values_list(
+                "day", "status").annotate(Sum("count")).order_by()
+            )
+        if totals and start is None:
+            start = min(day for day, status in totals)
+        if totals and end is None:
+            end = max(day for day, status in totals)
+        days = []
+        if start is not None and end is not None:
+            days = [
+                start + datetime.timedelta(days=i)
+                for i in range((end - start).days + 1)
+                ]
+
+        return days, dict(
+            (status, [totals.get((day, status), 0) for day in days])
+            for status in statuses
+            )
+
+
+
+class BugURL(models.Model):
+    """
+    A bug URL filed against a caseversion in a run.
+
+    Denormalized from the bug URLs of ``StepResult`` so that the bugs of a
+    runcaseversion, caseversion or run are read with an indexed lookup rather
+    than a scan of step results joined through results. Recorded as step
+    results are saved; step results deleted by cascade leave their bug URLs
+    indexed until the ``rebuild_bug_urls`` management command is run.
+
+    """
+    run = models.ForeignKey(Run, related_name="bugurls")
+    caseversion = models.ForeignKey(CaseVersion, related_name="bugurls")
+    bug_url = models.URLField()
+
+
+    def __unicode__(self):
+        """Return unicode representation."""
+        return self.bug_url
+
+
+    class Meta:
+        unique_together = [("run", "caseversion", "bug_url")]
+
+
+    @classmethod
+    def record(cls, keys):
+        """
+        Index bug URLs given as (run id, caseversion id, bug_url) ``keys``.
+
+        Takes a fixed number of queries however many keys are given.
+
+        """
+        keys = set(k for k in keys if k[2])
+        if not keys:
+            return
+
+        def missing():
+            existing = set(
+                cls.objects.filter(
+                    run__in=set(k[0] for k in keys),
+                    caseversion__in=set(k[1] for k in keys),
+                    bug_url__in=set(k[2] for k in keys),
+                    ).values_list("run", "caseversion", "bug_url")
+                )
+            return [k for k in keys if k not in existing]
+
+        new = missing()
+        if not new:
+            return
+        # entries may be created concurrently; then fall back to one by one
+        sid = transaction.savepoint()
+        try:
+            cls.objects.bulk_create(
+                [
+                    cls(run_id=run_id, caseversion_id=cv_id, bug_url=bug_url)
+                    for run_id, cv_id, bug_url in new
+                    ]
+                )
+        except IntegrityError:
+            transaction.savepoint_rollback(sid)
+            for run_id, cv_id, bug_url in missing():
+                cls.objects.get_or_create(
+                    run_id=run_id, caseversion_id=cv_id, bug_url=bug_url)
+        else:
+            transaction.savepoint_commit(sid)
+
+
+    @classmethod
+    def sync(cls, keys):
+        """
+        Index or drop (run id, caseversion id, bug_url) ``keys``.
+
+        Each key is indexed if a step result still has that bug URL, and
+        dropped otherwise.
+
+        """
+        for run_id, cv_id, bug_url in set(keys):
+            if StepResult.objects.filter(
+                    result__runcaseversion__run=run_id,
+                    result__runcaseversion__caseversion=cv_id,
+                    bug_url=bug_url,
+                    ).exists():
+                cls.record([(run_id, cv_id, bug_url)])
+            else:
+                cls.objects.filter(
+                    run=run_id, caseversion=cv_id, bug_url=bug_url).delete()
+
+
+    @classmethod
+    def rebuild(cls, runs=None):
+        """
+        Rebuild the index from the bug URLs of step results.
+
+        If ``runs`` is given, only the index for those runs is rebuilt;
+        otherwise the index for all runs is.
+
+        """
+        stepresults = StepResult.objects.exclude(bug_url="")
+        bugurls = cls.objects.all()
+        if runs is not None:
+            stepresults = stepresults.filter(
+                result__runcaseversion__run__in=runs)
+            bugurls = bugurls.filter(run__in=runs)
+
+        bugurls.delete()
+        cls.objects.bulk_create(
+            [
+                cls(run_id=run_id, caseversion_id=cv_id, bug_url=bug_url)
+                for run_id, cv_id, bug_url in stepresults.values_list(
+                    "result__runcaseversion__run",
+                    "result__runcaseversion__caseversion",
+                    "bug_url",
+                    ).distinct().order_by()
+                ]
+            )
+
+
 
-def result_summary(results):
+class CaseFlakiness(models.Model):
     """
-    Given a queryset of results, return a dict summarizing their states.
+    How often a case flips between passing and failing in an environment.
+
+    Measured over the most recent ``FLAKY_BUILDS`` member runs of each
+    series the case was run in: in each series, consecutive builds with a
+    completed result for the case in the environment are compared, and the
+    score is the fraction of those comparisons where the case went from
+    passed to failed (or blocked) or back. A build counts as failed if any
+    tester's latest result there failed or was blocked; invalidated results
+    are ignored.
+
+    Updated by the ``detect_flaky_cases`` management command for cases with
+    results recorded since its watermark.
+
+    """
+    case = models.ForeignKey(Case, related_name="flakiness")
+    environment = models.ForeignKey(Environment, related_name="+")
+    score = models.FloatField(db_index=True)
+    flips = models.IntegerField()
+    builds = models.IntegerField()
+
+
+    def __unicode__(self):
+        """Return unicode representation."""
+        return "%s in %s: %s" % (self.case_id, self.environment_id, self.score)
+
+
+    class Meta:
+        unique_together = [("case", "environment")]
+
+
+    @classmethod
+    def analyze(cls, lag=ROLLUP_LAG, builds=FLAKY_BUILDS,
+                chunk_size=FLAKY_CHUNK_SIZE):
+        """
+        Update flakiness of cases with results created since the last run.
+
+        Results created within ``lag`` of now are left for the next run.
+        Flakiness is measured over the last ``builds`` member runs of each
+        series, ``chunk_size`` cases at a time. Returns the number of
+        (case, environment) scores stored.
+
+        """
+        watermark = Watermark.lock("caseflakiness")
+        last = Result.everything.filter(
+            id__gt=watermark.last_id, created_on__lte=utcnow() - lag,
+            ).aggregate(last=Max("id"))["last"]
+        if last is None:
+            return 0
+
+        recent = {}
+        for series_id, run_id in Run.objects.filter(
+                series__isnull=False).exclude(
+                    status=Run.STATUS.draft).order_by(
+                        "-start", "-id").values_list("series", "id"):
+            runs = recent.setdefault(series_id, [])
+            if len(runs) < builds:
+                runs.append(run_id)
+        recent = [run_id for runs in recent.values() for run_id in runs]
+
+        case_ids = list(
+            Result.everything.filter(
+                id__gt=watermark.last_id,
+                id__lte=last,
+                runcaseversion__run__in=recent,
+                ).values_list(
+                    "runcaseversion__caseversion__case", flat=True,
+                    ).distinct().order_by()
+            )
+
+        stored = 0
+        for i in range(0, len(case_ids), chunk_size):
+            chunk = case_ids[i:i + chunk_size]
+            # a case needs two builds in a series to have flipped there
+            rows = [
+                cls(
+                    case_id=case_id,
+                    environment_id=env_id,
+                    score=float(flips) / (count - series),
+                    flips=flips,
+                    builds=count,
+                    )
+                for (case_id, env_id), (flips, count, series)
+                in cls._flips(chunk, recent).items()
+                if count > series
+                ]
+            cls.objects.filter(case__in=chunk).delete()
+            cls.objects.bulk_create(rows)
+            stored += len(rows)
+
+        watermark.last_id = last
+        watermark.save()
+        return stored
+
+
+    @classmethod
+    def _flips(cls, case_ids, run_ids):
+        """
+        Return flips of given cases in given runs, per case and environment.
+
+        Returns a dictionary mapping (case id, env id) to a tuple of (number
+        of flips, number of builds with a result, number of series).
+
+        """
+        builds = {}
+        for series_id, start, run_id, case_id, env_id, status in (
+                LatestResult.objects.filter(
+                    runcaseversion__run__in=run_ids,
+                    runcaseversion__caseversion__case__in=case_ids,
+                    runcaseversion__deleted_on__isnull=True,
+                    result__deleted_on__isnull=True,
+                    status__in=[Result.STATUS.passed] + Result.FAILED_STATES,
+                    ).values_list(
+                        "runcaseversion__run__series",
+                        "runcaseversion__run__start",
+                        "runcaseversion__run",
+                        "runcaseversion__caseversion__case",
+                        "environment",
+                        "status",
+                        ).distinct().order_by()):
+            key = (case_id, env_id, series_id, start, run_id)
+            builds[key] = builds.get(key, False) or (
+                status in Result.FAILED_STATES)
+
+        scores = {}
+        previous = None
+        for key in sorted(builds):
+            case_env, series = key[:2], key[:3]
+            flips, count, num_series = scores.get(case_env, (0, 0, 0))
+            if previous is not None and previous[0] == series:
+                flips += int(previous[1] != builds[key])
+            else:
+                num_series += 1
+            scores[case_env] = (flips, count + 1, num_series)
+            previous = (series, builds[key])
+        return scores
+
+
+
+def step_map(caseversion_ids):
+    """
+    Map each given caseversion id to a dict of its steps keyed by number.
+
+    """
+    steps = dict((cv_id, {}) for cv_id in caseversion_ids)
+    for step in CaseStep.objects.filter(caseversion__in=caseversion_ids):
+        steps[step.caseversion_id][step.number] = step
+    return steps
+
+
+
+def result_summary(latestresults):
+    """
+    Given a queryset of LatestResults, return a dict summarizing their states.
 
     """
     states = Result.COMPLETED_STATES
+    summary = dict((s, 0) for s in states)
+    summary.update(
+        latestresults.filter(
+            result__deleted_on__isnull=True, status__in=states).values_list(
+            "status").annotate(Count("id")).order_by()
+        )
+    return summary
+
 
-    result_ids = results.filter(is_latest=True).values_list("id", flat=True)
 
-    if not result_ids:
-        return dict((s, 0) for s in states)
+def run_completion(runs, environment=None):
+    """
+    Return dict mapping run ID to completion fraction for each of ``runs``.
+
+    Completion is the fraction of (not skipped) case/env combos in the run
+    that have a completed latest result. If ``environment`` (an Environment
+    or its ID) is given, only combos in that environment are considered.
+    Computed for all given runs in a single grouped query.
+
+    """
+    return _completion("run_id", runs, environment)
+
 
-    cols = ["COUNT(CASE WHEN status=%s THEN 1 ELSE NULL END)"] * len(states)
-    sql = "SELECT {0} FROM {1} WHERE id IN ({2})".format(
-        ",".join(cols), Result._meta.db_table, ",".join(map(str, result_ids))
+
+def runcaseversion_completion(runcaseversions):
+    """
+    Return dict mapping runcaseversion ID to completion fraction.
+
+    Completion is the fraction of (not skipped) environments of the
+    runcaseversion that have a completed latest result. Computed for all given
+    runcaseversions in a single grouped query.
+
+    """
+    return _completion("id", runcaseversions)
+
+
+
+def update_completion(runs=(), runcaseversions=()):
+    """
+    Recompute stored ``completion_cache`` of given runs and runcaseversions.
+
+    ``runs`` and ``runcaseversions`` are iterables of instances or IDs. Rows
+    are updated in bulk, one query per distinct completion value, and without
+    touching modification tracking or concurrency versions; rows already
+    storing the right value aren't written (or locked) at all. The counts of
+    completed and countable combos stored on runs are recomputed too.
+
+    """
+    by_value = {}
+    for run_id, (completed, countable) in _completion_counts(
+            "run_id", runs).items():
+        by_value.setdefault(
+            (_fraction(completed, countable), completed, countable), []
+            ).append(run_id)
+    for (completion, completed, countable), ids in by_value.items():
+        Run._base_manager.filter(id__in=ids).exclude(
+            completion_cache=completion,
+            completion_done=completed,
+            completion_total=countable,
+            ).update(
+                completion_cache=completion,
+                completion_done=completed,
+                completion_total=countable,
+                )
+
+    by_value = {}
+    for obj_id, completion in runcaseversion_completion(
+            runcaseversions).items():
+        by_value.setdefault(completion, []).append(obj_id)
+    for completion, ids in by_value.items():
+        RunCaseVersion._base_manager.filter(id__in=ids).exclude(
+            completion_cache=completion).update(
+            completion_cache=completion)
+
+
+
+def combo_completion(combos):
+    """
+    Return the contribution of given case/env combos to run completion.
+
+    ``combos`` is an iterable of (runcaseversion ID, environment ID) tuples.
+    Returns a dict mapping each combo that counts towards completion (its
+    runcaseversion isn't deleted, and has that environment) to a tuple of
+    (run ID, 1 if completed else 0, 1 less the number of its skipped latest
+    results), in a single grouped query.
+
+    """
+    combos = set(combos)
+    if not combos:
+        return {}
+    rcv_ids = sorted(set(c[0] for c in combos))
+    env_ids = sorted(set(c[1] for c in combos))
+
+    sql = """SELECT rcve.runcaseversion_id, rcve.environment_id, rcv.run_id,
+            COALESCE(MAX(CASE WHEN lr.status IN ({states}) THEN 1 ELSE 0 END),
+                0),
+            COALESCE(SUM(CASE WHEN lr.status = %s THEN 1 ELSE 0 END), 0)
+        FROM execution_runcaseversion_environments as rcve
+            INNER JOIN execution_runcaseversion as rcv
+                ON rcv.id = rcve.runcaseversion_id
+            LEFT OUTER JOIN (
+                SELECT lr.runcaseversion_id, lr.environment_id, lr.status
+                FROM execution_latestresult as lr
+                    INNER JOIN execution_result as res
+                        ON res.id = lr.result_id
+                WHERE res.deleted_on IS NULL
+                    AND lr.runcaseversion_id IN ({rcv_ids})
+                ) as lr
+                ON lr.runcaseversion_id = rcve.runcaseversion_id
+                AND lr.environment_id = rcve.environment_id
+        WHERE rcv.deleted_on IS NULL
+            AND rcve.runcaseversion_id IN ({rcv_ids})
+            AND rcve.environment_id IN ({env_ids})
+        GROUP BY rcve.runcaseversion_id, rcve.environment_id, rcv.run_id
+        """.format(
+        states=", ".join(["%s"] * len(Result.COMPLETED_STATES)),
+        rcv_ids=", ".join(["%s"] * len(rcv_ids)),
+        env_ids=", ".join(["%s"] * len(env_ids)),
+        )
+    params = (
+        Result.COMPLETED_STATES + [Result.STATUS.skipped] +
+        rcv_ids + rcv_ids + env_ids
         )
 
     cursor = connection.cursor()
-    cursor.execute(sql, states)
+    cursor.execute(sql, params)
+    return dict(
+        ((rcv_id, env_id), (run_id, int(completed), 1 - int(skipped)))
+        for rcv_id, env_id, run_id, completed, skipped in cursor.fetchall()
+        if (rcv_id, env_id) in combos
+        )
+
+
+
+def update_combo_completion(combos, before):
+    """
+    Update stored completion for changes to case/env ``combos``.
+
+    ``before`` is what ``combo_completion`` returned for the combos before
+    their results (or environments) changed. Each run's stored counts are
+    adjusted by the difference, and its ``completion_cache`` recomputed from
+    them, in one UPDATE per affected run without reading the rest of the
+    run; completion of the affected runcaseversions (a few combos each) is
+    recomputed. Runs and runcaseversions whose combos didn't change aren't
+    written.
+
+    """
+    after = combo_completion(combos)
+    deltas = {}
+    changed = set()
+    for combo in set(before).union(after):
+        run_id = (before.get(combo) or after.get(combo))[0]
+        # a combo that doesn't count contributes nothing
+        old = before.get(combo, (run_id, 0, 0))
+        new = after.get(combo, (run_id, 0, 0))
+        if old != new:
+            completed, countable = deltas.get(run_id, (0, 0))
+            deltas[run_id] = (
+                completed + new[1] - old[1], countable + new[2] - old[2])
+            changed.add(combo[0])
+
+    cursor = connection.cursor()
+    for run_id, (completed, countable) in sorted(deltas.items()):
+        if not (completed or countable):
+            continue
+        # completion_cache is set first: MySQL evaluates the assignments in
+        # order, with the new values, where PostgreSQL uses the old ones
+        cursor.execute(
+            """UPDATE execution_run SET
+                completion_cache = CASE
+                    WHEN completion_total + %s = 0 THEN 0
+                    ELSE (completion_done + %s) * 1E0 / (completion_total + %s)
+                    END,
+                completion_done = completion_done + %s,
+                completion_total = completion_total + %s
+            WHERE id = %s
+            """,
+            [countable, completed, countable, completed, countable, run_id],
+            )
+        transaction.set_dirty()
+    update_completion(runcaseversions=changed)
+
+
+
+def _refresh_live_runs(querysets, summaries=False):
+    """
+    Recompute completion of runcaseversions in ``querysets`` and their runs.
+
+    With ``summaries=True``, the runs' result summaries are rebuilt too. Runs
+    that are deleted are skipped: their summaries and completion stay as
+    they were when they were deleted, and are right again if undeleted.
+
+    """
+    affected = set()
+    for rcvs in querysets:
+        affected.update(
+            rcvs.filter(run__deleted_on__isnull=True).values_list(
+                "id", "run").order_by())
+    if not affected:
+        return
+    run_ids = set(run_id for rcv_id, run_id in affected)
+    if summaries:
+        ResultSummary.rebuild(runs=run_ids)
+    update_completion(
+        runs=run_ids,
+        runcaseversions=set(rcv_id for rcv_id, run_id in affected),
+        )
+
+
 
-    return dict(zip(states, cursor.fetchone()))
+def _fraction(completed, countable):
+    """Return completion fraction for given combo counts."""
+    try:
+        return float(completed) / countable
+    except ZeroDivisionError:
+        return 0.0
+
+
+
+def _completion(key, objs, environment=None):
+    """
+    Return dict mapping IDs of ``objs`` to completion fraction.
+
+    ``key`` is the column of ``execution_runcaseversion`` that ``objs`` IDs are
+    found in, and by which case/env combos are grouped. Skipped results count
+    against the total rather than towards completion.
+
+    """
+    return dict(
+        (obj_id, _fraction(completed, countable))
+        for obj_id, (completed, countable) in _completion_counts(
+            key, objs, environment).items()
+        )
+
+
+
+def _completion_counts(key, objs, environment=None):
+    """
+    Return dict mapping IDs of ``objs`` to (completed, countable) combos.
+
+    As for ``_completion``; countable combos are those not skipped.
+
+    """
+    ids = sorted(set(getattr(o, "id", o) for o in objs))
+    counts = dict((i, (0, 0)) for i in ids)
+    if not ids:
+        return counts
+
+    id_params = ", ".join(["%s"] * len(ids))
+    env_clause = ""
+    env_params = []
+    if environment is not None:
+        env_clause = "AND {0}.environment_id = %s"
+        env_params = [getattr(environment, "id", environment)]
+
+    sql = """SELECT rcv.{key}, COUNT(*),
+            COALESCE(SUM(r.skipped), 0), COALESCE(SUM(r.completed), 0)
+        FROM execution_runcaseversion_environments as rcve
+            INNER JOIN execution_runcaseversion as rcv
+                ON rcv.id = rcve.runcaseversion_id
+            LEFT OUTER JOIN (
+                SELECT lr.runcaseversion_id, lr.environment_id,
+                    SUM(CASE WHEN lr.status = %s THEN 1 ELSE 0 END)
+                        as skipped,
+                    MAX(CASE WHEN lr.status IN ({states}) THEN 1 ELSE 0 END)
+                        as completed
+                FROM execution_latestresult as lr
+                    INNER JOIN execution_result as res
+                        ON res.id = lr.result_id
+                    INNER JOIN execution_runcaseversion as rrcv
+                        ON rrcv.id = lr.runcaseversion_id
+                WHERE res.deleted_on IS NULL
+                    AND rrcv.{key} IN ({ids})
+                    {res_env}
+                GROUP BY lr.runcaseversion_id, lr.environment_id
+                ) as r
+                ON r.runcaseversion_id = rcve.runcaseversion_id
+                AND r.environment_id = rcve.environment_id
+        WHERE rcv.deleted_on IS NULL
+            AND rcv.{key} IN ({ids})
+            {rcve_env}
+        GROUP BY rcv.{key}
+        """.format(
+        key=key,
+        ids=id_params,
+        states=", ".join(["%s"] * len(Result.COMPLETED_STATES)),
+        res_env=env_clause.format("lr"),
+        rcve_env=env_clause.format("rcve"),
+        )
+    params = (
+        [Result.STATUS.skipped] + Result.COMPLETED_STATES +
+        ids + env_params + ids + env_params
+        )
+
+    cursor = connection.cursor()
+    cursor.execute(sql, params)
+    for obj_id, total, skipped, completed in cursor.fetchall():
+        counts[obj_id] = (int(completed), total - int(skipped))
+    return counts
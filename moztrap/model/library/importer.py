@@ -268,17 +268,19 @@ class CaseImporter(object):
         Instruction is a required field for a step, but expected is optional.
 
         """
-
-        for step_num, new_step in enumerate(step_data):
-            try:
-                casestep = CaseStep.objects.create(
+        try:
+            steps = [
+                CaseStep(
                     caseversion=caseversion,
                     number=step_num + 1,
                     instruction=new_step["instruction"],
                     expected=new_step.get("expected", ""),
                     )
-            except KeyError:
-                raise ValueError(ImportResult.SKIP_STEP_NO_INSTRUCTION)
+                for step_num, new_step in enumerate(step_data)
+                ]
+        except KeyError:
+            raise ValueError(ImportResult.SKIP_STEP_NO_INSTRUCTION)
+        CaseStep.objects.bulk_create(steps)
 
 
 
@@ -506,8 +508,12 @@ class SuiteImporter(object):
 
             # now add any cases the suite may have specified
             if "cases" in suite_data:
-                for case in suite_data["cases"]:
-                    SuiteCase.objects.create(case=case, suite=suite)
+                SuiteCase.objects.bulk_create(
+                    [
+                        SuiteCase(case=case, suite=suite)
+                        for case in suite_data["cases"]
+                        ]
+                    )
 
         # we have imported (or warned on) these items, so reset map.
         self.map.clear()
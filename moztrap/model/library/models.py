@@ -14,6 +14,13 @@ from ..tags.models import Tag
 
 
 
+def _record_lock_change(**kwargs):
+    """Record a change that runs' locked-in runcaseversions may need."""
+    from ..execution.models import LockChange
+    LockChange.record(**kwargs)
+
+
+
 class Case(MTModel):
     """A test case for a given product."""
     product = models.ForeignKey(Product, related_name="cases")
@@ -25,10 +32,25 @@ class Case(MTModel):
         return "case #%s" % (self.id,)
 
 
-    def clone(self, *args, **kwargs):
+    def clone_defaults(self, cascade, overrides):
         """Clone this Case with default cascade behavior: latest versions."""
-        kwargs.setdefault("cascade", ["versions"])
-        return super(Case, self).clone(*args, **kwargs)
+        if cascade is None:
+            cascade = ["versions"]
+        return super(Case, self).clone_defaults(cascade, overrides)
+
+
+    def delete(self, *args, **kwargs):
+        """Delete, recording the change for runs including this case."""
+        counts = super(Case, self).delete(*args, **kwargs)
+        _record_lock_change(cases=[self.id])
+        return counts
+
+
+    def undelete(self, *args, **kwargs):
+        """Undelete, recording the change for runs including this case."""
+        counts = super(Case, self).undelete(*args, **kwargs)
+        _record_lock_change(cases=[self.id])
+        return counts
 
 
     def set_latest_version(self, update_instance=None):
@@ -131,24 +153,29 @@ class CaseVersion(MTModel, DraftStatusModel, HasEnvironmentsModel):
                         skip_sync_name=True,
                         skip_set_latest=True,
                         )
+            _record_lock_change(cases=[self.case_id])
 
 
 
     def delete(self, *args, **kwargs):
         """Delete CaseVersion, updating latest version."""
-        super(CaseVersion, self).delete(*args, **kwargs)
+        counts = super(CaseVersion, self).delete(*args, **kwargs)
+        _record_lock_change(cases=[self.case_id])
         if not self.case.versions.count():
             # we just deleted the last version for this case, so delete
             # the case as well
             self.case.delete(*args, **kwargs)
         else:
             self.case.set_latest_version()
+        return counts
 
 
     def undelete(self, *args, **kwargs):
         """Undelete CaseVersion, updating latest version."""
-        super(CaseVersion, self).undelete(*args, **kwargs)
+        counts = super(CaseVersion, self).undelete(*args, **kwargs)
         self.case.set_latest_version()
+        _record_lock_change(cases=[self.case_id])
+        return counts
 
 
     def clean(self):
@@ -186,10 +213,7 @@ class CaseVersion(MTModel, DraftStatusModel, HasEnvironmentsModel):
         cloned and the cloned CaseVersion will be assigned to that new case.
 
         """
-        kwargs.setdefault(
-            "cascade", ["steps", "attachments", "tags", "environments"])
         overrides = kwargs.setdefault("overrides", {})
-        overrides.setdefault("name", u"Cloned: {0}".format(self.name))
         if "productversion" not in overrides and "case" not in overrides:
             overrides["case"] = self.case.clone(cascade=[])
             suitecases = SuiteCase.objects.filter(case=self.case)
@@ -207,6 +231,31 @@ class CaseVersion(MTModel, DraftStatusModel, HasEnvironmentsModel):
         return super(CaseVersion, self).clone(*args, **kwargs)
 
 
+    def clone_defaults(self, cascade, overrides):
+        """Cascade steps, attachments, tags and environments; "Cloned:" name."""
+        if cascade is None:
+            cascade = ["steps", "attachments", "tags", "environments"]
+        cascade, overrides = super(CaseVersion, self).clone_defaults(
+            cascade, overrides)
+        overrides.setdefault("name", u"Cloned: {0}".format(self.name))
+        return cascade, overrides
+
+
+    @classmethod
+    def bulk_created(cls, objs):
+        """Update latest versions of the cases of new versions, in bulk."""
+        case_ids = set(cv.case_id for cv in objs)
+        # as ``Case.set_latest_version``, for all the cases at once
+        latest = dict(
+            cls.objects.filter(case__in=case_ids).order_by(
+                "productversion__order").values_list("case", "id"))
+        cls.objects.filter(case__in=case_ids).exclude(
+            pk__in=latest.values()).update(latest=False, notrack=True)
+        cls.objects.filter(pk__in=latest.values()).update(
+            latest=True, notrack=True)
+        _record_lock_change(cases=case_ids)
+
+
     @property
     def parent(self):
         return self.productversion
@@ -224,6 +273,19 @@ class CaseVersion(MTModel, DraftStatusModel, HasEnvironmentsModel):
         self.save()
 
 
+    def add_envs(self, *envs):
+        """Add environments, recording the change for runs' next refresh."""
+        super(CaseVersion, self).add_envs(*envs)
+        _record_lock_change(cases=[self.case_id])
+
+
+    @classmethod
+    def _remove_envs(cls, objs, envs):
+        """Remove environments, recording the change for runs."""
+        super(CaseVersion, cls)._remove_envs(objs, envs)
+        _record_lock_change(cases=[cv.case_id for cv in objs])
+
+
     @classmethod
     def cascade_envs_to(cls, objs, adding):
         RunCaseVersion = cls.runcaseversions.related.model
@@ -236,17 +298,8 @@ class CaseVersion(MTModel, DraftStatusModel, HasEnvironmentsModel):
 
     def bug_urls(self):
         """Returns set of bug URLs associated with this caseversion."""
-        Result = self.runcaseversions.model.results.related.model
-        StepResult = Result.stepresults.related.model
         return set(
-            StepResult.objects.only(
-                "bug_url",
-                "deleted_on",
-                "result_id",
-                ).filter(
-                    result__runcaseversion__caseversion=self).exclude(
-                        bug_url="").values_list("bug_url", flat=True).distinct()
-            )
+            self.bugurls.values_list("bug_url", flat=True).distinct())
 
 
 
@@ -312,13 +365,35 @@ class Suite(MTModel, DraftStatusModel):
         return self.name
 
 
-    def clone(self, *args, **kwargs):
+    def clone_defaults(self, cascade, overrides):
         """Clone this Suite with default cascade behavior."""
-        kwargs.setdefault("cascade", ["suitecases"])
-        overrides = kwargs.setdefault("overrides", {})
+        if cascade is None:
+            cascade = ["suitecases"]
+        cascade, overrides = super(Suite, self).clone_defaults(
+            cascade, overrides)
         overrides["status"] = self.STATUS.draft
         overrides.setdefault("name", "Cloned: {0}".format(self.name))
-        return super(Suite, self).clone(*args, **kwargs)
+        return cascade, overrides
+
+
+    def save(self, *args, **kwargs):
+        """Save, recording the change for runs including this suite."""
+        super(Suite, self).save(*args, **kwargs)
+        _record_lock_change(suites=[self.id])
+
+
+    def delete(self, *args, **kwargs):
+        """Delete, recording the change for runs including this suite."""
+        counts = super(Suite, self).delete(*args, **kwargs)
+        _record_lock_change(suites=[self.id])
+        return counts
+
+
+    def undelete(self, *args, **kwargs):
+        """Undelete, recording the change for runs including this suite."""
+        counts = super(Suite, self).undelete(*args, **kwargs)
+        _record_lock_change(suites=[self.id])
+        return counts
 
 
     class Meta:
@@ -340,6 +415,32 @@ class SuiteCase(MTModel):
             ("manage_suite_cases", "Can add/remove cases from suites.")]
 
 
+    def save(self, *args, **kwargs):
+        """Save, recording the change to the suite."""
+        super(SuiteCase, self).save(*args, **kwargs)
+        _record_lock_change(suites=[self.suite_id])
+
+
+    @classmethod
+    def bulk_created(cls, objs):
+        """Record the change to the suites of new suitecases."""
+        _record_lock_change(suites=set(sc.suite_id for sc in objs))
+
+
+    def delete(self, *args, **kwargs):
+        """Delete, recording the change to the suite."""
+        counts = super(SuiteCase, self).delete(*args, **kwargs)
+        _record_lock_change(suites=[self.suite_id])
+        return counts
+
+
+    def undelete(self, *args, **kwargs):
+        """Undelete, recording the change to the suite."""
+        counts = super(SuiteCase, self).undelete(*args, **kwargs)
+        _record_lock_change(suites=[self.suite_id])
+        return counts
+
+
     def clean(self):
         """
         Validate uniqueness of suite/case combo.
@@ -65,6 +65,7 @@ class MTModelAdmin(admin.ModelAdmin):
         "modified_by",
         "deleted_on",
         "deleted_by",
+        "deletion_batch",
         "cc_version",
         ]
     actions = ["delete", "undelete", "delete_selected"]
@@ -72,14 +73,23 @@ class MTModelAdmin(admin.ModelAdmin):
 
     def delete(self, request, queryset):
         """Admin action to soft-delete objects."""
-        queryset.delete(user=request.user)
+        counts = queryset.delete(user=request.user)
+        self.message_user(request, u"Deleted {0}.".format(_counts(counts)))
     delete.short_description = (
         u"Delete selected %(verbose_name_plural)s")
 
 
     def undelete(self, request, queryset):
-        """Admin action to undelete objects."""
-        queryset.undelete(user=request.user)
+        """
+        Admin action to undelete objects.
+
+        Objects deleted together (and their dependents) are undeleted by
+        deletion batch, without visiting each dependent, so this is fast even
+        for large querysets.
+
+        """
+        counts = queryset.undelete(user=request.user)
+        self.message_user(request, u"Undeleted {0}.".format(_counts(counts)))
     undelete.short_description = (
         u"Undelete selected %(verbose_name_plural)s")
 
@@ -127,6 +137,7 @@ class MTModelAdmin(admin.ModelAdmin):
 
         delete_fields = [
             ("deleted_on", "deleted_by"),
+            ("deletion_batch",),
             ]
 
         fieldsets = super(MTModelAdmin, self).get_fieldsets(
@@ -149,6 +160,23 @@ class MTModelAdmin(admin.ModelAdmin):
         return fieldsets
 
 
+
+def _counts(counts):
+    """Return e.g. "1 product, 2 suites" for dict of counts by model."""
+    if not counts:
+        return u"nothing"
+    names = sorted(
+        (
+            unicode(model._meta.verbose_name if count == 1
+                    else model._meta.verbose_name_plural),
+            count,
+            )
+        for model, count in counts.items()
+        )
+    return u", ".join(u"{0} {1}".format(count, name) for name, count in names)
+
+
+
 class TeamModelAdmin(MTModelAdmin):
     def get_fieldsets(self, *args, **kwargs):
         """
@@ -235,6 +263,7 @@ class MTInlineModelAdmin(object):
         "modified_by",
         "deleted_on",
         "deleted_by",
+        "deletion_batch",
         ]
 
     readonly_fields = ["exists"]
@@ -6,9 +6,9 @@ creation, modification, and soft-deletion.
 
 """
 import datetime
+import uuid
 
-from django.db import models, router
-from django.db.models.deletion import Collector
+from django.db import connections, models, router, transaction
 from django.db.models.query import QuerySet
 from django.db.models.signals import class_prepared
 
@@ -28,50 +28,517 @@ def utcnow():
 
 
 
-class SoftDeleteCollector(Collector):
+# number of rows selected or updated at once by a soft-delete cascade
+DELETE_CHUNK_SIZE = 1000
+
+# number of objects written by each UPDATE of a tracked bulk update
+UPDATE_CHUNK_SIZE = 500
+
+
+
+class SoftDeleteCascade(object):
     """
-    A variant of Django's default delete-cascade collector that implements soft
-    delete.
+    Soft-deletes or undeletes the rows of a queryset, and their dependents.
+
+    Follows the relations Django's delete cascade does (reverse foreign keys
+    with ``on_delete=CASCADE``), without loading model instances: rows are
+    selected ``chunk_size`` primary keys at a time and each chunk is updated
+    with one UPDATE. Dependents with no dependents of their own are updated
+    by foreign key, with one UPDATE per chunk of their parents. Rows of
+    models that aren't soft-deletable (e.g. denormalized summary tables) are
+    left alone; soft-deletable models keeping such tables current are told
+    which of their rows changed through ``MTModel.deletion_cascaded``.
 
     """
-    def collect(self, objs, *args, **kwargs):
+    def __init__(self, queryset, chunk_size=DELETE_CHUNK_SIZE):
+        """Cascade from rows of ``queryset``, ``chunk_size`` at a time."""
+        self.queryset = queryset
+        self.chunk_size = chunk_size
+
+
+    def delete(self, user=None):
         """
-        Collect ``objs`` and dependent objects.
+        Soft-delete all rows and their dependents.
 
-        We override in order to store "root" objects for undelete.
+        Rows that were already deleted keep their deletion time and user. All
+        rows deleted are marked with the same new deletion batch ID. Returns a
+        dictionary mapping each model to its number of rows deleted.
 
         """
-        if kwargs.get("source", None) is None:
-            self.root_objs = objs
-        super(SoftDeleteCollector, self).collect(objs, *args, **kwargs)
+        batch = uuid.uuid4().hex
+        self._changed_rows = {}
+        counts = self._cascade(
+            lambda qs: qs.filter(deleted_on__isnull=True),
+            {
+                "deleted_on": utcnow(),
+                "deleted_by": user,
+                "deletion_batch": batch,
+                },
+            # rows deleted by this cascade have had their dependents deleted
+            lambda qs: qs.exclude(deletion_batch=batch),
+            )
+        self._notify()
+        return counts
 
 
-    def delete(self, user=None):
+    def undelete(self, user=None):
         """
-        Soft-delete all collected instances.
+        Undelete all rows, and dependents deleted along with them.
+
+        Only dependents deleted in the same batch as one of the rows are
+        undeleted. A batch whose deletion started from (all of) these rows is
+        undeleted with one indexed UPDATE per soft-deletable model the rows
+        cascade to, without visiting any rows; for other batches the cascade
+        is followed from the rows, within their batch. Rows deleted before
+        batches were recorded are matched to dependents by deletion time.
+        Returns a dictionary mapping each model to its number of rows
+        undeleted.
 
         """
-        now = utcnow()
-        for model, instances in self.data.iteritems():
-            pk_list = [obj.pk for obj in instances]
-            model._base_manager.filter(
-                pk__in=pk_list, deleted_on__isnull=True).update(
-                deleted_by=user, deleted_on=now)
+        batches = set(
+            self.queryset.filter(deleted_on__isnull=False).values_list(
+                "deletion_batch", flat=True).distinct().order_by())
+        counts = {}
+        self._changed_rows = {}
+        if None in batches:
+            batches.discard(None)
+            counts = self._undelete_unbatched()
+        partial = self._partial_batches(batches)
+        whole = batches - partial
+        if whole:
+            model = self.queryset.model
+            for mtmodel in [model] + [
+                    m for m in _cascade_closure(model)
+                    if issubclass(m, MTModel) and m is not model]:
+                batch_rows = mtmodel._base_manager.using(
+                    self.queryset.db).filter(deletion_batch__in=whole)
+                if _notified(mtmodel):
+                    # the batch is cleared, so find the rows beforehand
+                    for pks in self._pages(
+                            batch_rows.values_list("pk", flat=True)):
+                        self._record(mtmodel, models.Q(pk__in=pks))
+                rows = batch_rows.update(
+                    deleted_on=None, deleted_by=None, deletion_batch=None)
+                if rows:
+                    counts[mtmodel] = counts.get(mtmodel, 0) + rows
+        if partial:
+            for mtmodel, rows in self._cascade(
+                    lambda qs: qs.filter(deletion_batch__in=partial),
+                    {"deleted_on": None, "deleted_by": None,
+                     "deletion_batch": None},
+                    lambda qs: qs,
+                    queryset=self.queryset.filter(deletion_batch__in=partial),
+                    ).items():
+                counts[mtmodel] = counts.get(mtmodel, 0) + rows
+        self._notify()
+        return counts
+
+
+    def _partial_batches(self, batches):
+        """
+        Return the set of ``batches`` not deleted starting from these rows.
 
+        That's batches that also deleted rows of the same model outside the
+        queryset, or rows of any model cascading to it.
 
-    def undelete(self, user=None):
         """
-        Undelete all collected instances that were deleted.
+        if not batches:
+            return set()
+        model = self.queryset.model
+        db = self.queryset.db
+        partial = set(
+            model._base_manager.using(db).filter(
+                deletion_batch__in=batches).exclude(
+                    pk__in=self.queryset.values("pk")).values_list(
+                        "deletion_batch", flat=True).distinct().order_by())
+        for parent in _cascade_parents(model):
+            if issubclass(parent, MTModel) and parent is not model:
+                partial.update(
+                    parent._base_manager.using(db).filter(
+                        deletion_batch__in=batches).values_list(
+                            "deletion_batch", flat=True).distinct().order_by())
+        return partial & batches
+
+
+    def _undelete_unbatched(self):
+        """Undelete rows deleted without a batch, matching deletion times."""
+        queryset = self.queryset.filter(
+            deleted_on__isnull=False, deletion_batch__isnull=True)
+        deletion_times = list(
+            queryset.values_list("deleted_on", flat=True).distinct().order_by())
+        return self._cascade(
+            lambda qs: qs.filter(
+                deleted_on__in=deletion_times, deletion_batch__isnull=True),
+            {"deleted_on": None, "deleted_by": None},
+            lambda qs: qs,
+            queryset=queryset,
+            )
+
+
+    def _cascade(self, changed, values, unvisited, queryset=None):
+        """
+        Update given rows and their dependents; return counts by model.
+
+        ``changed`` and ``unvisited`` take a queryset of a soft-deletable
+        model and return the rows to update with ``values``, and the rows
+        whose dependents are still to be updated, respectively. The cascade
+        starts from rows of ``queryset`` (by default, all the rows).
+
+        """
+        if queryset is None:
+            queryset = self.queryset
+        self._changed = changed
+        self._values = values
+        self._unvisited = unvisited
+        self._counts = {}
+        self._seen = {}
+        for pks in self._chunks(queryset):
+            self._update(queryset.model, pks)
+        return self._counts
+
+
+    def _update(self, model, pks):
+        """Update rows of ``model`` with given pks, then their dependents."""
+        if issubclass(model, MTModel):
+            rows = self._changed(
+                model._base_manager.using(self.queryset.db).filter(
+                    pk__in=pks)).update(**self._values)
+            self._count(model, rows)
+            if rows:
+                self._record(model, models.Q(pk__in=pks))
+        for related_model, field_name in _cascades(model)[0]:
+            lookup = {"{0}__in".format(field_name): pks}
+            dependents = related_model._base_manager.using(
+                self.queryset.db).filter(**lookup)
+            if _cascades(related_model)[0]:
+                for dependent_pks in self._chunks(dependents):
+                    self._update(related_model, dependent_pks)
+            elif issubclass(related_model, MTModel):
+                rows = self._changed(dependents).update(**self._values)
+                self._count(related_model, rows)
+                if rows:
+                    self._record(related_model, models.Q(**lookup))
+
+
+    def _chunks(self, queryset):
+        """
+        Generate lists of up to ``chunk_size`` pks of rows still to visit.
+
+        Pks are read ``chunk_size`` at a time in pk order, by keyset, so the
+        dependents of a chunk are never all held in memory at once either.
+        Rows of models that can depend on themselves are each visited only
+        once, so a cascade can't loop.
+
+        """
+        model = queryset.model
+        if issubclass(model, MTModel):
+            queryset = self._unvisited(queryset)
+        seen = None
+        if _cascades(model)[1]:
+            seen = self._seen.setdefault(model, set())
+        for pks in self._pages(queryset.values_list("pk", flat=True)):
+            if seen is not None:
+                pks = [pk for pk in pks if pk not in seen]
+                seen.update(pks)
+            if pks:
+                yield pks
+
+
+    def _pages(self, queryset):
+        """Generate lists of ``chunk_size`` values of ``queryset``, by pk."""
+        queryset = queryset.order_by("pk")
+        last = None
+        while True:
+            page = queryset if last is None else queryset.filter(pk__gt=last)
+            pks = list(page[:self.chunk_size])
+            if pks:
+                yield pks
+            if len(pks) < self.chunk_size:
+                return
+            last = pks[-1]
+
+
+    def _count(self, model, rows):
+        """Add ``rows`` to the count of rows updated for ``model``."""
+        if rows:
+            self._counts[model] = self._counts.get(model, 0) + rows
+
+
+    def _record(self, model, q):
+        """Remember that rows of ``model`` matching ``q`` may have changed."""
+        if _notified(model):
+            self._changed_rows.setdefault(model, []).append(q)
+
+
+    def _notify(self):
+        """Tell each model with changed rows which rows those are."""
+        db = self.queryset.db
+        for model, qs in self._changed_rows.items():
+            model.deletion_cascaded(
+                [model._base_manager.using(db).filter(q) for q in qs])
+        self._changed_rows = {}
+
+
+
+def _notified(model):
+    """Return True if ``model`` wants to know of rows a cascade changes."""
+    return (
+        getattr(model.deletion_cascaded, "__func__", None) is not
+        MTModel.deletion_cascaded.__func__
+        )
+
+
+
+# cascade relations and whether cyclic, by model; see ``_cascades``
+_CASCADES = {}
+
+def _cascades(model):
+    """
+    Return (list of (model, field name) cascading from ``model``, is cyclic).
+
+    The list is of foreign keys with ``on_delete=CASCADE`` to ``model``
+    leading, directly or through further cascades, to soft-deletable models;
+    many-to-many through tables are left out. ``model`` is cyclic if its rows
+    can depend on rows of the same model.
+
+    """
+    if model not in _CASCADES:
+        relations = []
+        for related in _cascade_related(model):
+            reached = _cascade_closure(related.model) | set([related.model])
+            if any(issubclass(m, MTModel) for m in reached):
+                relations.append((related.model, related.field.name))
+        _CASCADES[model] = (relations, model in _cascade_closure(model))
+    return _CASCADES[model]
+
+
+
+def _cascade_related(model):
+    """Return related objects of foreign keys cascading from ``model``."""
+    return [
+        related
+        for related in model._meta.get_all_related_objects(include_hidden=True)
+        if not related.model._meta.auto_created
+        and related.field.rel.on_delete is models.CASCADE
+        ]
+
+
+
+# models cascading to each model; see ``_cascade_parents``
+_PARENTS = {}
+
+def _cascade_parents(model):
+    """Return set of all models ``model`` cascades from, directly or not."""
+    if model not in _PARENTS:
+        _PARENTS[model] = set(
+            m for m in models.get_models(include_auto_created=True)
+            if model in _cascade_closure(m)
+            )
+    return _PARENTS[model]
+
+
+
+def _cascade_closure(model):
+    """Return set of all models cascading, directly or not, from ``model``."""
+    closure = set()
+    pending = [model]
+    while pending:
+        for related in _cascade_related(pending.pop()):
+            if related.model not in closure:
+                closure.add(related.model)
+                pending.append(related.model)
+    return closure
+
+
+
+def _all(queryset):
+    """Return ``queryset``; the default filter of a cascade-cloned relation."""
+    return queryset
+
+
+
+class CloneCascade(object):
+    """
+    Clones an instance, and the related objects its clone cascades to.
+
+    The instance itself is cloned with ``save``. The cascade is then cloned a
+    level at a time: the related objects of all clones on one level are read
+    with one query per relation, and cloned with one bulk insert per relation
+    (their foreign keys pointing to the new clones on the level before); each
+    related object brings its own default cascade and overrides (see
+    ``MTModel.clone_defaults``) to the next level. Many-to-many relations are
+    copied with one insert of through rows per relation.
+
+    As bulk inserts bypass ``save``, models whose ``save`` does more than
+    write the row do the rest in ``MTModel.bulk_created``.
+
+    """
+    def __init__(self, user=None):
+        """Clone as ``user``."""
+        self.user = user
+        self.now = utcnow()
+
+
+    def clone(self, obj, cascade=None, overrides=None):
+        """Clone ``obj`` and its ``cascade``; return the new instance."""
+        cascade, overrides = obj.clone_defaults(cascade, overrides)
+        clone = self._copy(obj, overrides)
+        clone.save(force_insert=True)
+
+        level = [(obj, clone, _cascade_dict(cascade))]
+        replace = True
+        while level:
+            groups = {}
+            for source, new, relations in level:
+                for name, filter_func in relations.items():
+                    if name == "team" and isinstance(source, TeamModel):
+                        # an inherited ``team`` is the parent's; the clone
+                        # inherits it too, so only an own team is copied
+                        if not (source.has_team or source.parent is None):
+                            continue
+                        name = "own_team"
+                    groups.setdefault(
+                        (source.__class__, name, filter_func), []).append(
+                            (source, new))
+            level = []
+            for (model, name, filter_func), pairs in groups.items():
+                mgr = getattr(pairs[0][0], name)
+                if mgr.__class__.__name__ == "ManyRelatedManager":  # M2M
+                    self._clone_m2m(mgr, filter_func, pairs, replace)
+                elif mgr.__class__.__name__ == "RelatedManager":  # reverse FK
+                    level.extend(
+                        self._clone_related(
+                            getattr(model, name).related, filter_func, pairs))
+                else:
+                    raise ValueError(
+                        "Cannot cascade-clone '{0}'; "
+                        "not a many-to-many or reverse foreignkey.".format(
+                            name))
+            # only the instance cloned by ``save`` can have m2m rows already
+            replace = False
+
+        return clone
+
+
+    def _copy(self, obj, overrides):
+        """Return unsaved copy of ``obj``, with given field ``overrides``."""
+        overrides = dict(overrides)
+        for name in obj.denormalized_fields:
+            overrides[name] = obj._meta.get_field(name).get_default()
+        overrides["created_on"] = self.now
+        overrides["created_by"] = self.user
+        overrides["modified_on"] = self.now
+        overrides["modified_by"] = self.user
+
+        clone = obj.__class__()
+        for field in obj._meta.fields:
+            if field.primary_key:
+                continue
+            if field.name in overrides:
+                setattr(clone, field.name, overrides[field.name])
+            else:
+                # by attname, so related objects aren't loaded just to copy
+                setattr(clone, field.attname, getattr(obj, field.attname))
+        return clone
+
+
+    def _clone_related(self, related, filter_func, pairs):
+        """
+        Bulk-clone reverse-FK ``related`` objects of sources in ``pairs``.
+
+        ``pairs`` is a list of (source, clone) tuples. Returns a list of
+        (related object, its clone, its cascade) tuples.
+
+        """
+        model = related.model
+        fk = related.field
+        clones_by_source = dict((source.pk, new) for source, new in pairs)
+
+        planned = []
+        for obj in filter_func(
+                model.objects.filter(
+                    **{"{0}__in".format(fk.name): clones_by_source.keys()})):
+            cascade, overrides = obj.clone_defaults(
+                None, {fk.name: clones_by_source[getattr(obj, fk.attname)]})
+            planned.append(
+                (obj, self._copy(obj, overrides), _cascade_dict(cascade)))
+        if not planned:
+            return []
+
+        # tracking fields are already set on the clones
+        model.everything.bulk_create(
+            [new for obj, new, c in planned], notrack=True)
+        # bulk_create doesn't set primary keys; read them back in insert order
+        pks = model._base_manager.filter(
+            **{"{0}__in".format(fk.name): [
+                    new.pk for new in clones_by_source.values()]}).order_by(
+                        "pk").values_list("pk", flat=True)
+        for (obj, new, cascade), pk in zip(planned, pks):
+            new.pk = pk
+            new._loaded_values = new._field_values()
+        return planned
+
+
+    def _clone_m2m(self, mgr, filter_func, pairs, replace):
+        """
+        Copy many-to-many relation of sources in ``pairs`` to their clones.
+
+        ``mgr`` is the related manager of the relation for any of the
+        sources. Only related objects returned by ``filter_func`` (given a
+        queryset of all related objects of the sources) are copied. If
+        ``replace``, clones' existing relations are removed first.
 
         """
-        # timestamps on which root obj(s) were deleted; only cascade items also
-        # deleted in one of these same cascade batches should be undeleted.
-        deletion_times = set([o.deleted_on for o in self.root_objs])
-        for model, instances in self.data.iteritems():
-            pk_list = [obj.pk for obj in instances]
-            model._base_manager.filter(
-                pk__in=pk_list, deleted_on__in=deletion_times).update(
-                deleted_by=None, deleted_on=None)
+        through = mgr.through
+        source_field = "{0}_id".format(mgr.source_field_name)
+        target_field = "{0}_id".format(mgr.target_field_name)
+        clones_by_source = dict((source.pk, new.pk) for source, new in pairs)
+        targets = mgr.model._default_manager.all()
+        if issubclass(mgr.model, MTModel):
+            targets = targets.filter(deleted_on__isnull=True)
+        targets = filter_func(
+            targets.filter(
+                **{"{0}__in".format(mgr.query_field_name):
+                       clones_by_source.keys()}))
+
+        if replace:
+            through._default_manager.filter(
+                **{"{0}__in".format(source_field): clones_by_source.values()}
+                ).delete()
+        through._default_manager.bulk_create(
+            [
+                through(
+                    **{
+                        source_field: clones_by_source[source_id],
+                        target_field: target_id,
+                        }
+                    )
+                for source_id, target_id in through._default_manager.filter(
+                    **{
+                        "{0}__in".format(source_field): clones_by_source.keys(),
+                        "{0}__in".format(target_field): targets.values("pk"),
+                        }
+                    ).values_list(source_field, target_field)
+                ]
+            )
+
+
+
+def _cascade_dict(cascade):
+    """
+    Return dict mapping relation names to filter function for ``cascade``.
+
+    ``cascade`` is None, an iterable of relation names (all related objects
+    cloned), or already such a dictionary.
+
+    """
+    if cascade is None:
+        return {}
+    try:
+        cascade.iteritems
+    except AttributeError:
+        return dict((name, _all) for name in cascade)
+    return cascade
 
 
 
@@ -90,6 +557,121 @@ class MTQuerySet(QuerySet):
         return super(MTQuerySet, self).create(*args, **kwargs)
 
 
+    def bulk_create(self, objs, user=None, notrack=False):
+        """
+        Insert new ``objs`` in bulk, tracking creation by ``user``.
+
+        Creation and modification user and timestamp are set on each object
+        as saving it would, unless ``notrack=True``. As with the base
+        ``bulk_create``, primary keys of ``objs`` aren't set, and ``save`` isn't
+        called; the model's ``bulk_created`` is called instead.
+
+        """
+        if not notrack:
+            now = utcnow()
+            for obj in objs:
+                if user is not None:
+                    obj.created_by = user
+                # a preset modified_by is kept, as by ``save``
+                if obj.modified_by_id is None:
+                    obj.modified_by = user
+                obj.modified_on = now
+        objs = super(MTQuerySet, self).bulk_create(objs)
+        if objs:
+            self.model.bulk_created(objs)
+        return objs
+
+
+    def bulk_update(self, objs, fields, user=None, notrack=False,
+                    chunk_size=UPDATE_CHUNK_SIZE):
+        """
+        Write given ``fields`` of existing ``objs`` in batched UPDATEs.
+
+        Like ``save``, only objects whose ``cc_version`` is still current in
+        this queryset are written; their version is incremented and, unless
+        ``notrack=True``, modification by ``user`` is recorded. Objects are
+        written ``chunk_size`` at a time, each chunk with one locking read of
+        the current versions and one ``CASE`` UPDATE. As with
+        ``bulk_create``, ``save`` isn't called; the model's ``bulk_updated``
+        is called with the objects written instead. Returns the list of
+        objects not written because their row was changed (or deleted) since
+        they were loaded.
+
+        """
+        model = self.model
+        fields = [model._meta.get_field(name) for name in fields]
+        now = utcnow()
+        connection = connections[self.db]
+        qn = connection.ops.quote_name
+        pk = qn(model._meta.pk.column)
+        cursor = connection.cursor()
+        lost = []
+        written = []
+        for start in range(0, len(objs), chunk_size):
+            chunk = objs[start:start + chunk_size]
+            # rows stay locked, so no one can change them before our UPDATE
+            current = dict(
+                self.filter(pk__in=[obj.pk for obj in chunk]).select_for_update(
+                    ).values_list("pk", "cc_version"))
+            won = []
+            for obj in chunk:
+                if current.get(obj.pk) == obj.cc_version:
+                    won.append(obj)
+                else:
+                    lost.append(obj)
+            if not won:
+                continue
+            written.extend(won)
+
+            sets, params = [], []
+            for field in fields:
+                values = [
+                    field.get_db_prep_save(
+                        field.pre_save(obj, False), connection=connection)
+                    for obj in won
+                    ]
+                if len(set(values)) == 1:
+                    sets.append("{0} = %s".format(qn(field.column)))
+                    params.append(values[0])
+                else:
+                    # the ELSE gives the CASE the column's type; otherwise
+                    # PostgreSQL types it from the parameters, as text
+                    sets.append(
+                        "{0} = CASE {1} {2} ELSE {0} END".format(
+                            qn(field.column),
+                            pk,
+                            " ".join(["WHEN %s THEN %s"] * len(won)),
+                            )
+                        )
+                    for obj, value in zip(won, values):
+                        params.extend([obj.pk, value])
+            if not notrack:
+                sets.append("{0} = %s".format(qn("modified_on")))
+                sets.append("{0} = %s".format(qn("modified_by_id")))
+                params.extend([now, user.pk if user is not None else None])
+            cursor.execute(
+                "UPDATE {0} SET {1}, {2} = {2} + 1 WHERE {3} IN ({4})".format(
+                    qn(model._meta.db_table),
+                    ", ".join(sets),
+                    qn("cc_version"),
+                    pk,
+                    ", ".join(["%s"] * len(won)),
+                    ),
+                params + [obj.pk for obj in won],
+                )
+
+            for obj in won:
+                obj.cc_version += 1
+                if not notrack:
+                    obj.modified_on = now
+                    obj.modified_by = user
+                obj._loaded_values = obj._field_values()
+        transaction.set_dirty(using=self.db)
+        if written:
+            model.bulk_updated(written, [field.name for field in fields])
+        return lost
+
+
     def update(self, *args, **kwargs):
         """
         Update all objects in this queryset with modifications in ``kwargs``.
@@ -110,9 +692,7 @@ class MTQuerySet(QuerySet):
         """
         if permanent:
             return super(MTQuerySet, self).delete()
-        collector = SoftDeleteCollector(using=self.db)
-        collector.collect(self)
-        collector.delete(user)
+        return SoftDeleteCascade(self).delete(user)
 
 
     def undelete(self, user=None):
@@ -120,9 +700,7 @@ class MTQuerySet(QuerySet):
         Undelete all objects in this queryset.
 
         """
-        collector = SoftDeleteCollector(using=self.db)
-        collector.collect(self)
-        collector.undelete(user)
+        return SoftDeleteCascade(self).undelete(user)
 
 
 
@@ -152,6 +730,11 @@ class MTManager(models.Manager):
         return qs
 
 
+    def bulk_update(self, *args, **kwargs):
+        """Proxy to ``MTQuerySet.bulk_update``."""
+        return self.get_query_set().bulk_update(*args, **kwargs)
+
+
 
 class MTModel(models.Model):
     """
@@ -170,10 +753,17 @@ class MTModel(models.Model):
     deleted_on = models.DateTimeField(db_index=True, blank=True, null=True)
     deleted_by = models.ForeignKey(
         User, blank=True, null=True, related_name="+", on_delete=models.SET_NULL)
+    # shared by all rows soft-deleted together, so they undelete together
+    deletion_batch = models.CharField(
+        max_length=32, db_index=True, blank=True, null=True)
 
     # for optimistic concurrency control
     cc_version = models.IntegerField(default=0)
 
+    # names of denormalized fields kept current by bulk updates elsewhere;
+    # saving an existing instance never writes them (so a stale instance can't
+    # clobber them) and they are reset to default on clone.
+    denormalized_fields = ()
 
 
     # default manager returns all objects, so admin can see all
@@ -182,12 +772,56 @@ class MTModel(models.Model):
     objects = MTManager(show_deleted=False)
 
 
+    def __init__(self, *args, **kwargs):
+        """Instantiate, remembering field values if this is an existing row."""
+        super(MTModel, self).__init__(*args, **kwargs)
+        self._loaded_values = {}
+        if self.pk is not None:
+            self._loaded_values = self._field_values()
+
+
+    def _field_values(self):
+        """Return dict of values of all loaded (not deferred) fields."""
+        return dict(
+            (f.attname, self.__dict__[f.attname])
+            for f in self._local_fields()
+            if f.attname in self.__dict__
+            )
+
+
+    def _local_fields(self):
+        """Return local fields of this model (even for a deferred instance)."""
+        # deferred instances are of a proxy model with no local fields
+        return self._meta.concrete_model._meta.local_fields
+
+
+    def _changed_fields(self):
+        """
+        Return list of fields to write when saving this existing instance.
+
+        That's fields whose value changed since it was loaded or last saved,
+        and ``cc_version``; never the primary key, deferred fields that were
+        never loaded, or denormalized fields.
+
+        """
+        loaded = self._loaded_values
+        return [
+            f for f in self._local_fields()
+            if not (f.primary_key or f.name in self.denormalized_fields)
+            and f.attname in self.__dict__
+            and (f.name == "cc_version"
+                 or f.attname not in loaded
+                 or self.__dict__[f.attname] != loaded[f.attname])
+            ]
+
+
     def save(self, *args, **kwargs):
         """
         Save this instance.
 
         Records modified timestamp and user, and raises ConcurrencyError if an
-        out-of-date version is being saved.
+        out-of-date version is being saved. Saving an existing instance writes
+        only the fields changed since it was loaded (or last saved).
 
         """
         if not kwargs.pop("notrack", False):
@@ -203,12 +837,14 @@ class MTModel(models.Model):
         # MTModels always have an auto-PK and we don't set PKs explicitly, so
         # we can assume that a set PK means this should be an update.
         if kwargs.get("force_update") or self.id is not None:
-            non_pks = [f for f in self._meta.local_fields if not f.primary_key]
             # This isn't a race condition because the save will only take
             # effect if previous_version is actually up to date.
             previous_version = self.cc_version
             self.cc_version += 1
-            values = [(f, None, f.pre_save(self, False)) for f in non_pks]
+            values = [
+                (f, None, f.pre_save(self, False))
+                for f in self._changed_fields()
+                ]
             rows = self.__class__.objects.filter(
                 id=self.id, cc_version=previous_version)._update(values)
             if not rows:
@@ -217,7 +853,8 @@ class MTModel(models.Model):
                         self.__class__, self.id, previous_version)
                     )
         else:
-            return super(MTModel, self).save(*args, **kwargs)
+            super(MTModel, self).save(*args, **kwargs)
+        self._loaded_values = self._field_values()
 
 
     def clone(self, cascade=None, overrides=None, user=None):
@@ -236,50 +873,63 @@ class MTModel(models.Model):
         and values are a callable that takes the queryset of all related
         objects and returns those that should be cloned.
 
+        Cascade-cloned objects are inserted in bulk (see ``CloneCascade``),
+        each with the default cascade and overrides of its own model.
+
         """
-        if cascade is None:
-            cascade = {}
-        else:
-            try:
-                cascade.iteritems
-            except AttributeError:
-                cascade = dict((i, lambda qs: qs) for i in cascade)
+        return CloneCascade(user).clone(self, cascade, overrides)
 
-        if overrides is None:
-            overrides = {}
 
-        overrides["created_on"] = utcnow()
-        overrides["created_by"] = user
-        overrides["modified_by"] = user
+    def clone_defaults(self, cascade, overrides):
+        """
+        Return (cascade, overrides) for cloning this instance.
 
-        clone = self.__class__()
+        ``cascade`` and ``overrides`` are as given to ``clone`` (or None).
+        Subclasses fill in their default cascade and field overrides; these
+        also apply when the instance is cascade-cloned.
 
-        for field in self._meta.fields:
-            if field.primary_key:
-                continue
-            val = overrides.get(field.name, getattr(self, field.name))
-            setattr(clone, field.name, val)
+        """
+        return cascade, {} if overrides is None else overrides
 
-        clone.save(force_insert=True)
 
-        for name, filter_func in cascade.items():
-            mgr = getattr(self, name)
-            if mgr.__class__.__name__ == "ManyRelatedManager":  # M2M
-                clone_mgr = getattr(clone, name)
-                existing = set(clone_mgr.all())
-                new = set(filter_func(mgr.all()))
-                clone_mgr.add(*new.difference(existing))
-                clone_mgr.remove(*existing.difference(new))
-            elif mgr.__class__.__name__ == "RelatedManager":  # reverse FK
-                reverse_name = getattr(self.__class__, name).related.field.name
-                for obj in filter_func(mgr.all()):
-                    obj.clone(overrides={reverse_name: clone})
-            else:
-                raise ValueError(
-                    "Cannot cascade-clone '{0}'; "
-                    "not a many-to-many or reverse foreignkey.".format(name))
+    @classmethod
+    def bulk_created(cls, objs):
+        """
+        Called with new ``objs`` of this model inserted in bulk.
 
-        return clone
+        Subclasses whose ``save`` has side effects beyond writing the row
+        apply them here, for all the objects at once. Primary keys of
+        ``objs`` may not be set.
+
+        """
+        pass
+
+
+    @classmethod
+    def bulk_updated(cls, objs, fields):
+        """
+        Called with existing ``objs`` of this model written in bulk.
+
+        ``fields`` are the names of the fields written. Subclasses whose
+        ``save`` has side effects beyond writing the row apply them here, for
+        all the objects at once.
+
+        """
+        pass
+
+
+    @classmethod
+    def deletion_cascaded(cls, querysets):
+        """
+        Called after a soft-delete cascade deletes or undeletes rows.
+
+        Between them, ``querysets`` select (at least) the changed rows of
+        this model, a bounded number of rows each. Subclasses keeping
+        denormalized data about their undeleted rows current bring it up to
+        date here, for all the rows at once.
+
+        """
+        pass
 
 
     def delete(self, user=None, permanent=False):
@@ -289,7 +939,7 @@ class MTModel(models.Model):
         """
         if permanent:
             return super(MTModel, self).delete()
-        self._collector.delete(user)
+        return self._cascade.delete(user)
 
 
     def undelete(self, user=None):
@@ -297,16 +947,15 @@ class MTModel(models.Model):
         Undelete this instance.
 
         """
-        self._collector.undelete(user)
+        return self._cascade.undelete(user)
 
 
     @property
-    def _collector(self):
-        """Returns populated delete-cascade collector."""
+    def _cascade(self):
+        """Returns soft-delete cascade from this instance."""
         db = router.db_for_write(self.__class__, instance=self)
-        collector = SoftDeleteCollector(using=db)
-        collector.collect([self])
-        return collector
+        return SoftDeleteCascade(
+            self.__class__._base_manager.using(db).filter(pk=self.pk))
 
 
     class Meta:
@@ -383,6 +1032,8 @@ class TeamModel(models.Model):
         self.own_team.add(*users)
         self.__class__.objects.filter(pk=self.pk).update(has_team=True)
         self.has_team = True
+        # already written, so not a change for a later ``save`` to write
+        self._loaded_values["has_team"] = True
         self.cc_version += 1
 
 
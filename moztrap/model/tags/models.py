@@ -25,11 +25,12 @@ class Tag(MTModel):
         return self.name
 
 
-    def clone(self, *args, **kwargs):
+    def clone_defaults(self, cascade, overrides):
         """Clone tag; sets name prefix by default."""
-        overrides = kwargs.setdefault("overrides", {})
+        cascade, overrides = super(Tag, self).clone_defaults(
+            cascade, overrides)
         overrides.setdefault("name", "Cloned: {0}".format(self.name))
-        return super(Tag, self).clone(*args, **kwargs)
+        return cascade, overrides
 
 
     class Meta:
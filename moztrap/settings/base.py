@@ -242,3 +242,8 @@ SITE_URL = "http://localhost:8000"
 BROWSERID_CREATE_USER = "moztrap.model.core.auth.browserid_create_user"
 
 USE_BROWSERID = True
+
+# Set to True to activate and refresh runs in a background worker (``manage.py
+# run_lock_jobs``, which must then be kept running) rather than in the web
+# request.
+BACKGROUND_RUN_LOCK = False
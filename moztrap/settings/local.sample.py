@@ -102,6 +102,11 @@ Copy local.sample.py to local.py and modify as needed.
 #COMPRESS_ENABLED = True
 #COMPRESS_OFFLINE = True
 
+# Uncomment this to activate and refresh runs in a background worker rather
+# than in the web request; the worker must then be kept running with "python
+# manage.py run_lock_jobs".
+#BACKGROUND_RUN_LOCK = True
+
 # Uncomment this (and modify LOCATION appropriately) to use memcached rather
 # than local-memory cache. This (or some other out-of-process cache backend) is
 # required if running MozTrap under a multi-process webserver such as
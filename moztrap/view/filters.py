@@ -90,6 +90,17 @@ class RunFilterSet(filters.FilterSet):
             queryset=model.Run.objects.filter(is_series=True).order_by("name")
             ),
         filters.KeywordExactFilter("build"),
+        filters.RangeFilter(
+            "completion",
+            lookup="completion_cache",
+            choices=[
+                ("0:0.25", "0-24%"),
+                ("0.25:0.5", "25-49%"),
+                ("0.5:0.75", "50-74%"),
+                ("0.75:1", "75-99%"),
+                ("1:", "100%"),
+                ],
+            ),
         ]
 
 
@@ -104,8 +115,7 @@ class RunCaseVersionFilterSet(filters.FilterSet):
         filters.ChoicesFilter(
             "result status",
             key="resultstatus",
-            lookup="results__status",
-            extra_filters={"results__is_latest": True},
+            lookup="latestresults__status",
             choices=sorted(Choices(*model.Result.COMPLETED_STATES)),
             ),
         filters.KeywordExactFilter(
@@ -165,6 +175,16 @@ class RunCaseVersionFilterSet(filters.FilterSet):
             lookup="results__tester",
             queryset=model.User.objects.all().order_by("username"),
             ),
+        filters.RangeFilter(
+            "flakiness",
+            lookup="caseversion__case__flakiness__score",
+            choices=[
+                ("0:0.1", "0-9%"),
+                ("0.1:0.3", "10-29%"),
+                ("0.3:0.5", "30-49%"),
+                ("0.5:", "50% or more"),
+                ],
+            ),
         ]
 
 
@@ -420,6 +420,34 @@ class ChoicesFilter(BaseChoicesFilter):
 
 
 
+class RangeFilter(ChoicesFilter):
+    """
+    A filter whose choices are ranges of a numeric field.
+
+    Each choice value is a "low:high" string, matching field values where
+    ``low <= value < high``; either bound may be left empty. Selected ranges
+    are ORed. The field may be across a multi-valued relationship; objects
+    match if any related value is in range.
+
+    """
+    def filter(self, queryset, values):
+        """Given queryset and selected ranges, return filtered queryset."""
+        if values:
+            filters = Q()
+            for value in values:
+                low, high = value.split(":")
+                bounds = {}
+                if low:
+                    bounds["{0}__gte".format(self.lookup)] = float(low)
+                if high:
+                    bounds["{0}__lt".format(self.lookup)] = float(high)
+                filters = filters | Q(**bounds)
+            return queryset.filter(filters).distinct()
+
+        return queryset
+
+
+
 class ModelFilter(BaseChoicesFilter):
     """
     A Filter whose choices are from a provided iterable of model instances.
@@ -102,9 +102,13 @@ class RunForm(mtforms.NonFieldErrorsClassFormMixin, mtforms.MTModelForm):
             # either there are no suites, or this came from the read
             # only suite list.
             run.runsuites.all().delete(permanent=True)
-            for i, suite in enumerate(self.cleaned_data["suites"]):
-                model.RunSuite.objects.create(
-                    run=run, suite=suite, order=i, user=user)
+            model.RunSuite.objects.bulk_create(
+                [
+                    model.RunSuite(run=run, suite=suite, order=i)
+                    for i, suite in enumerate(self.cleaned_data["suites"])
+                    ],
+                user=user,
+                )
 
         return run
 
@@ -82,9 +82,13 @@ class SuiteForm(mtforms.NonFieldErrorsClassFormMixin, mtforms.MTModelForm):
 
         if "cases" in self.changed_data:
             suite.suitecases.all().delete(permanent=True)
-            for i, case in enumerate(self.cleaned_data["cases"]):
-                model.SuiteCase.objects.create(
-                    suite=suite, case=case, order=i, user=user)
+            model.SuiteCase.objects.bulk_create(
+                [
+                    model.SuiteCase(suite=suite, case=case, order=i)
+                    for i, case in enumerate(self.cleaned_data["cases"])
+                    ],
+                user=user,
+                )
 
         return suite
 
@@ -17,6 +17,14 @@ from ..finders import ResultsFinder
 
 
 
+# flakiness of the case in its flakiest environment, for display and sorting
+FLAKINESS_SELECT = (
+    "SELECT MAX(cf.score) FROM execution_caseflakiness cf "
+    "INNER JOIN library_caseversion cv ON cv.case_id = cf.case_id "
+    "WHERE cv.id = execution_runcaseversion.caseversion_id"
+    )
+
+
 @login_maybe_required
 @lists.finder(ResultsFinder)
 @lists.filter("runcaseversions", filterset_class=RunCaseVersionFilterSet)
@@ -29,6 +37,7 @@ def runcaseversions_list(request):
         "results/case/cases.html",
         {
             "runcaseversions": model.RunCaseVersion.objects.only(
+                "completion_cache",
                 "caseversion__name",
                 "caseversion__case__priority",
                 "run__name",
@@ -41,7 +50,9 @@ def runcaseversions_list(request):
                     "run__productversion",
                     "run__productversion__product",
                     "caseversion__case__priority",
-                    )
+                    ).extra(
+                        select={"flakiness": FLAKINESS_SELECT},
+                        )
             }
         )
 
@@ -2,12 +2,17 @@
 Results views for runs.
 
 """
+import json
+
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from django.template.response import TemplateResponse
 
 from moztrap.view.utils.auth import login_maybe_required
 
 from moztrap import model
+from moztrap.model.execution.compare import compare_runs, series_members
+from moztrap.model.execution.export import export_csv, export_json
 
 from moztrap.view.filters import RunFilterSet
 from moztrap.view.lists import decorators as lists
@@ -32,6 +37,7 @@ def runs_list(request):
                 "name",
                 "start",
                 "end",
+                "completion_cache",
                 "productversion",
                 "productversion__version",
                 "productversion__product__name",
@@ -58,3 +64,182 @@ def run_details(request, run_id):
             "run": run
             }
         )
+
+
+
+@login_maybe_required
+def run_bugs(request, run_id):
+    """List all bugs filed in a run, with the cases they were filed against."""
+    run = get_object_or_404(model.Run, pk=run_id)
+
+    bugs = []
+    for bugurl in model.BugURL.objects.filter(run=run).select_related(
+            "caseversion").order_by("bug_url", "caseversion__name"):
+        if not bugs or bugs[-1]["url"] != bugurl.bug_url:
+            bugs.append({"url": bugurl.bug_url, "caseversions": []})
+        bugs[-1]["caseversions"].append(bugurl.caseversion)
+
+    return TemplateResponse(
+        request,
+        "results/run/bugs.html",
+        {
+            "run": run,
+            "bugs": bugs,
+            }
+        )
+
+
+
+# maps export format to (generator of content, content type)
+EXPORTS = {
+    "csv": (export_csv, "text/csv"),
+    "json": (export_json, "application/json"),
+    }
+
+
+
+@login_maybe_required
+def export(request, run_id):
+    """
+    Stream all results of a run as CSV, or JSON with ``format=json``.
+
+    The response content is generated a chunk of results at a time as it's
+    sent, so memory use doesn't grow with the number of results. None of the
+    configured middleware reads the content, so it stays a generator; but
+    it's sent after ``TransactionMiddleware`` has committed, so results are
+    read outside of the request's transaction. For large runs, or a
+    consistent snapshot, use the ``export_results`` management command.
+
+    """
+    run = get_object_or_404(model.Run, pk=run_id)
+    format = request.GET.get("format", "csv")
+    try:
+        generate, content_type = EXPORTS[format]
+    except KeyError:
+        return HttpResponse(
+            "Unknown export format: {0}".format(format),
+            content_type="text/plain",
+            status=400,
+            )
+
+    response = HttpResponse(generate(run), content_type=content_type)
+    response["Content-Disposition"] = (
+        "attachment; filename=run-{0}-results.{1}".format(run.id, format))
+    return response
+
+
+
+@login_maybe_required
+def compare(request):
+    """
+    Compare results of runs in a series, build over build.
+
+    Runs are given by one or more ``run`` querystring params, or all
+    non-draft members of a series by a ``series`` param.
+
+    """
+    try:
+        runs = _compared_runs(request)
+    except ValueError as e:
+        return TemplateResponse(
+            request, "results/run/compare.html", {"error": str(e)}, status=400)
+
+    comparisons = compare_runs(runs)
+
+    keys = set(
+        t[:2] for c in comparisons
+        for kind in ["regressed", "new_failures", "fixed"] for t in c[kind])
+    names = dict(
+        model.RunCaseVersion.objects.filter(
+            run__in=runs,
+            caseversion__case__in=set(k[0] for k in keys),
+            ).values_list("caseversion__case", "caseversion__name"))
+    envs = model.Environment.objects.in_bulk(set(k[1] for k in keys))
+    for c in comparisons:
+        for kind in ["regressed", "new_failures", "fixed"]:
+            c[kind] = [
+                {
+                    "case_id": case_id,
+                    "name": names.get(case_id, ""),
+                    "environment": envs[env_id],
+                    "before": before,
+                    "after": after,
+                    }
+                for case_id, env_id, before, after in c[kind]
+                ]
+
+    return TemplateResponse(
+        request,
+        "results/run/compare.html",
+        {
+            "runs": runs,
+            "comparisons": comparisons,
+            }
+        )
+
+
+
+@login_maybe_required
+def compare_json(request):
+    """Return JSON comparison of results of runs in a series."""
+    try:
+        runs = _compared_runs(request)
+    except ValueError as e:
+        return HttpResponse(
+            json.dumps({"error": str(e)}),
+            content_type="application/json",
+            status=400,
+            )
+
+    data = {
+        "runs": [
+            {"id": run.id, "name": run.name, "build": run.build}
+            for run in runs
+            ],
+        "comparisons": [
+            dict(
+                [("from", c["from"].id), ("to", c["to"].id)] +
+                [
+                    (kind, [
+                        {
+                            "case": case_id,
+                            "environment": env_id,
+                            "before": before,
+                            "after": after,
+                            }
+                        for case_id, env_id, before, after in c[kind]
+                        ])
+                    for kind in ["regressed", "new_failures", "fixed"]
+                    ]
+                )
+            for c in compare_runs(runs)
+            ],
+        }
+    return HttpResponse(json.dumps(data), content_type="application/json")
+
+
+
+def _compared_runs(request):
+    """
+    Return runs to compare, from ``run`` or ``series`` querystring params.
+
+    Raises ``ValueError`` if they aren't two or more runs of one series.
+
+    """
+    try:
+        run_ids = [int(r) for r in request.GET.getlist("run")]
+        series_id = int(request.GET.get("series") or 0)
+    except ValueError:
+        raise ValueError("Run and series IDs must be integers.")
+
+    if series_id:
+        runs = series_members(series_id)
+    else:
+        runs = list(
+            model.Run.objects.filter(pk__in=run_ids).order_by("start", "id"))
+    if len(runs) < 2:
+        raise ValueError("At least two runs are needed to compare.")
+    series = set(run.series_id for run in runs)
+    if len(series) != 1 or None in series:
+        raise ValueError("Only runs of the same series can be compared.")
+    return runs
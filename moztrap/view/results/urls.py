@@ -11,6 +11,9 @@ urlpatterns = patterns(
 
     url("^$", "views.home", name="results"),
 
+    # JSON daily result counts for trend charts
+    url(r"^trends/$", "views.trends", name="results_trends"),
+
     # runs ------------------------------------------------------------------
 
     # list
@@ -23,6 +26,24 @@ urlpatterns = patterns(
         "runs.views.run_details",
         name="results_run_details"),
 
+    # all bugs filed in a run
+    url(r"^runs/(?P<run_id>\d+)/bugs/$",
+        "runs.views.run_bugs",
+        name="results_run_bugs"),
+
+    # streaming export of all results
+    url(r"^runs/(?P<run_id>\d+)/export/$",
+        "runs.views.export",
+        name="results_run_export"),
+
+    # build-over-build comparison of series members
+    url(r"^runs/compare/$",
+        "runs.views.compare",
+        name="results_runs_compare"),
+    url(r"^runs/compare/json/$",
+        "runs.views.compare_json",
+        name="results_runs_compare_json"),
+
     # runcaseversions --------------------------------------------------------
 
     # list
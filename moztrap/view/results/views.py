@@ -1,10 +1,15 @@
 """
-Home results view.
+Home results view, and trend data.
 
 """
+import datetime
+import json
+
 from django.core.urlresolvers import reverse
+from django.http import HttpResponse
 from django.shortcuts import redirect
 
+from moztrap import model
 from moztrap.view.utils.auth import login_maybe_required
 
 
@@ -14,3 +19,75 @@ def home(request):
     """Results home redirects to list of active test runs, with finder open."""
     return redirect(
         reverse("results_runs") + "?openfinder=1&filter-status=active")
+
+
+
+# maps trends querystring params to the rollup filter they set
+TREND_FILTERS = {
+    "productversion": "productversion",
+    "series": "run__series",
+    "run": "run",
+    }
+
+
+
+@login_maybe_required
+def trends(request):
+    """
+    Return JSON daily result counts of a product version, series or run.
+
+    Exactly one of ``productversion``, ``series`` or ``run`` querystring
+    params gives the ID to chart. Optional ``start`` and ``end`` dates
+    (YYYY-MM-DD) limit the days, and ``status`` params the statuses counted
+    (default all completed statuses). Counts are read from the daily result
+    rollup, so are up to date as of the last ``rollup_results``.
+
+    """
+    try:
+        filters = dict(
+            (TREND_FILTERS[k], int(v)) for k, v in request.GET.items()
+            if k in TREND_FILTERS
+            )
+        start, end = [
+            _date(request.GET.get(k)) for k in ["start", "end"]]
+    except ValueError as e:
+        return _json_error(str(e))
+    if len(filters) != 1:
+        return _json_error(
+            "Exactly one of productversion, series or run is required.")
+
+    statuses = request.GET.getlist("status") or model.Result.COMPLETED_STATES
+    valid = set(value for value, label in model.Result.STATUS)
+    bad = [s for s in statuses if s not in valid]
+    if bad:
+        return _json_error("Invalid status: {0}".format(", ".join(bad)))
+
+    days, counts = model.ResultRollup.trends(
+        statuses, start=start, end=end, **filters)
+
+    data = {
+        "days": [day.isoformat() for day in days],
+        "counts": counts,
+        }
+    return HttpResponse(json.dumps(data), content_type="application/json")
+
+
+
+def _date(value):
+    """Parse YYYY-MM-DD ``value`` into a date; None if empty."""
+    if not value:
+        return None
+    try:
+        return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError("Dates must be YYYY-MM-DD: {0}".format(value))
+
+
+
+def _json_error(msg):
+    """Return a 400 JSON response with given error message."""
+    return HttpResponse(
+        json.dumps({"error": msg}),
+        content_type="application/json",
+        status=400,
+        )
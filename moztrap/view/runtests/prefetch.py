@@ -0,0 +1,102 @@
+"""
+Batched loading of per-case execution data for a page of the runtests view.
+
+"""
+from ... import model
+
+
+
+class ResultPrefetch(object):
+    """
+    Results, step results and suites for a page of runcaseversions.
+
+    Created by the runtests ``run`` view for its run, environment and user;
+    once ``load`` is called with the runcaseversions on the current page, the
+    ``result_for``, ``other_result_for``, ``stepresult_for`` and
+    ``suites_for`` template tags read from it rather than querying per case.
+
+    """
+    def __init__(self, run, environment, user):
+        """Initialize for given run, environment and tester."""
+        self.run = run
+        self.environment = environment
+        self.user = user
+        self.loaded = set()
+        self.results = {}
+        self.other_results = {}
+        self.stepresults = {}
+        self.suites = {}
+
+
+    def load(self, runcaseversions):
+        """Load execution data for ``runcaseversions`` in a few queries."""
+        rcvs = [rcv for rcv in runcaseversions if rcv.id not in self.loaded]
+        if not rcvs:
+            return
+        rcv_ids = [rcv.id for rcv in rcvs]
+
+        duplicates = set()
+        for result in model.Result.objects.filter(
+                runcaseversion__in=rcv_ids,
+                tester=self.user,
+                environment=self.environment,
+                is_latest=True,
+                ).order_by("modified_on"):
+            if result.runcaseversion_id in self.results:
+                duplicates.add(result.runcaseversion_id)
+            self.results[result.runcaseversion_id] = result
+        # only the last-modified of several "latest" results stays latest
+        for rcv_id in duplicates:
+            result = self.results[rcv_id]
+            result.set_latest()
+            result.save()
+
+        # check for any completed result states from other users for these
+        # same case/env combos.
+        for result in model.Result.objects.filter(
+                runcaseversion__in=rcv_ids,
+                environment=self.environment,
+                is_latest=True,
+                status__in=(model.Result.COMPLETED_STATES +
+                    [model.Result.STATUS.skipped]),
+                ).exclude(tester=self.user).select_related(
+                    "tester").order_by("modified_on"):
+            self.other_results[result.runcaseversion_id] = result
+
+        for stepresult in model.StepResult.objects.filter(
+                result__in=[r.id for r in self.results.values()]):
+            self.stepresults[
+                (stepresult.result_id, stepresult.step_id)] = stepresult
+
+        rcvs_by_case = {}
+        for rcv in rcvs:
+            rcvs_by_case.setdefault(rcv.caseversion.case_id, []).append(rcv.id)
+            self.suites[rcv.id] = []
+        for suitecase in model.SuiteCase.everything.filter(
+                case__in=rcvs_by_case.keys(),
+                suite__in=model.Suite.objects.filter(runs=self.run),
+                ).select_related("suite").order_by("suite"):
+            for rcv_id in rcvs_by_case[suitecase.case_id]:
+                self.suites[rcv_id].append(suitecase.suite)
+
+        self.loaded.update(rcv_ids)
+
+
+    def covers(self, runcaseversion, user=None, environment=None):
+        """
+        True if data for ``runcaseversion`` (and given user/env) is loaded.
+
+        """
+        return (
+            runcaseversion.id in self.loaded and
+            (user is None or user.id == self.user.id) and
+            (environment is None or environment.id == self.environment.id)
+            )
+
+
+    def covers_result(self, result):
+        """True if step results of ``result`` are loaded."""
+        return (
+            result.id is not None and
+            self.results.get(result.runcaseversion_id) is result
+            )
@@ -11,6 +11,44 @@ from .... import model
 register = template.Library()
 
 
+
+def _prefetch(context, runcaseversion, user=None, environment=None):
+    """
+    Return the ResultPrefetch in context, if it has data for this case.
+
+    The runtests view puts a ``ResultPrefetch`` in the context as
+    ``result_prefetch``; tags fall back to querying if it's not there or
+    doesn't cover the given runcaseversion, user and environment.
+
+    """
+    prefetch = context.get("result_prefetch")
+    if prefetch is not None and prefetch.covers(
+            runcaseversion, user, environment):
+        return prefetch
+    return None
+
+
+
+class PrefetchResults(Tag):
+    """Load results etc. for a page of runcaseversions in a few queries."""
+    name = "prefetch_results"
+    options = Options(
+        Argument("runcaseversions"),
+        )
+
+
+    def render_tag(self, context, runcaseversions):
+        """Load the in-context ResultPrefetch with ``runcaseversions``."""
+        prefetch = context.get("result_prefetch")
+        if prefetch is not None:
+            prefetch.load(runcaseversions)
+        return u""
+
+
+register.tag(PrefetchResults)
+
+
+
 class ResultFor(Tag):
     """
     Places Result for this runcaseversion/user/env in context.
@@ -37,6 +75,14 @@ class ResultFor(Tag):
             runcaseversion=runcaseversion,
             is_latest=True,
             )
+        prefetch = _prefetch(context, runcaseversion, user, environment)
+        if prefetch is not None:
+            result = prefetch.results.get(runcaseversion.id)
+            if result is None:
+                result = model.Result(**result_kwargs)
+            context[varname] = result
+            return u""
+
         try:
             result = model.Result.objects.get(**result_kwargs)
         except model.Result.DoesNotExist:
@@ -75,6 +121,11 @@ class OtherResultFor(Tag):
     def render_tag(self, context, runcaseversion, user, environment, varname):
         """Get/construct Result and place it in context under ``varname``"""
 
+        prefetch = _prefetch(context, runcaseversion, user, environment)
+        if prefetch is not None:
+            context[varname] = prefetch.other_results.get(runcaseversion.id)
+            return u""
+
         # check for any completed result states from other users for this
         # same case/env combo.
         include_kwargs = dict(
@@ -132,6 +183,14 @@ class StepResultFor(Tag):
             result=result,
             step=casestep,
             )
+        prefetch = context.get("result_prefetch")
+        if prefetch is not None and prefetch.covers_result(result):
+            stepresult = prefetch.stepresults.get((result.id, casestep.id))
+            if stepresult is None:
+                stepresult = model.StepResult(**stepresult_kwargs)
+            context[varname] = stepresult
+            return u""
+
         try:
             stepresult = model.StepResult.objects.get(**stepresult_kwargs)
         except model.StepResult.DoesNotExist:
@@ -188,6 +247,11 @@ class SuitesFor(Tag):
 
     def render_tag(self, context, run, runcaseversion, varname):
         """Get/construct Suite list and place it in context under ``varname``"""
+        prefetch = _prefetch(context, runcaseversion)
+        if prefetch is not None and prefetch.run.id == run.id:
+            context[varname] = prefetch.suites[runcaseversion.id]
+            return u""
+
         result = model.Suite.objects.filter(cases=runcaseversion.caseversion.case, runs=run)
 
         context[varname] = result
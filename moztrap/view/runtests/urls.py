@@ -16,5 +16,14 @@ urlpatterns = patterns(
     url(r"^run/(?P<run_id>\d+)/env/(?P<env_id>\d+)/$",
         "run",
         name="runtests_run"),
+    url(r"^run/(?P<run_id>\d+)/env/(?P<env_id>\d+)/wait/$",
+        "wait",
+        name="runtests_wait"),
+    url(r"^run/(?P<run_id>\d+)/env/(?P<env_id>\d+)/bulk/$",
+        "bulk",
+        name="runtests_bulk"),
+    url(r"^progress/(?P<run_id>\d+)/$",
+        "progress",
+        name="runtests_progress"),
 
 )
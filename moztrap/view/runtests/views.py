@@ -9,10 +9,12 @@ from django.http import HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.response import TemplateResponse
 from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_POST
 
 from django.contrib import messages
 
 from ... import model
+from ...model.execution.ingest import record_actions
 
 from ..filters import RunTestsRunCaseVersionFilterSet
 from ..lists import decorators as lists
@@ -21,6 +23,7 @@ from ..utils.ajax import ajax
 
 from .finders import RunTestsFinder
 from .forms import EnvironmentSelectionForm, EnvironmentBuildSelectionForm
+from .prefetch import ResultPrefetch
 
 
 
@@ -109,6 +112,48 @@ def set_environment(request, run_id):
 
 
 
+@never_cache
+@permission_required("execution.execute")
+def wait(request, run_id, env_id):
+    """Show progress of locking in a run's cases, until it's ready to run."""
+    run = get_object_or_404(model.Run, pk=run_id)
+
+    job = run.pending_lock()
+    if job is None:
+        return redirect("runtests_run", run_id=run_id, env_id=env_id)
+
+    return TemplateResponse(
+        request,
+        "runtests/wait.html",
+        {
+            "run": run,
+            "job": job,
+            }
+        )
+
+
+
+@never_cache
+@permission_required("execution.execute")
+def progress(request, run_id):
+    """Return JSON progress of locking in a run's cases."""
+    run = get_object_or_404(model.Run, pk=run_id)
+
+    job = run.pending_lock()
+    if job is None:
+        data = {"status": "done", "stage": "", "progress": 100, "done": True}
+    else:
+        data = {
+            "status": job.status,
+            "stage": job.stage,
+            "progress": job.progress,
+            "done": False,
+            }
+
+    return HttpResponse(json.dumps(data), content_type="application/json")
+
+
+
 # maps valid action names to default parameters
 ACTIONS = {
     "start": {},
@@ -122,6 +167,72 @@ ACTIONS = {
 
 
 
+@never_cache
+@permission_required("execution.execute")
+@require_POST
+def bulk(request, run_id, env_id):
+    """
+    Apply a JSON list of actions to cases of a run; return JSON of changes.
+
+    The request body is a list of objects like ``{"runcaseversion": 12,
+    "action": "result_pass"}``, with any parameters of the action (see
+    ``ACTIONS``). All actions are applied in one transaction, in a fixed number
+    of queries. The response has this tester's new status and the completion
+    of each affected runcaseversion, the run's completion, and the index and
+    message of any action that couldn't be applied.
+
+    """
+    run = get_object_or_404(model.Run, pk=run_id)
+    environment = get_object_or_404(run.environments.all(), pk=env_id)
+
+    # a run being activated stays in draft until its cases are locked in
+    if run.pending_lock() is not None:
+        return _json_error("That test run is not ready for testing yet.")
+    if not run.status == model.Run.STATUS.active:
+        return _json_error("That test run is currently not open for testing.")
+
+    try:
+        actions = json.loads(request.raw_post_data)
+    except ValueError:
+        actions = None
+    if not isinstance(actions, list):
+        return _json_error("Request must contain a list of actions.")
+
+    rcv_ids, errors = record_actions(run, environment, actions, request.user)
+
+    rows = dict(
+        (rcv_id, {"status": "", "completion": completion})
+        for rcv_id, completion in model.RunCaseVersion.objects.filter(
+            pk__in=rcv_ids).values_list("id", "completion_cache")
+        )
+    for rcv_id, status in model.LatestResult.objects.filter(
+            runcaseversion__in=rcv_ids,
+            environment=environment,
+            tester=request.user,
+            ).values_list("runcaseversion", "status"):
+        rows[rcv_id]["status"] = status
+
+    data = {
+        "rows": rows,
+        "completion": model.Run.objects.filter(pk=run.id).values_list(
+            "completion_cache", flat=True)[0],
+        "errors": [
+            {"index": i, "error": msg} for i, msg in sorted(errors.items())],
+        }
+    return HttpResponse(json.dumps(data), content_type="application/json")
+
+
+
+def _json_error(msg):
+    """Return a 400 JSON response with given error message."""
+    return HttpResponse(
+        json.dumps({"error": msg}),
+        content_type="application/json",
+        status=400,
+        )
+
+
+
 @never_cache
 @permission_required("execution.execute")
 @lists.finder(RunTestsFinder)
@@ -131,6 +242,11 @@ ACTIONS = {
 def run(request, run_id, env_id):
     run = get_object_or_404(model.Run.objects.select_related("product"), pk=run_id)
 
+    # the run's cases are still being locked in by the background worker (a
+    # run being activated stays in draft until then)
+    if run.pending_lock() is not None:
+        return redirect("runtests_wait", run_id=run_id, env_id=env_id)
+
     if not run.status == model.Run.STATUS.active:
         messages.info(
             request,
@@ -218,17 +334,19 @@ def run(request, run_id, env_id):
     envform = EnvironmentSelectionForm(
         current=environment.id, environments=run.environments.all())
 
+    # status of the case in this env: the most recent of all testers' latest
+    # completed results there. Reads only the latest-result pointers of the
+    # case in this env (a range of the unique (runcaseversion, environment,
+    # tester) index, one row per tester), whatever the result history.
+    # Pending cases get an empty status, so they sort first on any database.
     current_result_select = (
-        "SELECT status from execution_result as r "
-        "WHERE r.runcaseversion_id = execution_runcaseversion.id "
-        "AND r.environment_id = {0} "
-        "AND r.status not in ({1}) "
-        "AND r.is_latest = 1 "
-        "ORDER BY r.created_on DESC LIMIT 1".format(
-            environment.id,
-            ", ".join(
-                ["'{0}'".format(x) for x in model.Result.PENDING_STATES]
-                )))
+        "COALESCE((SELECT lr.status FROM execution_latestresult as lr "
+        "WHERE lr.runcaseversion_id = execution_runcaseversion.id "
+        "AND lr.environment_id = %s "
+        "AND lr.status NOT IN ({0}) "
+        "ORDER BY lr.result_id DESC LIMIT 1), '')".format(
+            ", ".join(["%s"] * len(model.Result.PENDING_STATES))))
+    current_result_params = [environment.id] + model.Result.PENDING_STATES
 
     return TemplateResponse(
         request,
@@ -239,6 +357,8 @@ def run(request, run_id, env_id):
             "productversion": run.productversion,
             "run": run,
             "envform": envform,
+            # loaded with the current page of runcaseversions by the template
+            "result_prefetch": ResultPrefetch(run, environment, request.user),
             "runcaseversions": run.runcaseversions.select_related(
                 "caseversion__case",
                 ).prefetch_related(
@@ -247,8 +367,10 @@ def run(request, run_id, env_id):
                     "caseversion__steps",
                     ).filter(
                         environments=environment,
-                        ).extra(select={
-                            "current_result": current_result_select}),
+                        ).extra(
+                            select={"current_result": current_result_select},
+                            select_params=current_result_params,
+                            ),
             "finder": {
                 # finder decorator populates top column (products), we
                 # prepopulate the other two columns
@@ -2,6 +2,7 @@
 Model factories.
 
 """
+import datetime
 import itertools
 
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -370,6 +371,28 @@ class StepResultFactory(factory.Factory):
 
 
 
+class ResultRollupFactory(factory.Factory):
+    FACTORY_FOR = model.ResultRollup
+
+    day = factory.LazyAttribute(lambda obj: datetime.date.today())
+    run = factory.SubFactory(RunFactory)
+    productversion = factory.LazyAttribute(lambda obj: obj.run.productversion)
+    environment = factory.SubFactory(EnvironmentFactory)
+    status = "passed"
+
+
+
+class CaseFlakinessFactory(factory.Factory):
+    FACTORY_FOR = model.CaseFlakiness
+
+    case = factory.SubFactory(CaseFactory)
+    environment = factory.SubFactory(EnvironmentFactory)
+    score = 0.5
+    flips = 1
+    builds = 3
+
+
+
 class TagFactory(factory.Factory):
     FACTORY_FOR = model.Tag
 
@@ -73,6 +73,20 @@ class ProductAdminTest(case.admin.AdminTestCase):
         self.assertEqual(self.refresh(p).deleted_on, None)
 
 
+    def test_bulk_undelete_message(self):
+        """Bulk undelete action reports what it undeleted."""
+        p = self.F.ProductFactory.create(name="Firefox")
+        self.F.ProductVersionFactory.create(product=p)
+        self.F.ProductVersionFactory.create(product=p)
+        p.delete()
+        form = self.get(self.changelist_url).forms["changelist-form"]
+        form["action"] = "undelete"
+        form["_selected_action"] = str(p.id)
+        res = form.submit("index", 0).follow()
+
+        res.mustcontain("Undeleted 1 product, 2 product versions.")
+
+
     def test_hard_delete(self):
         """Hard deletion via bulk-action really deletes."""
         p = self.F.ProductFactory.create(name="Firefox")
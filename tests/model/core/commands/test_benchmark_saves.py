@@ -0,0 +1,60 @@
+"""
+Tests for management command to benchmark the size of save UPDATEs.
+
+"""
+from cStringIO import StringIO
+
+from django.core.management import call_command
+
+from mock import patch
+
+from tests import case
+
+
+
+class BenchmarkSavesTest(case.DBTestCase):
+    """Tests for benchmark_saves management command."""
+    def call_command(self, *args, **kwargs):
+        """
+        Runs the management command and returns (stdout, stderr) output.
+
+        Also patch ``sys.exit`` so a ``CommandError`` doesn't cause an exit.
+
+        """
+        with patch("sys.stdout", StringIO()) as stdout:
+            with patch("sys.stderr", StringIO()) as stderr:
+                with patch("sys.exit"):
+                    call_command("benchmark_saves", *args, **kwargs)
+
+        stdout.seek(0)
+        stderr.seek(0)
+        return (stdout.read(), stderr.read())
+
+
+    def test_reports_bytes(self):
+        """Writing only changed fields sends fewer bytes."""
+        output = self.call_command("1000")
+
+        lines = output[0].splitlines()
+        self.assertEqual(lines[0].split(), ["save", "all", "changed"])
+        self.assertEqual(lines[1].split()[:2], ["run", "status"])
+        for line in lines[1:]:
+            write_all, changed = [int(n) for n in line.split()[-2:]]
+            self.assertGreater(write_all, changed)
+            self.assertGreater(changed, 0)
+
+
+    def test_deletes_data(self):
+        """Benchmark data is deleted afterwards."""
+        self.call_command("10")
+
+        self.assertEqual(self.model.Product.everything.count(), 0)
+        self.assertEqual(self.model.Run.everything.count(), 0)
+        self.assertEqual(self.model.CaseStep.everything.count(), 0)
+
+
+    def test_bad_length(self):
+        """Error if the length isn't a number."""
+        output = self.call_command("long")
+
+        self.assertEqual(output, ("", "Error: Usage: [<text_length>]\n"))
@@ -42,6 +42,18 @@ class ProductTest(case.DBTestCase):
         self.assertEqual(len(new.team.all()), 2)
 
 
+    def test_clone_team_without_has_team(self):
+        """A Product's team is its own even if ``has_team`` is False."""
+        other = self.F.ProductFactory(team=["Other"])
+        p = self.F.ProductFactory()
+        p.own_team.add(self.F.UserFactory.create())
+
+        new = p.clone()
+
+        self.assertEqual(list(new.team.all()), list(p.team.all()))
+        self.assertEqual(len(self.refresh(other).team.all()), 1)
+
+
     def test_reorder_versions(self):
         """reorder_versions method reorders versions correctly."""
         p = self.F.ProductFactory()
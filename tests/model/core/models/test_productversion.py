@@ -104,6 +104,29 @@ class ProductVersionTest(case.DBTestCase):
         self.assertEqual(len(new.team.all()), 2)
 
 
+    def test_clone_inherited_team(self):
+        """Cloning a ProductVersion with inherited team leaves teams alone."""
+        self.F.ProductFactory(team=["Other"])
+        pv = self.F.ProductVersionFactory(
+            product=self.F.ProductFactory(team=["One", "Two"]))
+        teams = [
+            set(m.own_team.through.objects.values_list())
+            for m in [self.model.Product, self.model.ProductVersion]
+            ]
+
+        new = pv.clone()
+
+        self.assertFalse(new.has_team)
+        self.assertEqual(len(new.team.all()), 2)
+        self.assertEqual(
+            [
+                set(m.own_team.through.objects.values_list())
+                for m in [self.model.Product, self.model.ProductVersion]
+                ],
+            teams,
+            )
+
+
     def test_adding_new_version_reorders(self):
         """Adding a new product version reorders the versions."""
         p = self.F.ProductFactory.create()
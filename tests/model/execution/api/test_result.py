@@ -330,3 +330,67 @@ class ResultResourceTest(case.api.ApiTestCase):
             params=params,
             status=401,
             )
+
+
+    def test_submit_results_in_bulk(self):
+        """In bulk mode, bad results are reported without failing others."""
+        user = self.F.UserFactory.create(
+            username="foo",
+            permissions=["execution.execute"],
+            )
+        apikey = self.F.ApiKeyFactory.create(owner=user)
+        envs = self.F.EnvironmentFactory.create_full_set(
+                {"OS": ["OS X"]})
+        pv = self.F.ProductVersionFactory.create(environments=envs)
+        r1 = self.F.RunFactory.create(name="RunA", productversion=pv)
+
+        c_p = self.F.CaseVersionFactory.create(
+            case__product=pv.product,
+            productversion=pv,
+            name="PassCase",
+            )
+
+        self.factory.create(caseversion=c_p, run=r1, environments=envs)
+
+        # submit results for these cases
+        params = {
+            "username": user.username, "api_key": apikey.key, "bulk": "1"}
+        payload = {
+            "objects": [
+                    {
+                    "case": c_p.case.id,
+                    "environment": envs[0].id + 1,
+                    "run_id": r1.id,
+                    "status": "failed",
+                },
+                    {
+                    "case": c_p.case.id,
+                    "environment": envs[0].id,
+                    "run_id": r1.id,
+                    "status": "passed",
+                }
+            ]
+        }
+
+        res = self.patch(
+            self.get_list_url(self.resource_name),
+            params=params,
+            payload=payload,
+            )
+
+        self.assertEqual(
+            res.json,
+            {
+                "recorded": 1,
+                "errors": [
+                    {
+                        "index": 0,
+                        "error": "Specified environment does not exist: "
+                        "{0}".format(envs[0].id + 1),
+                        },
+                    ],
+                },
+            )
+        result = self.model.Result.objects.get()
+        self.assertEqual(result.status, "passed")
+        self.assertEqual(result.tester, user)
@@ -0,0 +1,58 @@
+"""
+Tests for management command to benchmark activating and refreshing runs.
+
+"""
+from cStringIO import StringIO
+
+from django.core.management import call_command
+
+from mock import patch
+
+from tests import case
+
+
+
+class BenchmarkRunLockTest(case.DBTestCase):
+    """Tests for benchmark_run_lock management command."""
+    def call_command(self, *args, **kwargs):
+        """
+        Runs the management command and returns (stdout, stderr) output.
+
+        Also patch ``sys.exit`` so a ``CommandError`` doesn't cause an exit.
+
+        """
+        with patch("sys.stdout", StringIO()) as stdout:
+            with patch("sys.stderr", StringIO()) as stderr:
+                with patch("sys.exit"):
+                    call_command("benchmark_run_lock", *args, **kwargs)
+
+        stdout.seek(0)
+        stderr.seek(0)
+        return (stdout.read(), stderr.read())
+
+
+    def test_reports_sizes(self):
+        """Reports a line per given number of cases."""
+        output = self.call_command("3", "5")
+
+        lines = output[0].splitlines()
+        self.assertEqual(lines[0].split(), [
+                "cases", "activate", "queries", "refresh", "queries"])
+        self.assertEqual([l.split()[0] for l in lines[1:]], ["3", "5"])
+
+
+    def test_deletes_data(self):
+        """Benchmark data is deleted afterwards."""
+        self.call_command("3")
+
+        self.assertEqual(self.model.Product.everything.count(), 0)
+        self.assertEqual(self.model.Environment.everything.count(), 0)
+        self.assertEqual(self.model.RunCaseVersion.everything.count(), 0)
+
+
+    def test_bad_size(self):
+        """Error if a size isn't a number."""
+        output = self.call_command("lots")
+
+        self.assertEqual(
+            output, ("", "Error: Usage: [<number_of_cases> ...]\n"))
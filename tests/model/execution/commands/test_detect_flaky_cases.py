@@ -0,0 +1,60 @@
+"""
+Tests for management command to update flakiness scores.
+
+"""
+from cStringIO import StringIO
+import datetime
+
+from django.core.management import call_command
+
+from mock import patch
+
+from tests import case
+
+
+
+class DetectFlakyCasesTest(case.DBTestCase):
+    """Tests for detect_flaky_cases management command."""
+    def call_command(self, *args, **kwargs):
+        """Runs the management command and returns stdout output."""
+        with patch("sys.stdout", StringIO()) as stdout:
+            call_command("detect_flaky_cases", *args, **kwargs)
+
+        stdout.seek(0)
+        return stdout.read()
+
+
+    def test_updates(self):
+        """Updates scores of cases with new results in series runs."""
+        series = self.F.RunFactory.create(is_series=True)
+        cv = self.F.CaseVersionFactory.create(
+            productversion=series.productversion)
+        env = self.F.EnvironmentFactory.create()
+        for i, status in enumerate(["passed", "failed"]):
+            run = self.F.RunFactory.create(
+                series=series,
+                productversion=series.productversion,
+                status="active",
+                start=datetime.date(2013, 1, 1 + i),
+                )
+            self.F.ResultFactory.create(
+                runcaseversion__run=run,
+                runcaseversion__caseversion=cv,
+                environment=env,
+                status=status,
+                )
+
+        output = self.call_command(lag=0)
+
+        self.assertEqual(output, "Updated 1 flakiness score(s).\n")
+        self.assertEqual(
+            self.model.CaseFlakiness.objects.get().score, 1.0)
+
+
+    def test_default_lag(self):
+        """By default, results of the last few minutes are left for later."""
+        self.F.ResultFactory.create()
+
+        output = self.call_command()
+
+        self.assertEqual(output, "Updated 0 flakiness score(s).\n")
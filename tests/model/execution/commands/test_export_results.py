@@ -0,0 +1,82 @@
+"""
+Tests for management command to export results of a run.
+
+"""
+from cStringIO import StringIO
+import json
+import os
+import tempfile
+
+from django.core.management import call_command
+
+from mock import patch
+
+from tests import case
+
+
+
+class ExportResultsTest(case.DBTestCase):
+    """Tests for export_results management command."""
+    def call_command(self, *args, **kwargs):
+        """
+        Runs the management command and returns (stdout, stderr) output.
+
+        Also patch ``sys.exit`` so a ``CommandError`` doesn't cause an exit.
+
+        """
+        with patch("sys.stdout", StringIO()) as stdout:
+            with patch("sys.stderr", StringIO()) as stderr:
+                with patch("sys.exit"):
+                    call_command("export_results", *args, **kwargs)
+
+        stdout.seek(0)
+        stderr.seek(0)
+        return (stdout.read(), stderr.read())
+
+
+    def setUp(self):
+        """Set up a result."""
+        self.result = self.F.ResultFactory.create(status="passed")
+        self.run = self.result.runcaseversion.run
+
+
+    def test_csv(self):
+        """Writes CSV to stdout by default."""
+        output = self.call_command(str(self.run.id))
+
+        lines = output[0].splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("result_id,"))
+
+
+    def test_json_to_file(self):
+        """Writes JSON to given file."""
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        self.call_command(str(self.run.id), format="json", output=path)
+
+        with open(path) as f:
+            self.assertEqual(json.load(f)[0]["result_id"], self.result.id)
+
+
+    def test_bad_run(self):
+        """Error if run doesn't exist."""
+        output = self.call_command("0")
+
+        self.assertEqual(output, ("", "Error: Run 0 does not exist.\n"))
+
+
+    def test_bad_format(self):
+        """Error if format is unknown."""
+        output = self.call_command(str(self.run.id), format="xml")
+
+        self.assertEqual(output, ("", "Error: Unknown format: xml\n"))
+
+
+    def test_usage(self):
+        """Error if run id isn't given."""
+        output = self.call_command()
+
+        self.assertEqual(output, ("", "Error: Usage: <run_id>\n"))
@@ -0,0 +1,49 @@
+"""
+Tests for management command to rebuild the bug URL index.
+
+"""
+from cStringIO import StringIO
+
+from django.core.management import call_command
+
+from mock import patch
+
+from tests import case
+
+
+
+class RebuildBugURLsTest(case.DBTestCase):
+    """Tests for rebuild_bug_urls management command."""
+    def call_command(self, *args, **kwargs):
+        """Runs the management command and returns stdout output."""
+        with patch("sys.stdout", StringIO()) as stdout:
+            call_command("rebuild_bug_urls", *args, **kwargs)
+
+        stdout.seek(0)
+        return stdout.read()
+
+
+    def test_rebuilds(self):
+        """Rebuilds the index of all runs from step results."""
+        sr = self.F.StepResultFactory.create(bug_url="http://example.com/1")
+        self.model.BugURL.objects.all().delete()
+
+        output = self.call_command()
+
+        self.assertEqual(output, "Bug URL index rebuilt.\n")
+        self.assertEqual(
+            self.model.BugURL.objects.get().run,
+            sr.result.runcaseversion.run,
+            )
+
+
+    def test_given_runs(self):
+        """Rebuilds the index of only the given runs."""
+        sr1 = self.F.StepResultFactory.create(bug_url="http://example.com/1")
+        sr2 = self.F.StepResultFactory.create(bug_url="http://example.com/2")
+        self.model.BugURL.objects.all().delete()
+
+        self.call_command(str(sr1.result.runcaseversion.run.id))
+
+        self.assertEqual(
+            self.model.BugURL.objects.get().bug_url, "http://example.com/1")
@@ -0,0 +1,66 @@
+"""
+Tests for management command to rebuild result summaries.
+
+"""
+from cStringIO import StringIO
+
+from django.core.management import call_command
+
+from mock import patch
+
+from tests import case
+
+
+
+class RebuildResultSummariesTest(case.DBTestCase):
+    """Tests for rebuild_result_summaries management command."""
+    def call_command(self, *args, **kwargs):
+        """Runs the management command under test and returns stdout output."""
+        with patch("sys.stdout", StringIO()) as stdout:
+            call_command("rebuild_result_summaries", *args, **kwargs)
+
+        stdout.seek(0)
+        return stdout.read()
+
+
+    def test_rebuilds_all(self):
+        """With no arguments, summaries for all runs are rebuilt."""
+        r1 = self.F.ResultFactory.create(status="passed")
+        r2 = self.F.ResultFactory.create(status="failed")
+        self.model.ResultSummary.objects.all().delete()
+
+        output = self.call_command()
+
+        self.assertEqual(output, "Result summaries rebuilt.\n")
+        self.assertEqual(
+            r1.runcaseversion.run.result_summary()["passed"], 1)
+        self.assertEqual(
+            r2.runcaseversion.run.result_summary()["failed"], 1)
+
+
+    def test_rebuilds_given_runs(self):
+        """With run ids given, only those runs are rebuilt."""
+        r1 = self.F.ResultFactory.create(status="passed")
+        r2 = self.F.ResultFactory.create(status="failed")
+        self.model.ResultSummary.objects.all().delete()
+
+        self.call_command(str(r1.runcaseversion.run.id), verbosity=0)
+
+        self.assertEqual(
+            r1.runcaseversion.run.result_summary()["passed"], 1)
+        self.assertEqual(
+            r2.runcaseversion.run.result_summary()["failed"], 0)
+
+
+    def test_rebuilds_completion(self):
+        """Stored completion of runs and runcaseversions is recomputed."""
+        r = self.F.ResultFactory.create(status="passed")
+        rcv = r.runcaseversion
+        rcv.environments.add(r.environment)
+        self.model.Run.objects.update(completion_cache=0)
+        self.model.RunCaseVersion.objects.update(completion_cache=0)
+
+        self.call_command(verbosity=0)
+
+        self.assertEqual(self.refresh(rcv).completion_cache, 1.0)
+        self.assertEqual(self.refresh(rcv.run).completion_cache, 1.0)
@@ -0,0 +1,73 @@
+"""
+Tests for management command to refresh active runs.
+
+"""
+from cStringIO import StringIO
+
+from django.core.management import call_command
+
+from mock import patch
+
+from tests import case
+
+
+
+class RefreshRunsTest(case.DBTestCase):
+    """Tests for refresh_runs management command."""
+    def call_command(self, *args, **kwargs):
+        """Runs the management command and returns stdout output."""
+        with patch("sys.stdout", StringIO()) as stdout:
+            call_command("refresh_runs", *args, **kwargs)
+
+        stdout.seek(0)
+        return stdout.read()
+
+
+    def setUp(self):
+        """Set up an active run of a suite, and a case to add to the suite."""
+        self.envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["Linux"]})
+        pv = self.F.ProductVersionFactory.create(environments=self.envs)
+        self.suite = self.F.SuiteFactory.create(
+            product=pv.product, status="active")
+        self.run = self.F.RunFactory.create(productversion=pv)
+        self.F.RunSuiteFactory.create(suite=self.suite, run=self.run)
+        self.cv = self.F.CaseVersionFactory.create(
+            case__product=pv.product, productversion=pv, status="active")
+        self.run.activate()
+
+
+    def test_applies_changes(self):
+        """Recorded changes are applied to active runs, then pruned."""
+        self.F.SuiteCaseFactory.create(suite=self.suite, case=self.cv.case)
+
+        output = self.call_command()
+
+        self.assertEqual(output, "Refreshed 1 run(s).\n")
+        rcv = self.run.runcaseversions.get()
+        self.assertEqual(rcv.caseversion, self.cv)
+        self.assertEqual(set(rcv.environments.all()), set(self.envs))
+        self.assertEqual(self.model.LockChange.objects.count(), 0)
+
+
+    def test_full(self):
+        """With --full, unrecorded changes are reconciled too."""
+        self.model.SuiteCase._base_manager.bulk_create(
+            [self.model.SuiteCase(suite=self.suite, case=self.cv.case)])
+
+        output = self.call_command(full=True)
+
+        self.assertEqual(output, "Reconciled 1 run(s).\n")
+        self.assertEqual(
+            self.run.runcaseversions.get().caseversion, self.cv)
+
+
+    def test_unrecorded_changes_not_applied(self):
+        """Without --full, only recorded changes are applied."""
+        # the plain base manager's bulk_create doesn't record the change
+        self.model.SuiteCase._base_manager.bulk_create(
+            [self.model.SuiteCase(suite=self.suite, case=self.cv.case)])
+
+        self.call_command(verbosity=0)
+
+        self.assertEqual(self.run.runcaseversions.count(), 0)
@@ -0,0 +1,48 @@
+"""
+Tests for management command to roll up results.
+
+"""
+from cStringIO import StringIO
+
+from django.core.management import call_command
+
+from mock import patch
+
+from tests import case
+
+
+
+class RollupResultsTest(case.DBTestCase):
+    """Tests for rollup_results management command."""
+    def call_command(self, *args, **kwargs):
+        """Runs the management command and returns stdout output."""
+        with patch("sys.stdout", StringIO()) as stdout:
+            call_command("rollup_results", *args, **kwargs)
+
+        stdout.seek(0)
+        return stdout.read()
+
+
+    def test_rolls_up(self):
+        """Rolls up new results, reporting the number of counts added."""
+        self.F.ResultFactory.create(status="passed")
+
+        output = self.call_command(lag=0)
+
+        self.assertEqual(output, "Added 1 daily count(s).\n")
+        self.assertEqual(
+            self.model.ResultRollup.objects.get().status, "passed")
+
+
+    def test_default_lag(self):
+        """By default, results from the last few minutes are left."""
+        self.F.ResultFactory.create(status="passed")
+
+        output = self.call_command()
+
+        self.assertEqual(output, "Added 0 daily count(s).\n")
+
+
+    def test_quiet(self):
+        """No output with verbosity 0."""
+        self.assertEqual(self.call_command(verbosity=0), "")
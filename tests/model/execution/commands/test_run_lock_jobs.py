@@ -0,0 +1,60 @@
+"""
+Tests for management command to run queued run lock jobs.
+
+"""
+from cStringIO import StringIO
+
+from django.core.management import call_command
+
+from mock import patch
+
+from tests import case
+
+
+
+class RunLockJobsTest(case.DBTestCase):
+    """Tests for run_lock_jobs management command."""
+    def call_command(self, *args, **kwargs):
+        """Runs the management command and returns stdout output."""
+        with patch("sys.stdout", StringIO()) as stdout:
+            call_command("run_lock_jobs", *args, **kwargs)
+
+        stdout.seek(0)
+        return stdout.read()
+
+
+    def test_runs_queued_jobs(self):
+        """With --once, runs all queued jobs and exits."""
+        r1 = self.F.RunFactory.create()
+        r2 = self.F.RunFactory.create()
+        j1 = self.model.RunLockJob.enqueue(r1)
+        j2 = self.model.RunLockJob.enqueue(r2)
+
+        output = self.call_command(once=True)
+
+        self.assertEqual(self.refresh(j1).status, "done")
+        self.assertEqual(self.refresh(j2).status, "done")
+        self.assertEqual(
+            output,
+            "Lock of run {0}: done.\nLock of run {1}: done.\n".format(
+                r1.id, r2.id),
+            )
+
+
+    def test_quiet(self):
+        """With verbosity 0, nothing is output."""
+        self.model.RunLockJob.enqueue(self.F.RunFactory.create())
+
+        output = self.call_command(once=True, verbosity=0)
+
+        self.assertEqual(output, "")
+
+
+    def test_polls(self):
+        """Without --once, sleeps for the interval between polls."""
+        with patch("time.sleep") as sleep:
+            sleep.side_effect = KeyboardInterrupt
+            with self.assertRaises(KeyboardInterrupt):
+                self.call_command(interval=5)
+
+        sleep.assert_called_with(5)
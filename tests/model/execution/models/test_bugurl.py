@@ -0,0 +1,118 @@
+"""
+Tests for BugURL model.
+
+"""
+from tests import case
+
+
+
+class BugURLTest(case.DBTestCase):
+    """Tests for BugURL."""
+    def setUp(self):
+        """Set up a runcaseversion with a result."""
+        self.rcv = self.F.RunCaseVersionFactory.create()
+        self.result = self.F.ResultFactory.create(runcaseversion=self.rcv)
+
+
+    def bugs(self):
+        """Return set of indexed (run id, caseversion id, bug_url)."""
+        return set(
+            self.model.BugURL.objects.values_list(
+                "run", "caseversion", "bug_url"))
+
+
+    def key(self, url):
+        """Return index key for given url in our rcv."""
+        return (self.rcv.run.id, self.rcv.caseversion.id, url)
+
+
+    def test_recorded_on_save(self):
+        """Saving a step result with a bug URL indexes it, once."""
+        for i in range(2):
+            self.F.StepResultFactory.create(
+                result=self.result, bug_url="http://example.com/1")
+        self.F.StepResultFactory.create(result=self.result)
+
+        self.assertEqual(self.bugs(), set([self.key("http://example.com/1")]))
+
+
+    def test_changed_url(self):
+        """Changing a step result's bug URL drops the old one if unused."""
+        sr = self.F.StepResultFactory.create(
+            result=self.result, bug_url="http://example.com/1")
+
+        sr.bug_url = "http://example.com/2"
+        sr.save()
+
+        self.assertEqual(self.bugs(), set([self.key("http://example.com/2")]))
+
+
+    def test_delete_undelete(self):
+        """Deleting the last step result with a URL drops it; undelete restores."""
+        sr = self.F.StepResultFactory.create(
+            result=self.result, bug_url="http://example.com/1")
+        self.F.StepResultFactory.create(
+            result=self.result, bug_url="http://example.com/2")
+        other = self.F.StepResultFactory.create(
+            result=self.result, bug_url="http://example.com/2")
+
+        sr.delete()
+        other.delete()
+
+        self.assertEqual(self.bugs(), set([self.key("http://example.com/2")]))
+
+        self.refresh(sr).undelete()
+
+        self.assertEqual(
+            self.bugs(),
+            set([self.key("http://example.com/1"),
+                 self.key("http://example.com/2")]),
+            )
+
+
+    def test_record_many(self):
+        """Recording several bug URLs takes a fixed number of queries."""
+        self.model.BugURL.record([self.key("http://example.com/1")])
+        keys = [self.key("http://example.com/{0}".format(i)) for i in range(5)]
+
+        with self.assertNumQueries(4):
+            self.model.BugURL.record(keys + [self.key("")])
+
+        self.assertEqual(self.bugs(), set(keys))
+
+
+    def test_rebuild(self):
+        """Rebuilding drops URLs of step results deleted by cascade."""
+        self.F.StepResultFactory.create(
+            result=self.result, bug_url="http://example.com/1")
+        self.result.delete()
+        self.assertEqual(len(self.bugs()), 1)
+
+        self.model.BugURL.rebuild()
+
+        self.assertEqual(self.bugs(), set())
+
+
+    def test_rebuild_runs(self):
+        """Rebuilding only given runs leaves others alone."""
+        other = self.F.StepResultFactory.create(bug_url="http://example.com/2")
+        self.model.BugURL.objects.all().delete()
+        self.model.BugURL.objects.create(
+            run=self.rcv.run,
+            caseversion=self.rcv.caseversion,
+            bug_url="http://example.com/stale",
+            )
+
+        self.model.BugURL.rebuild(runs=[other.result.runcaseversion.run])
+
+        self.assertEqual(len(self.bugs()), 2)
+
+
+    def test_rcv_bug_urls_one_query(self):
+        """RunCaseVersion.bug_urls is a single lookup."""
+        self.F.StepResultFactory.create(
+            result=self.result, bug_url="http://example.com/1")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.rcv.bug_urls(), set(["http://example.com/1"]))
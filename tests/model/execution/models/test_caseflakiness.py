@@ -0,0 +1,220 @@
+"""
+Tests for CaseFlakiness model.
+
+"""
+import datetime
+
+from tests import case
+
+
+
+class CaseFlakinessTest(case.DBTestCase):
+    """Tests for CaseFlakiness."""
+    def setUp(self):
+        """Set up a series with a case in two environments."""
+        self.envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["OS X", "Linux"]})
+        self.series = self.F.RunFactory.create(
+            is_series=True, environments=self.envs)
+        self.cv = self.F.CaseVersionFactory.create(
+            productversion=self.series.productversion)
+        self.builds = 0
+
+
+    def build(self, *statuses, **kwargs):
+        """
+        Create a member run of the series with given statuses in first env.
+
+        Each status is recorded by a different tester; runs start a day
+        apart in order of creation.
+
+        """
+        series = kwargs.get("series", self.series)
+        env = self.envs[kwargs.get("env", 0)]
+        self.builds += 1
+        run = self.F.RunFactory.create(
+            series=series,
+            productversion=series.productversion,
+            environments=self.envs,
+            status="active",
+            start=datetime.date(2013, 1, 1) + datetime.timedelta(self.builds),
+            )
+        rcv = self.F.RunCaseVersionFactory.create(
+            run=run, caseversion=self.cv, environments=self.envs)
+        for status in statuses:
+            self.F.ResultFactory.create(
+                runcaseversion=rcv, environment=env, status=status)
+        return run
+
+
+    def analyze(self, **kwargs):
+        """Update flakiness, by default with no lag."""
+        kwargs.setdefault("lag", datetime.timedelta(0))
+        return self.model.CaseFlakiness.analyze(**kwargs)
+
+
+    def scores(self):
+        """Return set of (env id, score, flips, builds) tuples."""
+        return set(
+            self.model.CaseFlakiness.objects.filter(
+                case=self.cv.case).values_list(
+                    "environment", "score", "flips", "builds"))
+
+
+    def test_flips(self):
+        """Score is the fraction of consecutive builds that flipped."""
+        for status in ["passed", "failed", "passed", "passed", "blocked"]:
+            self.build(status)
+
+        self.assertEqual(self.analyze(), 1)
+
+        self.assertEqual(self.scores(), set([(self.envs[0].id, 0.75, 3, 5)]))
+
+
+    def test_stable(self):
+        """A case that never flips scores zero."""
+        self.build("failed")
+        self.build("failed")
+
+        self.analyze()
+
+        self.assertEqual(self.scores(), set([(self.envs[0].id, 0.0, 0, 2)]))
+
+
+    def test_one_build(self):
+        """A case with a result in only one build has no score."""
+        self.build("failed")
+
+        self.assertEqual(self.analyze(), 0)
+        self.assertEqual(self.scores(), set())
+
+
+    def test_any_tester_failed(self):
+        """A build fails if any tester's latest result failed."""
+        self.build("passed")
+        self.build("passed", "failed")
+
+        self.analyze()
+
+        self.assertEqual(self.scores(), set([(self.envs[0].id, 1.0, 1, 2)]))
+
+
+    def test_ignores_other_statuses(self):
+        """Builds with only invalidated or pending results are skipped."""
+        self.build("passed")
+        self.build("invalidated")
+        self.build("started")
+        self.build("passed")
+
+        self.analyze()
+
+        self.assertEqual(self.scores(), set([(self.envs[0].id, 0.0, 0, 2)]))
+
+
+    def test_per_environment(self):
+        """Flips are counted separately in each environment."""
+        self.build("passed")
+        self.build("passed", env=1)
+        self.build("failed")
+        self.build("passed", env=1)
+
+        self.analyze()
+
+        self.assertEqual(
+            self.scores(),
+            set([(self.envs[0].id, 1.0, 1, 2), (self.envs[1].id, 0.0, 0, 2)]),
+            )
+
+
+    def test_per_series(self):
+        """Builds of different series are not compared to each other."""
+        other = self.F.RunFactory.create(
+            is_series=True,
+            productversion=self.series.productversion,
+            environments=self.envs,
+            )
+        self.build("passed")
+        self.build("passed", series=other)
+        self.build("passed")
+        self.build("failed", series=other)
+
+        self.analyze()
+
+        self.assertEqual(self.scores(), set([(self.envs[0].id, 0.5, 1, 4)]))
+
+
+    def test_recent_builds(self):
+        """Only the most recent builds of each series are measured."""
+        self.build("failed")
+        self.build("passed")
+        self.build("passed")
+
+        self.analyze(builds=2)
+
+        self.assertEqual(self.scores(), set([(self.envs[0].id, 0.0, 0, 2)]))
+
+
+    def test_not_series(self):
+        """Results of runs that aren't series members are ignored."""
+        run = self.F.RunFactory.create(environments=self.envs)
+        rcv = self.F.RunCaseVersionFactory.create(
+            run=run, caseversion=self.cv, environments=self.envs)
+        self.F.ResultFactory.create(
+            runcaseversion=rcv, environment=self.envs[0], status="failed")
+        self.build("passed")
+
+        self.assertEqual(self.analyze(), 0)
+
+
+    def test_incremental(self):
+        """Only cases with new results are updated."""
+        self.build("passed")
+        self.build("failed")
+        self.analyze()
+        self.model.CaseFlakiness.objects.update(score=0.5)
+        other_cv = self.F.CaseVersionFactory.create(
+            productversion=self.series.productversion)
+        run = self.model.Run.objects.filter(series=self.series)[0]
+        rcv = self.F.RunCaseVersionFactory.create(
+            run=run, caseversion=other_cv, environments=self.envs)
+        self.F.ResultFactory.create(
+            runcaseversion=rcv, environment=self.envs[0], status="failed")
+
+        self.assertEqual(self.analyze(), 0)
+        self.assertEqual(self.scores(), set([(self.envs[0].id, 0.5, 1, 2)]))
+
+        self.build("failed")
+
+        self.assertEqual(self.analyze(), 1)
+        self.assertEqual(self.scores(), set([(self.envs[0].id, 0.5, 1, 3)]))
+
+
+    def test_lag(self):
+        """Results created within the lag are left for the next update."""
+        self.build("passed")
+        self.build("failed")
+
+        self.assertEqual(self.analyze(lag=datetime.timedelta(minutes=5)), 0)
+        self.assertEqual(self.analyze(), 1)
+
+
+    def test_query_count(self):
+        """Updating takes a fixed number of queries per chunk of cases."""
+        for i in range(3):
+            self.build("passed")
+            self.build("failed")
+        for i in range(4):
+            cv = self.F.CaseVersionFactory.create(
+                productversion=self.series.productversion)
+            for run in self.model.Run.objects.filter(series=self.series):
+                rcv = self.F.RunCaseVersionFactory.create(
+                    run=run, caseversion=cv, environments=self.envs)
+                self.F.ResultFactory.create(
+                    runcaseversion=rcv, environment=self.envs[0],
+                    status="passed")
+
+        # create and lock watermark (5), find new results, recent runs and
+        # touched cases (3), two chunks of flips, delete, insert (6), save
+        # watermark (2)
+        with self.assertNumQueries(16):
+            self.assertEqual(self.analyze(chunk_size=3), 5)
@@ -0,0 +1,113 @@
+"""
+Tests for LatestResult model.
+
+"""
+from tests import case
+
+
+
+class LatestResultTest(case.DBTestCase):
+    """Tests for LatestResult."""
+    def setUp(self):
+        """Set up a runcaseversion, environment and tester."""
+        self.rcv = self.F.RunCaseVersionFactory.create()
+        self.env = self.F.EnvironmentFactory.create()
+        self.tester = self.F.UserFactory.create()
+
+
+    def result(self, **kwargs):
+        """Create and return a result for our rcv, env and tester."""
+        defaults = dict(
+            runcaseversion=self.rcv, environment=self.env, tester=self.tester)
+        defaults.update(kwargs)
+        return self.F.ResultFactory.create(**defaults)
+
+
+    def test_new_result_pointed_to(self):
+        """Recording a result creates a pointer to it."""
+        r = self.result(status="passed")
+
+        lr = self.model.LatestResult.objects.get()
+        self.assertEqual(lr.result, r)
+        self.assertEqual(lr.status, "passed")
+        self.assertTrue(self.refresh(r).is_latest)
+
+
+    def test_pointer_moved(self):
+        """A subsequent result moves the pointer and supersedes the previous."""
+        r1 = self.result(status="passed")
+        r2 = self.result(status="failed")
+
+        lr = self.model.LatestResult.objects.get()
+        self.assertEqual(lr.result, r2)
+        self.assertEqual(lr.status, "failed")
+        self.assertFalse(self.refresh(r1).is_latest)
+        self.assertTrue(self.refresh(r2).is_latest)
+
+
+    def test_pointer_per_tester(self):
+        """Each tester has their own latest result."""
+        r1 = self.result()
+        r2 = self.result(tester=self.F.UserFactory.create())
+
+        self.assertEqual(
+            set(self.model.LatestResult.objects.values_list(
+                "result", flat=True)),
+            set([r1.id, r2.id]),
+            )
+        self.assertTrue(self.refresh(r1).is_latest)
+
+
+    def test_set_latest_repairs_pointer(self):
+        """set_latest points at the result and fixes summary counts."""
+        r1 = self.result(status="passed")
+        r2 = self.result(status="failed")
+
+        r1 = self.refresh(r1)
+        r1.set_latest()
+        r1.save()
+
+        self.assertEqual(self.model.LatestResult.objects.get().result, r1)
+        self.assertFalse(self.refresh(r2).is_latest)
+        self.assertEqual(self.rcv.run.result_summary()["passed"], 1)
+        self.assertEqual(self.rcv.run.result_summary()["failed"], 0)
+
+
+    def test_deleted_result_not_summarized(self):
+        """A deleted latest result doesn't count in summaries."""
+        r = self.result(status="passed")
+
+        r.delete()
+
+        self.assertEqual(self.rcv.result_summary()["passed"], 0)
+
+
+    def test_status_edit(self):
+        """Editing the status of the latest result updates its pointer."""
+        r = self.result(status="passed")
+        r.status = "failed"
+        r.save()
+
+        self.assertEqual(self.model.LatestResult.objects.get().status, "failed")
+
+
+    def test_superseded_status_edit(self):
+        """Editing the status of a superseded result leaves the pointer."""
+        r1 = self.result(status="passed")
+        self.result(status="blocked")
+        r1 = self.refresh(r1)
+        r1.status = "failed"
+        r1.save()
+
+        self.assertEqual(
+            self.model.LatestResult.objects.get().status, "blocked")
+
+
+    def test_bulk_update_status(self):
+        """Bulk-updating status updates the pointers."""
+        r = self.result(status="passed")
+        r.status = "failed"
+
+        self.model.Result.objects.bulk_update([r], ["status"])
+
+        self.assertEqual(self.model.LatestResult.objects.get().status, "failed")
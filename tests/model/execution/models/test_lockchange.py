@@ -0,0 +1,124 @@
+"""
+Tests for LockChange model.
+
+"""
+from tests import case
+
+
+
+class LockChangeTest(case.DBTestCase):
+    """Tests for LockChange."""
+    def changes(self):
+        """Return set of (run, suite, case) IDs of recorded changes."""
+        return set(
+            self.model.LockChange.objects.values_list(
+                "run_id", "suite_id", "case_id"))
+
+
+    def test_unicode(self):
+        """Unicode representation names the changed objects."""
+        self.model.LockChange.record(suites=[3])
+
+        self.assertEqual(
+            unicode(self.model.LockChange.objects.get()),
+            u"Change to run None, suite 3, case None",
+            )
+
+
+    def test_record(self):
+        """Records a change per distinct ID."""
+        self.model.LockChange.record(runs=[1, 1], suites=[2], cases=[3, 4])
+
+        self.assertEqual(
+            self.changes(),
+            set([(1, None, None), (None, 2, None), (None, None, 3),
+                 (None, None, 4)]),
+            )
+
+
+    def test_suitecase_changes(self):
+        """Adding or removing a case records a change to its suite."""
+        sc = self.F.SuiteCaseFactory.create()
+        self.model.LockChange.objects.all().delete()
+
+        sc.delete()
+
+        self.assertEqual(self.changes(), set([(None, sc.suite.id, None)]))
+
+
+    def test_suite_changes(self):
+        """Saving a suite records a change to it."""
+        s = self.F.SuiteFactory.create()
+        self.model.LockChange.objects.all().delete()
+
+        s.deactivate()
+
+        self.assertEqual(self.changes(), set([(None, s.id, None)]))
+
+
+    def test_caseversion_changes(self):
+        """Saving a caseversion records a change to its case, once."""
+        cv = self.F.CaseVersionFactory.create()
+        self.F.CaseVersionFactory.create(case=cv.case)
+        cv = self.refresh(cv)
+        self.model.LockChange.objects.all().delete()
+
+        cv.deactivate()
+
+        self.assertEqual(self.changes(), set([(None, None, cv.case.id)]))
+
+
+    def test_caseversion_env_changes(self):
+        """Changing caseversion environments records a change to its case."""
+        cv = self.F.CaseVersionFactory.create()
+        env = self.F.EnvironmentFactory.create()
+        self.model.LockChange.objects.all().delete()
+
+        cv.add_envs(env)
+
+        self.assertEqual(self.changes(), set([(None, None, cv.case.id)]))
+
+
+    def test_case_delete(self):
+        """Deleting a case records a change to it."""
+        c = self.F.CaseFactory.create()
+
+        c.delete()
+
+        self.assertEqual(self.changes(), set([(None, None, c.id)]))
+
+
+    def test_runsuite_changes(self):
+        """Adding a suite to a run records a change to the run."""
+        rs = self.F.RunSuiteFactory.create()
+
+        self.assertIn((rs.run.id, None, None), self.changes())
+
+
+    def test_prune(self):
+        """Only changes all active runs are up to date with are pruned."""
+        self.model.LockChange.record(suites=[1, 2, 3])
+        ids = list(
+            self.model.LockChange.objects.order_by("id").values_list(
+                "id", flat=True))
+        self.F.RunFactory.create(status="active", last_lockchange=ids[2])
+        self.F.RunFactory.create(status="active", last_lockchange=ids[1])
+        # draft runs and series are fully locked when activated
+        self.F.RunFactory.create(status="draft")
+        self.F.RunFactory.create(status="active", is_series=True)
+
+        self.model.LockChange.prune()
+
+        self.assertEqual(
+            list(self.model.LockChange.objects.values_list("id", flat=True)),
+            [ids[2]],
+            )
+
+
+    def test_prune_no_active_runs(self):
+        """With no active runs, all changes are pruned."""
+        self.model.LockChange.record(suites=[1, 2])
+
+        self.model.LockChange.prune()
+
+        self.assertEqual(self.model.LockChange.objects.count(), 0)
@@ -0,0 +1,134 @@
+"""
+Tests for ResultRollup model.
+
+"""
+import datetime
+
+from tests import case
+
+
+
+class ResultRollupTest(case.DBTestCase):
+    """Tests for ResultRollup."""
+    def setUp(self):
+        """Set up a run with a case in two environments."""
+        self.envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["OS X", "Linux"]})
+        self.run = self.F.RunFactory.create(environments=self.envs)
+        self.rcv = self.F.RunCaseVersionFactory.create(
+            run=self.run, environments=self.envs)
+
+
+    def result(self, status="passed", env=0, **kwargs):
+        """Create a result in given env (index)."""
+        return self.F.ResultFactory.create(
+            runcaseversion=self.rcv,
+            environment=self.envs[env],
+            status=status,
+            **kwargs
+            )
+
+
+    def roll_up(self, **kwargs):
+        """Roll up results, by default with no lag."""
+        kwargs.setdefault("lag", datetime.timedelta(0))
+        return self.model.ResultRollup.roll_up(**kwargs)
+
+
+    def rollups(self):
+        """Return set of rollup tuples (env, status, count)."""
+        return set(
+            self.model.ResultRollup.objects.values_list(
+                "environment", "status", "count"))
+
+
+    def test_roll_up(self):
+        """Counts results by day, run, environment and status."""
+        self.result("passed")
+        self.result("passed")
+        self.result("failed", env=1)
+
+        self.assertEqual(self.roll_up(), 2)
+
+        self.assertEqual(
+            self.rollups(),
+            set(
+                [
+                    (self.envs[0].id, "passed", 2),
+                    (self.envs[1].id, "failed", 1),
+                    ]
+                ),
+            )
+        rollup = self.model.ResultRollup.objects.all()[0]
+        self.assertEqual(rollup.run, self.run)
+        self.assertEqual(rollup.productversion, self.run.productversion)
+        self.assertEqual(rollup.day, datetime.datetime.utcnow().date())
+
+
+    def test_only_new_results(self):
+        """Each roll-up only adds counts of results since the last."""
+        self.result("passed")
+        self.roll_up()
+        self.result("passed")
+
+        self.assertEqual(self.roll_up(), 1)
+        self.assertEqual(self.roll_up(), 0)
+
+        self.assertEqual(
+            list(self.model.ResultRollup.objects.values_list(
+                "count", flat=True)),
+            [1, 1],
+            )
+
+
+    def test_lag(self):
+        """Results newer than the lag are left for the next roll-up."""
+        self.result("passed")
+
+        self.assertEqual(self.roll_up(lag=datetime.timedelta(minutes=5)), 0)
+        self.assertEqual(self.roll_up(), 1)
+
+
+    def test_pending_and_deleted_not_counted(self):
+        """Pending and deleted results aren't counted."""
+        self.result("started")
+        self.result("failed").delete()
+
+        self.roll_up()
+
+        self.assertEqual(self.rollups(), set())
+
+
+    def test_trends(self):
+        """Daily counts are summed and filled in for days without counts."""
+        day = datetime.date(2012, 1, 1)
+        for offset, status, count in [
+                (0, "passed", 2), (0, "passed", 1), (2, "failed", 1)]:
+            self.F.ResultRollupFactory.create(
+                day=day + datetime.timedelta(days=offset),
+                run=self.run,
+                status=status,
+                count=count,
+                )
+
+        days, counts = self.model.ResultRollup.trends(
+            ["passed", "failed"], run=self.run)
+
+        self.assertEqual(
+            days, [day + datetime.timedelta(days=i) for i in range(3)])
+        self.assertEqual(counts, {"passed": [3, 0, 0], "failed": [0, 0, 1]})
+
+
+    def test_trends_date_range(self):
+        """Trends can be limited to a range of days."""
+        day = datetime.date(2012, 1, 1)
+        self.F.ResultRollupFactory.create(day=day, run=self.run, count=1)
+
+        days, counts = self.model.ResultRollup.trends(
+            ["passed"],
+            start=day + datetime.timedelta(days=1),
+            end=day + datetime.timedelta(days=2),
+            )
+
+        self.assertEqual(len(days), 2)
+        self.assertEqual(counts, {"passed": [0, 0]})
@@ -0,0 +1,178 @@
+"""
+Tests for ResultSummary model.
+
+"""
+from tests import case
+
+
+
+class ResultSummaryTest(case.DBTestCase):
+    """Tests for ResultSummary."""
+    def setUp(self):
+        """Set up a run with one environment and one runcaseversion."""
+        self.envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["OS X", "Linux"]})
+        self.run = self.F.RunFactory.create(environments=self.envs)
+        self.rcv = self.F.RunCaseVersionFactory.create(run=self.run)
+        self.tester = self.F.UserFactory.create()
+
+
+    def counts(self):
+        """Return dict mapping (env id, status) to count for our run."""
+        return dict(
+            ((s.environment_id, s.status), s.count)
+            for s in self.model.ResultSummary.objects.filter(run=self.run)
+            )
+
+
+    def test_new_result_counted(self):
+        """Recording a result increments its run/env/status count."""
+        self.rcv.result_pass(self.envs[0], user=self.tester)
+
+        self.assertEqual(self.counts(), {(self.envs[0].id, "passed"): 1})
+
+
+    def test_superseded_result_uncounted(self):
+        """A result that is no longer latest is removed from the counts."""
+        self.rcv.result_pass(self.envs[0], user=self.tester)
+        self.rcv.result_fail(self.envs[0], user=self.tester)
+
+        self.assertEqual(
+            self.counts(),
+            {
+                (self.envs[0].id, "passed"): 0,
+                (self.envs[0].id, "failed"): 1,
+                }
+            )
+
+
+    def test_adjust_many(self):
+        """adjust_many creates and adjusts several counts at once."""
+        e0, e1 = self.envs[0].id, self.envs[1].id
+        self.rcv.result_pass(self.envs[0], user=self.tester)
+
+        with self.assertNumQueries(7):
+            self.model.ResultSummary.adjust_many(
+                {
+                    (self.run.id, e0, "passed"): -1,
+                    (self.run.id, e0, "skipped"): 1,
+                    (self.run.id, e1, "skipped"): 1,
+                    (self.run.id, e1, "failed"): 0,
+                    }
+                )
+
+        self.assertEqual(
+            self.counts(),
+            {
+                (e0, "passed"): 0,
+                (e0, "skipped"): 1,
+                (e1, "skipped"): 1,
+                }
+            )
+
+
+    def test_summary_for(self):
+        """summary_for sums completed states across environments."""
+        self.rcv.result_pass(self.envs[0], user=self.tester)
+        self.rcv.result_pass(self.envs[1], user=self.tester)
+        self.rcv.start(self.envs[1], user=self.F.UserFactory.create())
+
+        self.assertEqual(
+            self.model.ResultSummary.summary_for(self.run),
+            {"passed": 2, "failed": 0, "blocked": 0, "invalidated": 0},
+            )
+
+
+    def test_rebuild(self):
+        """rebuild recomputes counts from latest results."""
+        self.rcv.result_pass(self.envs[0], user=self.tester)
+        self.rcv.result_block(self.envs[1], user=self.tester)
+        self.model.ResultSummary.objects.all().delete()
+
+        self.model.ResultSummary.rebuild(runs=[self.run])
+
+        self.assertEqual(
+            self.counts(),
+            {
+                (self.envs[0].id, "passed"): 1,
+                (self.envs[1].id, "blocked"): 1,
+                }
+            )
+
+
+    def test_rebuild_only_given_runs(self):
+        """rebuild with runs given leaves other runs' summaries alone."""
+        self.rcv.result_pass(self.envs[0], user=self.tester)
+        other = self.F.ResultFactory.create(status="failed")
+
+        self.model.ResultSummary.rebuild(runs=[self.run])
+
+        self.assertEqual(
+            self.model.ResultSummary.summary_for(
+                other.runcaseversion.run)["failed"],
+            1,
+            )
+
+
+    def test_survives_run_soft_delete(self):
+        """Soft-deleting a run doesn't try to soft-delete its summaries."""
+        self.rcv.result_pass(self.envs[0], user=self.tester)
+
+        self.run.delete()
+
+        self.assertEqual(self.counts(), {(self.envs[0].id, "passed"): 1})
+
+
+    def test_status_edit(self):
+        """Editing the status of a latest result moves it between counts."""
+        self.rcv.result_pass(self.envs[0], user=self.tester)
+        result = self.rcv.results.get()
+        result.status = "failed"
+        result.save()
+
+        self.assertEqual(
+            self.counts(),
+            {
+                (self.envs[0].id, "passed"): 0,
+                (self.envs[0].id, "failed"): 1,
+                }
+            )
+
+
+    def test_bulk_update_status(self):
+        """Bulk-updating the status of results updates the counts."""
+        self.rcv.result_pass(self.envs[0], user=self.tester)
+        result = self.rcv.results.get()
+        result.status = "blocked"
+
+        self.model.Result.objects.bulk_update([result], ["status"])
+
+        self.assertEqual(self.counts(), {(self.envs[0].id, "blocked"): 1})
+
+
+    def test_result_delete(self):
+        """A deleted result is uncounted, and counted again if undeleted."""
+        self.rcv.result_pass(self.envs[0], user=self.tester)
+        result = self.rcv.results.get()
+
+        result.delete()
+
+        self.assertEqual(self.counts(), {})
+
+        result.undelete()
+
+        self.assertEqual(self.counts(), {(self.envs[0].id, "passed"): 1})
+
+
+    def test_runcaseversion_delete(self):
+        """Results deleted with their runcaseversion are uncounted."""
+        self.rcv.result_pass(self.envs[0], user=self.tester)
+
+        self.model.RunCaseVersion.objects.filter(pk=self.rcv.pk).delete()
+
+        self.assertEqual(self.counts(), {})
+
+        self.model.RunCaseVersion.everything.filter(
+            pk=self.rcv.pk).undelete()
+
+        self.assertEqual(self.counts(), {(self.envs[0].id, "passed"): 1})
@@ -6,6 +6,7 @@ import datetime
 from mock import patch
 
 from django.core.exceptions import ValidationError
+from django.db.models import F
 
 from moztrap.model.execution.models import Run
 
@@ -156,6 +157,34 @@ class RunTest(case.DBTestCase):
         self.assertEqual(len(new.team.all()), 2)
 
 
+    def test_clone_inherited_team(self):
+        """Cloning a Run with inherited team leaves the parents' teams alone."""
+        self.F.ProductFactory(team=["Other"])
+        pv = self.F.ProductVersionFactory(
+            product=self.F.ProductFactory(team=["One", "Two"]))
+        pv.add_to_team(self.F.UserFactory.create())
+        pv.has_team = False
+        pv.save()
+        r = self.F.RunFactory(productversion=pv)
+        teams = [
+            set(m.own_team.through.objects.values_list())
+            for m in [self.model.Product, self.model.ProductVersion]
+            ]
+
+        new = r.clone()
+
+        self.assertFalse(new.has_team)
+        self.assertEqual(
+            set(new.team.all()), set(pv.product.team.all()))
+        self.assertEqual(
+            [
+                set(m.own_team.through.objects.values_list())
+                for m in [self.model.Product, self.model.ProductVersion]
+                ],
+            teams,
+            )
+
+
     def test_gets_productversion_envs(self):
         """A new test run inherits the environments of its product version."""
         pv = self.F.ProductVersionFactory.create(
@@ -276,6 +305,202 @@ class RunTest(case.DBTestCase):
         self.assertEqual(run.completion(), 0)
 
 
+    def test_completion_skipped(self):
+        """Skipped case/env combos don't count towards the total."""
+        envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["Windows", "Linux"]})
+        pv = self.F.ProductVersionFactory(environments=envs)
+        run = self.F.RunFactory(productversion=pv)
+        rcv = self.F.RunCaseVersionFactory(
+            run=run, caseversion__productversion=pv)
+
+        self.F.ResultFactory(
+            runcaseversion=rcv, environment=envs[0], status="passed")
+        self.F.ResultFactory(
+            runcaseversion=rcv, environment=envs[1], status="skipped")
+
+        self.assertEqual(run.completion(), 1.0)
+
+
+    def test_completion_single_env(self):
+        """``completion_single_env`` only considers one environment."""
+        envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["Windows", "Linux"]})
+        pv = self.F.ProductVersionFactory(environments=envs)
+        run = self.F.RunFactory(productversion=pv)
+        rcv1 = self.F.RunCaseVersionFactory(
+            run=run, caseversion__productversion=pv)
+        self.F.RunCaseVersionFactory(
+            run=run, caseversion__productversion=pv)
+
+        self.F.ResultFactory(
+            runcaseversion=rcv1, environment=envs[0], status="passed")
+
+        self.assertEqual(run.completion_single_env(envs[0].id), 0.5)
+        self.assertEqual(run.completion_single_env(envs[1].id), 0)
+
+
+    def test_stored_completion(self):
+        """Stored ``completion_cache`` is updated as results are recorded."""
+        envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["Windows", "Linux"]})
+        pv = self.F.ProductVersionFactory(environments=envs)
+        run = self.F.RunFactory(productversion=pv)
+        rcv = self.F.RunCaseVersionFactory(
+            run=run, caseversion__productversion=pv)
+
+        self.F.ResultFactory(
+            runcaseversion=rcv, environment=envs[0], status="passed")
+
+        self.assertEqual(self.refresh(run).completion_cache, 0.5)
+        self.assertEqual(self.refresh(rcv).completion_cache, 0.5)
+
+
+    def test_stored_completion_incremental(self):
+        """Stored completion adjusted per result matches a full recompute."""
+        from moztrap.model.execution.models import run_completion
+        envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["Windows", "Linux"]})
+        pv = self.F.ProductVersionFactory(environments=envs)
+        run = self.F.RunFactory(productversion=pv)
+        rcv1 = self.F.RunCaseVersionFactory(
+            run=run, caseversion__productversion=pv)
+        rcv2 = self.F.RunCaseVersionFactory(
+            run=run, caseversion__productversion=pv)
+        t1 = self.F.UserFactory()
+        t2 = self.F.UserFactory()
+
+        for rcv, env, tester, status in [
+                (rcv1, envs[0], t1, "skipped"),
+                (rcv1, envs[0], t2, "passed"),
+                (rcv1, envs[1], t1, "started"),
+                (rcv2, envs[0], t1, "failed"),
+                (rcv1, envs[0], t1, "passed"),
+                (rcv2, envs[1], t2, "skipped"),
+                ]:
+            self.F.ResultFactory(
+                runcaseversion=rcv, environment=env, tester=tester,
+                status=status)
+            run = self.refresh(run)
+            self.assertEqual(
+                run.completion_cache, run_completion([run])[run.id])
+
+        self.assertEqual(
+            (run.completion_done, run.completion_total), (2, 3))
+
+
+    def test_stored_completion_deletes(self):
+        """Stored completion follows deleted and undeleted results and rcvs."""
+        envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["Windows", "Linux"]})
+        pv = self.F.ProductVersionFactory(environments=envs)
+        run = self.F.RunFactory(productversion=pv)
+        rcv1 = self.F.RunCaseVersionFactory(
+            run=run, caseversion__productversion=pv)
+        rcv2 = self.F.RunCaseVersionFactory(
+            run=run, caseversion__productversion=pv)
+        result = self.F.ResultFactory(
+            runcaseversion=rcv1, environment=envs[0], status="passed")
+
+        self.assertEqual(self.refresh(run).completion_cache, 0.25)
+
+        rcv2.delete()
+
+        self.assertEqual(self.refresh(run).completion_cache, 0.5)
+
+        result.delete()
+
+        self.assertEqual(self.refresh(run).completion_cache, 0)
+        self.assertEqual(self.refresh(rcv1).completion_cache, 0)
+
+        self.model.RunCaseVersion.everything.filter(run=run).undelete()
+        result.undelete()
+
+        self.assertEqual(self.refresh(run).completion_cache, 0.25)
+        self.assertEqual(self.refresh(rcv1).completion_cache, 0.5)
+
+
+    def test_stored_completion_status_edit(self):
+        """Editing a result to skipped makes it count as not completed."""
+        envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["Windows", "Linux"]})
+        pv = self.F.ProductVersionFactory(environments=envs)
+        run = self.F.RunFactory(productversion=pv)
+        rcv = self.F.RunCaseVersionFactory(
+            run=run, caseversion__productversion=pv)
+        result = self.F.ResultFactory(
+            runcaseversion=rcv, environment=envs[0], status="passed")
+
+        result.status = "skipped"
+        result.save()
+
+        self.assertEqual(self.refresh(run).completion_cache, 0)
+        self.assertEqual(
+            (self.refresh(run).completion_done,
+             self.refresh(run).completion_total),
+            (0, 1),
+            )
+
+
+    def test_stored_completion_unchanged(self):
+        """A result that doesn't change completion doesn't write the run."""
+        envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["Windows", "Linux"]})
+        pv = self.F.ProductVersionFactory(environments=envs)
+        run = self.F.RunFactory(productversion=pv)
+        rcv = self.F.RunCaseVersionFactory(
+            run=run, caseversion__productversion=pv)
+        self.F.ResultFactory(
+            runcaseversion=rcv, environment=envs[0], status="passed")
+        result = self.F.ResultFactory.build(
+            runcaseversion=rcv, environment=envs[0], status="failed",
+            tester=self.F.UserFactory())
+
+        from django.conf import settings
+        from django.db import connection
+
+        settings.DEBUG = True
+        connection.queries = []
+
+        try:
+            result.save()
+            updates = [
+                x["sql"] for x in connection.queries
+                if x["sql"].startswith("UPDATE execution_run")
+                ]
+        finally:
+            settings.DEBUG = False
+
+        self.assertEqual(updates, [])
+
+        self.assertEqual(self.refresh(run).completion_cache, 0.5)
+
+
+    def test_completion_many_runs_one_query(self):
+        """``run_completion`` computes completion of many runs in one query."""
+        from moztrap.model.execution.models import run_completion
+        envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["Windows", "Linux"]})
+        pv = self.F.ProductVersionFactory(environments=envs)
+        r1 = self.F.RunFactory(productversion=pv)
+        rcv1 = self.F.RunCaseVersionFactory(
+            run=r1, caseversion__productversion=pv)
+        r2 = self.F.RunFactory(productversion=pv)
+        rcv2 = self.F.RunCaseVersionFactory(
+            run=r2, caseversion__productversion=pv)
+        r3 = self.F.RunFactory(productversion=pv)
+
+        self.F.ResultFactory(
+            runcaseversion=rcv1, environment=envs[0], status="failed")
+        self.F.ResultFactory(
+            runcaseversion=rcv2, environment=envs[0], status="passed")
+        self.F.ResultFactory(
+            runcaseversion=rcv2, environment=envs[1], status="blocked")
+
+        with self.assertNumQueries(1):
+            completions = run_completion([r1, r2, r3])
+
+        self.assertEqual(completions, {r1.id: 0.5, r2.id: 1.0, r3.id: 0})
 
 
 
@@ -452,6 +677,130 @@ class RunActivationTest(case.DBTestCase):
         self.assertOrderedCaseVersions(r, [tcv1, tcv2, tcv3, tcv4])
 
 
+    def test_refresh_reorders(self):
+        """Refresh reorders existing runcaseversions in one update."""
+        ts = self.F.SuiteFactory.create(product=self.p, status="active")
+        cvs = []
+        for order in range(3):
+            cv = self.F.CaseVersionFactory.create(
+                case__product=self.p, productversion=self.pv8, status="active")
+            self.F.SuiteCaseFactory.create(suite=ts, case=cv.case, order=order)
+            cvs.append(cv)
+        r = self.F.RunFactory.create(productversion=self.pv8)
+        self.F.RunSuiteFactory.create(suite=ts, run=r)
+        r.activate()
+        self.model.SuiteCase.objects.filter(suite=ts).update(
+            order=F("order") * -1)
+
+        from django.conf import settings
+        from django.db import connection
+
+        settings.DEBUG = True
+        connection.queries = []
+
+        try:
+            # a bulk update records no change, so reconcile in full
+            r.refresh(full=True)
+            reorders = [
+                x["sql"] for x in connection.queries
+                if x["sql"].startswith("UPDATE execution_runcaseversion")
+                ]
+        finally:
+            settings.DEBUG = False
+
+        self.assertEqual(len(reorders), 1)
+        self.assertOrderedCaseVersions(r, list(reversed(cvs)))
+
+
+    def create_active_run(self, num_cases=2):
+        """Return an active run of one suite with ``num_cases`` cases."""
+        ts = self.F.SuiteFactory.create(product=self.p, status="active")
+        for i in range(num_cases):
+            cv = self.F.CaseVersionFactory.create(
+                case__product=self.p, productversion=self.pv8, status="active")
+            self.F.SuiteCaseFactory.create(suite=ts, case=cv.case, order=i)
+        r = self.F.RunFactory.create(productversion=self.pv8)
+        self.F.RunSuiteFactory.create(suite=ts, run=r)
+        r.activate()
+        return r, ts
+
+
+    def test_refresh_applies_recorded_changes(self):
+        """Refresh picks up a case added to a suite, syncing only its envs."""
+        r, ts = self.create_active_run()
+        untouched = r.runcaseversions.all()[0]
+        untouched.environments.clear()
+        cv = self.F.CaseVersionFactory.create(
+            case__product=self.p, productversion=self.pv8, status="active")
+        self.F.SuiteCaseFactory.create(suite=ts, case=cv.case, order=5)
+
+        r.refresh()
+
+        new = r.runcaseversions.get(caseversion=cv)
+        self.assertEqual(set(new.environments.all()), set(self.envs))
+        self.assertEqual(untouched.environments.count(), 0)
+        self.assertEqual(
+            self.refresh(r).last_lockchange,
+            self.model.LockChange.objects.order_by("-id")[0].id,
+            )
+
+
+    def test_refresh_full(self):
+        """A full refresh syncs envs of all runcaseversions."""
+        r, ts = self.create_active_run()
+        rcv = r.runcaseversions.all()[0]
+        rcv.environments.clear()
+
+        r.refresh(full=True)
+
+        self.assertEqual(set(rcv.environments.all()), set(self.envs))
+
+
+    def test_refresh_caseversion_envs_changed(self):
+        """Envs added to a caseversion are added to its runcaseversions."""
+        r, ts = self.create_active_run()
+        rcv = r.runcaseversions.all()[0]
+        rcv.caseversion.remove_envs(self.envs[0])
+        self.assertEqual(set(rcv.environments.all()), set(self.envs[1:]))
+
+        self.refresh(rcv.caseversion).add_envs(self.envs[0])
+        r.refresh()
+
+        self.assertEqual(set(rcv.environments.all()), set(self.envs))
+
+
+    def test_refresh_no_relevant_changes(self):
+        """Changes to other suites don't touch the run's runcaseversions."""
+        r, ts = self.create_active_run()
+        self.F.SuiteCaseFactory.create()
+        r = self.refresh(r)
+
+        with self.assertNumQueries(4):
+            r.refresh()
+
+        self.assertEqual(
+            self.refresh(r).last_lockchange,
+            self.model.LockChange.objects.order_by("-id")[0].id,
+            )
+
+
+    def test_refresh_run_suites_changed(self):
+        """If the run's own suites changed, it's fully locked."""
+        r, ts = self.create_active_run(num_cases=1)
+        rcv = r.runcaseversions.get()
+        rcv.environments.clear()
+        ts2 = self.F.SuiteFactory.create(product=self.p, status="active")
+        cv = self.F.CaseVersionFactory.create(
+            case__product=self.p, productversion=self.pv8, status="active")
+        self.F.SuiteCaseFactory.create(suite=ts2, case=cv.case)
+        self.F.RunSuiteFactory.create(suite=ts2, run=r, order=1)
+
+        r.refresh()
+
+        self.assertOrderedCaseVersions(r, [rcv.caseversion, cv])
+        self.assertEqual(set(rcv.environments.all()), set(self.envs))
+
+
     def test_sets_status_active(self):
         """Sets status of run to active."""
         r = self.F.RunFactory.create(status="draft")
@@ -498,6 +847,108 @@ class RunActivationTest(case.DBTestCase):
         self.assertCaseVersions(r, [])
 
 
+    def create_series(self, num_cases=2):
+        """Return a draft run series of one suite with ``num_cases`` cases."""
+        ts = self.F.SuiteFactory.create(product=self.p, status="active")
+        cvs = []
+        for i in range(num_cases):
+            cv = self.F.CaseVersionFactory.create(
+                case__product=self.p, productversion=self.pv8, status="active")
+            self.F.SuiteCaseFactory.create(suite=ts, case=cv.case, order=i)
+            cvs.append(cv)
+        series = self.F.RunFactory.create(
+            productversion=self.pv8, is_series=True, environments=self.envs)
+        self.F.RunSuiteFactory.create(suite=ts, run=series)
+        return series, ts, cvs
+
+
+    def test_series_member_copies_previous_member(self):
+        """A series member with unchanged suites copies the previous lock."""
+        series, ts, cvs = self.create_series()
+        cvs[0].environments.remove(self.envs[0])
+        first = series.clone_for_series(build="1")
+        first.activate()
+
+        second = series.clone_for_series(build="2")
+        with patch.object(
+                Run, "_bulk_insert_new_runcaseversions") as bulk_insert:
+            with patch.object(Run, "_dedupe_runcaseversions") as dedupe:
+                second.activate()
+
+        self.assertFalse(bulk_insert.called)
+        # neither cases nor environments are selected again
+        self.assertFalse(dedupe.called)
+        self.assertOrderedCaseVersions(second, cvs)
+        self.assertEqual(
+            [set(rcv.environments.all()) for rcv in second.runcaseversions.all()],
+            [set(self.envs[1:]), set(self.envs)],
+            )
+        self.assertEqual(first.runcaseversions.count(), 2)
+
+
+    def test_series_member_suites_changed(self):
+        """If the suites changed since the previous member, it's fully locked."""
+        series, ts, cvs = self.create_series()
+        series.clone_for_series(build="1").activate()
+        cv = self.F.CaseVersionFactory.create(
+            case__product=self.p, productversion=self.pv8, status="active")
+        self.F.SuiteCaseFactory.create(suite=ts, case=cv.case, order=5)
+
+        second = series.clone_for_series(build="2")
+        copy = Run.__dict__["_copy_series_lock"]
+        sync = Run.__dict__["_bulk_update_runcaseversion_environments_for_lock"]
+        copied, synced = [], []
+
+        def record_copy(run, *args, **kwargs):
+            copied.append(run)
+            return copy(run, *args, **kwargs)
+
+        def record_sync(run, *args, **kwargs):
+            synced.extend(kwargs["runcaseversions"])
+            return sync(run, *args, **kwargs)
+
+        with patch.object(Run, "_copy_series_lock", record_copy):
+            with patch.object(
+                    Run,
+                    "_bulk_update_runcaseversion_environments_for_lock",
+                    record_sync):
+                second.activate()
+
+        self.assertOrderedCaseVersions(second, cvs + [cv])
+        # the previous lock is copied, and only the change applied to it
+        self.assertEqual(copied, [second])
+        self.assertEqual([rcv.caseversion for rcv in synced], [cv])
+
+
+    def test_series_member_source_suites_changed(self):
+        """If the previous member's own suites changed, it's not copied."""
+        series, ts, cvs = self.create_series()
+        first = series.clone_for_series(build="1")
+        first.activate()
+        self.model.LockChange.record(runs=[first.id])
+
+        second = series.clone_for_series(build="2")
+        with patch.object(Run, "_copy_series_lock") as copy:
+            second.activate()
+
+        self.assertFalse(copy.called)
+        self.assertOrderedCaseVersions(second, cvs)
+
+
+    def test_first_series_member_fully_locked(self):
+        """The first member of a series has nothing to copy."""
+        series, ts, cvs = self.create_series()
+
+        first = series.clone_for_series(build="1")
+        first.activate()
+
+        self.assertOrderedCaseVersions(first, cvs)
+        self.assertEqual(
+            set(first.runcaseversions.all()[0].environments.all()),
+            set(self.envs),
+            )
+
+
     def test_disabled(self):
         """Sets disabled run to active but does not create runcaseversions."""
         tc = self.F.CaseFactory.create(product=self.p)
@@ -621,6 +1072,51 @@ class RunActivationTest(case.DBTestCase):
         self.assertEqual(set(rcv.environments.all()), set(self.envs[1:]))
 
 
+    def test_syncs_envs_in_chunks(self):
+        """Envs of runcaseversions are synced in chunks of bounded size."""
+        r = self.F.RunFactory.create(productversion=self.pv8, status="draft")
+        ts = self.F.SuiteFactory.create(product=self.p, status="active")
+        self.F.RunSuiteFactory.create(suite=ts, run=r)
+        rcvs = []
+        for i in range(3):
+            rcv = self.F.RunCaseVersionFactory.create(
+                run=r,
+                caseversion__productversion=self.pv8,
+                caseversion__status="active",
+                )
+            self.F.SuiteCaseFactory.create(suite=ts, case=rcv.caseversion.case)
+            rcv.caseversion.environments.remove(self.envs[0])
+            rcvs.append(rcv)
+        rcvs[1].environments.clear()
+
+        with patch("moztrap.model.execution.models.ENV_SYNC_CHUNK_SIZE", 1):
+            r.activate()
+
+        for rcv in rcvs:
+            self.assertEqual(set(rcv.environments.all()), set(self.envs[1:]))
+
+
+    def test_updates_stored_completion(self):
+        """Re-activating recomputes completion after env changes."""
+        r = self.F.RunFactory.create(productversion=self.pv8, status="draft")
+        rcv = self.F.RunCaseVersionFactory.create(
+            run=r,
+            caseversion__productversion=self.pv8,
+            caseversion__status="active",
+            )
+        ts = self.F.SuiteFactory.create(product=self.p, status="active")
+        self.F.SuiteCaseFactory.create(suite=ts, case=rcv.caseversion.case)
+        self.F.RunSuiteFactory.create(suite=ts, run=r)
+        self.F.ResultFactory.create(
+            runcaseversion=rcv, environment=self.envs[1], status="passed")
+        rcv.caseversion.environments.remove(*self.envs[2:])
+
+        r.activate()
+
+        self.assertEqual(self.refresh(rcv).completion_cache, 0.5)
+        self.assertEqual(self.refresh(r).completion_cache, 0.5)
+
+
     def test_removes_draft_caseversions_and_their_results(self):
         """Re-activating removes caseversions that are now draft."""
         r = self.F.RunFactory.create(productversion=self.pv8, status="draft")
@@ -943,7 +1439,7 @@ class RunActivationTest(case.DBTestCase):
         connection.queries = []
 
         try:
-            with self.assertNumQueries(18):
+            with self.assertNumQueries(26):
                 r.activate()
 
             # to debug, uncomment these lines:
@@ -957,9 +1453,9 @@ class RunActivationTest(case.DBTestCase):
             updates = [x["sql"] for x in connection.queries if x["sql"].startswith("UPDATE")]
             deletes = [x["sql"] for x in connection.queries if x["sql"].startswith("DELETE")]
 
-            self.assertEqual(len(selects), 11)
+            self.assertEqual(len(selects), 16)
             self.assertEqual(len(inserts), 2)
-            self.assertEqual(len(updates), 2)
+            self.assertEqual(len(updates), 5)
             self.assertEqual(len(deletes), 3)
         except AssertionError as e:
             raise e
@@ -427,6 +427,58 @@ class RunCaseVersionTest(case.DBTestCase):
         self.assertEqual(set(results), set([u"started"]))
 
 
+    def test_start_and_skip_keep_other_latest(self):
+        """Starting and skipping leave the tester's other latest results."""
+        envs = self.F.EnvironmentFactory.create_full_set(
+                {"OS": ["OS X", "Linux"]})
+        run = self.F.RunFactory.create(environments=envs)
+        rcv = self.F.RunCaseVersionFactory.create(run=run, environments=envs)
+        other = self.F.RunCaseVersionFactory.create(
+            run=run, environments=envs)
+        u = self.F.UserFactory.create()
+        rcv.result_pass(envs[1], user=u)
+        for env in envs:
+            other.result_fail(env, user=u)
+
+        rcv.start(environment=envs[0], user=u)
+        rcv.result_skip(environment=envs[0], user=u)
+        rcv.start(environment=envs[0], user=u)
+
+        self.assertEqual(
+            set(other.results.filter(is_latest=True).values_list(
+                "environment", "status")),
+            set([(env.id, "failed") for env in envs]),
+            )
+        self.assertEqual(
+            set(self.model.LatestResult.objects.values_list(
+                "result", flat=True)),
+            set(self.model.Result.objects.filter(
+                is_latest=True).values_list("id", flat=True)),
+            )
+
+
+    def test_result_skip_query_count(self):
+        """Skipping and restarting cost the same whatever the env count."""
+        u = self.F.UserFactory.create()
+        for num_envs in [2, 6]:
+            envs = self.F.EnvironmentFactory.create_set(
+                ["OS"], *[["OS {0}".format(i)] for i in range(num_envs)])
+            run = self.F.RunFactory.create(environments=envs)
+            rcv = self.F.RunCaseVersionFactory.create(
+                run=run, environments=envs)
+
+            with self.assertNumQueries(19):
+                rcv.result_skip(environment=envs[0], user=u)
+            with self.assertNumQueries(22):
+                rcv.start(environment=envs[0], user=u)
+
+            self.assertEqual(
+                set(rcv.results.filter(is_latest=True).values_list(
+                    "environment", "status")),
+                set([(env.id, "started") for env in envs]),
+                )
+
+
     def test_result_fail(self):
         """result_fail creates result with status failed."""
         envs = self.F.EnvironmentFactory.create_full_set(
@@ -576,3 +628,36 @@ class RunCaseVersionTest(case.DBTestCase):
 
         r = rcv.results.get(is_latest=True)
         self.assertEqual(r.stepresults.count(), 0)
+
+
+    def test_result_fail_does_not_save_runcaseversion(self):
+        """result_fail doesn't write the runcaseversion row."""
+        envs = self.F.EnvironmentFactory.create_full_set(
+                {"OS": ["OS X"], "Language": ["English"]})
+        run = self.F.RunFactory.create(environments=envs)
+        rcv = self.F.RunCaseVersionFactory.create(run=run)
+        u = self.F.UserFactory.create()
+        version = self.refresh(rcv).cc_version
+
+        rcv.result_fail(environment=envs[0], user=u)
+
+        self.assertEqual(self.refresh(rcv).cc_version, version)
+
+
+    def test_result_fail_steps_loaded_once(self):
+        """Steps are looked up once per runcaseversion instance."""
+        step = self.F.CaseStepFactory.create(number=1)
+        envs = self.F.EnvironmentFactory.create_full_set(
+                {"OS": ["OS X", "Linux"]})
+        run = self.F.RunFactory.create(environments=envs)
+        rcv = self.F.RunCaseVersionFactory.create(
+            run=run,
+            caseversion=step.caseversion,
+            )
+        u = self.F.UserFactory.create()
+
+        rcv.result_fail(environment=envs[0], user=u, stepnumber=1)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(rcv.step_for("1"), step)
+            self.assertEqual(rcv.step_for("x"), None)
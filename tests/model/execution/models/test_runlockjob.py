@@ -0,0 +1,208 @@
+"""
+Tests for RunLockJob model.
+
+"""
+from django.test.utils import override_settings
+
+from mock import patch
+
+from tests import case
+
+
+
+class RunLockJobTest(case.DBTestCase):
+    """Tests for RunLockJob."""
+    def setUp(self):
+        """Set up a draft run with one active case in an active suite."""
+        envs = self.F.EnvironmentFactory.create_full_set({"OS": ["Linux"]})
+        self.run = self.F.RunFactory.create(environments=envs)
+        pv = self.run.productversion
+        self.cv = self.F.CaseVersionFactory.create(
+            productversion=pv, status="active", environments=envs)
+        suite = self.F.SuiteFactory.create(
+            product=pv.product, status="active")
+        self.F.SuiteCaseFactory.create(suite=suite, case=self.cv.case)
+        self.F.RunSuiteFactory.create(suite=suite, run=self.run)
+
+
+    @property
+    def job_model(self):
+        """The RunLockJob model class."""
+        return self.model.RunLockJob
+
+
+    def test_unicode(self):
+        """Unicode representation has run name and status."""
+        job = self.job_model.enqueue(self.run)
+
+        self.assertEqual(
+            unicode(job), u"Lock of run '{0}' (queued)".format(self.run.name))
+
+
+    @override_settings(BACKGROUND_RUN_LOCK=True)
+    def test_activate_enqueues(self):
+        """With BACKGROUND_RUN_LOCK, activating queues a lock job."""
+        self.run.activate()
+
+        job = self.job_model.objects.get()
+        self.assertEqual(job.run, self.run)
+        self.assertEqual(job.status, "queued")
+        self.assertEqual(job.activate, True)
+        self.assertEqual(self.run.runcaseversions.count(), 0)
+        self.assertEqual(self.run.pending_lock(), job)
+        self.assertEqual(self.refresh(self.run).status, "draft")
+
+
+    def test_activate_locks_in_request(self):
+        """Without BACKGROUND_RUN_LOCK, activating locks immediately."""
+        self.run.activate()
+
+        self.assertEqual(self.job_model.objects.count(), 0)
+        self.assertEqual(self.run.runcaseversions.count(), 1)
+        self.assertEqual(self.run.pending_lock(), None)
+
+
+    def test_background_lock_off_by_default(self):
+        """Runs are locked in the request unless the worker is opted into."""
+        from moztrap.settings import base
+
+        self.assertEqual(base.BACKGROUND_RUN_LOCK, False)
+
+
+    def test_enqueue_coalesces(self):
+        """A run has at most one queued job."""
+        job = self.job_model.enqueue(self.run)
+
+        self.assertEqual(self.job_model.enqueue(self.run), job)
+        self.assertEqual(self.job_model.objects.count(), 1)
+
+
+    def test_enqueue_full_wins(self):
+        """A queued incremental lock becomes full if a full lock is queued."""
+        job = self.job_model.enqueue(self.run, full=False)
+
+        self.job_model.enqueue(self.run)
+
+        self.assertEqual(self.refresh(job).full, True)
+
+
+    @override_settings(BACKGROUND_RUN_LOCK=True)
+    def test_refresh_enqueues_incremental(self):
+        """Refreshing queues a lock that only applies recorded changes."""
+        self.run.status = "active"
+
+        self.run.refresh()
+
+        self.assertEqual(self.job_model.objects.get().full, False)
+
+
+    def test_claim(self):
+        """Claiming marks the oldest queued job running."""
+        job = self.job_model.enqueue(self.run)
+        self.job_model.enqueue(self.F.RunFactory.create())
+
+        claimed = self.job_model.claim()
+
+        self.assertEqual(claimed, job)
+        self.assertEqual(self.refresh(job).status, "running")
+        self.assertIsNotNone(self.refresh(job).started_on)
+
+
+    def test_claim_none_queued(self):
+        """Claiming returns None if no jobs are queued."""
+        self.assertEqual(self.job_model.claim(), None)
+
+
+    def test_claim_skips_running_run(self):
+        """A job for a run that already has a running job isn't claimed."""
+        self.job_model.enqueue(self.run)
+        self.job_model.claim()
+        self.job_model.enqueue(self.run)
+
+        self.assertEqual(self.job_model.claim(), None)
+
+
+    def test_execute(self):
+        """Executing locks in the run's caseversions and marks job done."""
+        job = self.job_model.enqueue(self.run)
+        job = self.job_model.claim()
+
+        job.execute()
+
+        job = self.refresh(job)
+        self.assertEqual(job.status, "done")
+        self.assertEqual(job.progress, 100)
+        self.assertIsNotNone(job.finished_on)
+        self.assertEqual(
+            [rcv.caseversion for rcv in self.run.runcaseversions.all()],
+            [self.cv],
+            )
+        self.assertEqual(self.run.pending_lock(), None)
+
+
+    def test_execute_activates(self):
+        """A job queued by activating the run activates it once locked."""
+        job = self.job_model.enqueue(self.run, activate=True)
+        job = self.job_model.claim()
+
+        job.execute()
+
+        self.assertEqual(self.refresh(self.run).status, "active")
+
+
+    def test_execute_refresh_doesnt_activate(self):
+        """A job queued by refreshing leaves the run's status alone."""
+        job = self.job_model.enqueue(self.run, full=False)
+
+        job.execute()
+
+        self.assertEqual(self.refresh(self.run).status, "draft")
+
+
+    def test_enqueue_activate_wins(self):
+        """A queued refresh also activates if an activation is queued."""
+        job = self.job_model.enqueue(self.run, full=False)
+
+        self.job_model.enqueue(self.run, full=False, activate=True)
+
+        job = self.refresh(job)
+        self.assertEqual((job.full, job.activate), (False, True))
+
+
+    def test_execute_reports_progress(self):
+        """Each stage of the lock is reported."""
+        job = self.job_model.enqueue(self.run)
+        stages = []
+        job.report = lambda stage, progress: stages.append(stage)
+
+        job.execute()
+
+        self.assertEqual(
+            stages,
+            [
+                "selecting cases",
+                "removing cases",
+                "ordering cases",
+                "adding cases",
+                "setting environments",
+                "setting environments",
+                "computing completion",
+                ]
+            )
+
+
+    def test_execute_failure(self):
+        """If the lock fails, the job is marked failed with the traceback."""
+        job = self.job_model.enqueue(self.run, activate=True)
+
+        def fail(progress=None, full=True):
+            raise ValueError("boom")
+
+        with patch.object(job.run, "_lock_case_versions", fail):
+            job.execute()
+
+        job = self.refresh(job)
+        self.assertEqual(job.status, "failed")
+        self.assertIn("ValueError: boom", job.error)
+        self.assertEqual(self.run.pending_lock(), None)
+        self.assertEqual(self.refresh(self.run).status, "draft")
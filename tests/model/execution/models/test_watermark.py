@@ -0,0 +1,24 @@
+"""
+Tests for Watermark model.
+
+"""
+from tests import case
+
+
+
+class WatermarkTest(case.DBTestCase):
+    """Tests for Watermark."""
+    def test_lock_creates(self):
+        """Locking a new watermark creates it at zero."""
+        wm = self.model.Watermark.lock("foo")
+
+        self.assertEqual(wm.name, "foo")
+        self.assertEqual(wm.last_id, 0)
+
+
+    def test_lock_existing(self):
+        """Locking an existing watermark returns it."""
+        self.model.Watermark.objects.create(name="foo", last_id=3)
+
+        self.assertEqual(self.model.Watermark.lock("foo").last_id, 3)
+        self.assertEqual(self.model.Watermark.objects.count(), 1)
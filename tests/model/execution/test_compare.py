@@ -0,0 +1,194 @@
+"""
+Tests for build-over-build comparison of results.
+
+"""
+from django.core.cache import cache
+
+from tests import case
+
+
+
+class CompareRunsTest(case.DBTestCase):
+    """Tests for compare_runs and run_statuses."""
+    def setUp(self):
+        """Set up a series with two builds of one case in two environments."""
+        cache.clear()
+        self.envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["OS X", "Linux"]})
+        self.cv = self.F.CaseVersionFactory.create()
+        self.series = self.F.RunFactory.create(
+            is_series=True, productversion=self.cv.productversion)
+        self.builds = []
+        self.rcvs = []
+        for build in ["1", "2"]:
+            run = self.F.RunFactory.create(
+                series=self.series,
+                build=build,
+                status="active",
+                productversion=self.cv.productversion,
+                environments=self.envs,
+                )
+            self.builds.append(run)
+            self.rcvs.append(
+                self.F.RunCaseVersionFactory.create(
+                    run=run, caseversion=self.cv, environments=self.envs))
+
+
+    def result(self, build, env, status, **kwargs):
+        """Create a result for case in given build (index) and env (index)."""
+        kwargs.setdefault("tester", self.F.UserFactory.create())
+        return self.F.ResultFactory.create(
+            runcaseversion=self.rcvs[build],
+            environment=self.envs[env],
+            status=status,
+            **kwargs
+            )
+
+
+    def compare(self, runs=None):
+        """Compare given runs (default both builds); return list of dicts."""
+        from moztrap.model.execution.compare import compare_runs
+        return compare_runs(runs or self.builds)
+
+
+    def test_transitions(self):
+        """Regressions, new failures and fixes are found per env."""
+        self.result(0, 0, "passed")
+        self.result(1, 0, "failed")
+        self.result(1, 1, "blocked")
+
+        [c] = self.compare()
+
+        case_id = self.cv.case.id
+        self.assertEqual(c["from"], self.builds[0])
+        self.assertEqual(c["to"], self.builds[1])
+        self.assertEqual(
+            c["regressed"],
+            [(case_id, self.envs[0].id, "passed", "failed")])
+        self.assertEqual(
+            c["new_failures"],
+            [(case_id, self.envs[1].id, None, "blocked")])
+        self.assertEqual(c["fixed"], [])
+
+
+    def test_fixed(self):
+        """A failure followed by a pass is fixed."""
+        self.result(0, 0, "failed")
+        self.result(1, 0, "passed")
+
+        [c] = self.compare()
+
+        self.assertEqual(
+            c["fixed"],
+            [(self.cv.case.id, self.envs[0].id, "failed", "passed")])
+        self.assertEqual(c["regressed"], [])
+
+
+    def test_most_severe_status(self):
+        """Of several testers' results, the most severe counts."""
+        self.result(0, 0, "passed")
+        self.result(1, 0, "passed")
+        self.result(1, 0, "failed")
+        self.result(1, 0, "invalidated")
+
+        [c] = self.compare()
+
+        self.assertEqual(len(c["regressed"]), 1)
+
+
+    def test_pending_not_compared(self):
+        """Started and skipped results are not completed statuses."""
+        self.result(0, 0, "passed")
+        self.result(1, 0, "started")
+        self.result(1, 1, "skipped")
+
+        [c] = self.compare()
+
+        self.assertEqual(c["regressed"] + c["new_failures"] + c["fixed"], [])
+
+
+    def test_grouped_queries(self):
+        """Statuses of all runs are read in one query."""
+        self.result(0, 0, "passed")
+        self.result(1, 0, "failed")
+
+        with self.assertNumQueries(1):
+            self.compare()
+
+
+    def test_finished_runs_cached(self):
+        """Statuses of disabled runs are cached; only watermarks are read."""
+        self.result(0, 0, "passed")
+        self.result(1, 0, "failed")
+        for run in self.builds:
+            run.deactivate()
+
+        self.compare()
+        with self.assertNumQueries(1):
+            [c] = self.compare()
+
+        self.assertEqual(len(c["regressed"]), 1)
+
+
+    def test_finished_run_new_result_not_stale(self):
+        """A result recorded in a finished run changes its cache key."""
+        self.result(0, 0, "passed")
+        self.result(1, 0, "passed")
+        for run in self.builds:
+            run.deactivate()
+        self.compare()
+
+        self.result(1, 0, "failed")
+        [c] = self.compare()
+
+        self.assertEqual(len(c["regressed"]), 1)
+
+
+    def test_finished_run_edited_result_not_stale(self):
+        """Editing a latest result in a finished run changes its cache key."""
+        self.result(0, 0, "passed")
+        r = self.result(1, 0, "passed")
+        for run in self.builds:
+            run.deactivate()
+        self.compare()
+
+        r.status = "failed"
+        r.save()
+        [c] = self.compare()
+
+        self.assertEqual(len(c["regressed"]), 1)
+
+
+    def test_finished_run_deleted_runcaseversion_not_stale(self):
+        """Deleting a case from a finished run changes its cache key."""
+        self.result(0, 0, "passed")
+        self.result(1, 0, "failed")
+        for run in self.builds:
+            run.deactivate()
+        self.compare()
+
+        self.rcvs[1].delete()
+        [c] = self.compare()
+
+        self.assertEqual(c["regressed"], [])
+
+
+    def test_reactivated_run_not_stale(self):
+        """Reactivating a run changes its cache key."""
+        for run in self.builds:
+            run.deactivate()
+        self.compare()
+
+        self.builds[1].activate()
+        self.result(1, 0, "failed")
+        [c] = self.compare()
+
+        self.assertEqual(len(c["new_failures"]), 1)
+
+
+    def test_series_members(self):
+        """Non-draft members of a series, in build order."""
+        from moztrap.model.execution.compare import series_members
+        self.F.RunFactory.create(series=self.series, status="draft")
+
+        self.assertEqual(series_members(self.series), self.builds)
@@ -0,0 +1,125 @@
+# coding: utf-8
+"""
+Tests for streaming export of run results.
+
+"""
+import csv
+import json
+from cStringIO import StringIO
+
+from tests import case
+
+
+
+class ExportTest(case.DBTestCase):
+    """Tests for result export."""
+    def setUp(self):
+        """Set up a run with results of two cases in two environments."""
+        self.envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["OS X", "Linux"], "Browser": ["Firefox"]})
+        self.run = self.F.RunFactory.create(environments=self.envs)
+        self.rcvs = [
+            self.F.RunCaseVersionFactory.create(
+                run=self.run,
+                environments=self.envs,
+                caseversion__name=u"Case ☃ {0}".format(i),
+                )
+            for i in range(2)
+            ]
+        self.tester = self.F.UserFactory.create(username="tester")
+        self.results = [
+            self.F.ResultFactory.create(
+                runcaseversion=rcv,
+                environment=env,
+                tester=self.tester,
+                status="passed",
+                )
+            for rcv in self.rcvs
+            for env in self.envs
+            ]
+
+
+    def rows(self, **kwargs):
+        """Return list of exported row dicts."""
+        from moztrap.model.execution.export import result_rows
+        return list(result_rows(self.run, **kwargs))
+
+
+    def test_rows(self):
+        """A row per result, in ID order, with all fields."""
+        result = self.F.ResultFactory.create(
+            runcaseversion=self.rcvs[0],
+            environment=self.envs[1],
+            tester=self.tester,
+            status="failed",
+            comment="broken",
+            )
+        self.F.StepResultFactory.create(
+            result=result, bug_url="http://example.com/1")
+
+        rows = self.rows()
+
+        self.assertEqual(
+            [r["result_id"] for r in rows],
+            [r.id for r in self.results] + [result.id])
+        row = rows[-1]
+        self.assertEqual(row["case_id"], self.rcvs[0].caseversion.case.id)
+        self.assertEqual(row["case_name"], u"Case ☃ 0")
+        self.assertEqual(row["environment"], unicode(self.envs[1]))
+        self.assertEqual(row["tester"], "tester")
+        self.assertEqual(row["status"], "failed")
+        self.assertEqual(row["is_latest"], True)
+        self.assertEqual(row["comment"], "broken")
+        self.assertEqual(row["bug_urls"], ["http://example.com/1"])
+        self.assertEqual(row["created_on"], result.created_on)
+        self.assertEqual(rows[1]["is_latest"], False)
+
+
+    def test_other_runs_and_deleted_not_exported(self):
+        """Only this run's non-deleted results are exported."""
+        self.F.ResultFactory.create()
+        self.results[0].delete()
+
+        self.assertEqual(len(self.rows()), 3)
+
+
+    def test_chunked(self):
+        """Results are read a chunk at a time."""
+        # per chunk: results, bug urls, and labels of newly seen environments
+        with self.assertNumQueries(6):
+            self.assertEqual(len(self.rows(chunk_size=2)), 4)
+
+
+    def test_csv(self):
+        """CSV has a header and a line per result, UTF-8 encoded."""
+        from moztrap.model.execution.export import export_csv, FIELDS
+
+        chunks = list(export_csv(self.run, chunk_size=3))
+
+        self.assertEqual(len(chunks), 2)
+        lines = list(csv.reader(StringIO("".join(chunks))))
+        self.assertEqual(lines[0], FIELDS)
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(lines[1][2].decode("utf-8"), u"Case ☃ 0")
+        self.assertEqual(lines[1][6], "1")
+
+
+    def test_json(self):
+        """JSON is a list of result objects."""
+        from moztrap.model.execution.export import export_json
+
+        data = json.loads("".join(export_json(self.run, chunk_size=3)))
+
+        self.assertEqual(len(data), 4)
+        self.assertEqual(data[0]["status"], "passed")
+        self.assertEqual(
+            data[0]["created_on"], self.results[0].created_on.isoformat())
+
+
+    def test_json_empty(self):
+        """JSON export of a run without results is an empty list."""
+        from moztrap.model.execution.export import export_json
+
+        run = self.F.RunFactory.create()
+
+        self.assertEqual(json.loads("".join(export_json(run))), [])
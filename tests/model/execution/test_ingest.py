@@ -0,0 +1,398 @@
+"""
+Tests for batched recording of results.
+
+"""
+import datetime
+
+from mock import patch
+
+from tests import case
+
+
+
+class RecordResultsTest(case.DBTestCase):
+    """Tests for record_results."""
+    def setUp(self):
+        """Set up a run with two cases in two environments."""
+        self.envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["OS X", "Linux"]})
+        self.run = self.F.RunFactory.create(environments=self.envs)
+        self.rcv1 = self.F.RunCaseVersionFactory.create(
+            run=self.run, environments=self.envs)
+        self.rcv2 = self.F.RunCaseVersionFactory.create(
+            run=self.run, environments=self.envs)
+        # the factory sets environments directly; count them as locking does
+        from moztrap.model.execution.models import update_completion
+        update_completion(
+            runs=[self.run], runcaseversions=[self.rcv1, self.rcv2])
+        self.user = self.F.UserFactory.create()
+
+
+    def call(self, *items):
+        """Record given items and return errors."""
+        from moztrap.model.execution.ingest import record_results
+        return record_results(items, self.user)
+
+
+    def item(self, rcv=None, env=None, status="passed", **kwargs):
+        """Return an item for given rcv (default rcv1) and env (default 0)."""
+        rcv = rcv or self.rcv1
+        env = env or self.envs[0]
+        kwargs.update(
+            {
+                "run_id": str(rcv.run.id),
+                "case": str(rcv.caseversion.case.id),
+                "environment": str(env.id),
+                "status": status,
+                }
+            )
+        return kwargs
+
+
+    def test_records_results(self):
+        """Results are recorded as latest, with tracking fields set."""
+        errors = self.call(
+            self.item(status="passed"),
+            self.item(rcv=self.rcv2, status="invalidated", comment="why"),
+            )
+
+        self.assertEqual(errors, {})
+        r1 = self.rcv1.results.get()
+        self.assertEqual(r1.status, "passed")
+        self.assertEqual(r1.environment, self.envs[0])
+        self.assertEqual(r1.tester, self.user)
+        self.assertEqual(r1.created_by, self.user)
+        self.assertTrue(r1.is_latest)
+        self.assertEqual(self.rcv2.results.get().comment, "why")
+        self.assertEqual(
+            set(self.model.LatestResult.objects.values_list(
+                "result", flat=True)),
+            set(self.model.Result.objects.values_list("id", flat=True)),
+            )
+
+
+    def test_supersedes_previous(self):
+        """Previous latest results are superseded, also within the batch."""
+        old = self.F.ResultFactory.create(
+            runcaseversion=self.rcv1,
+            environment=self.envs[0],
+            tester=self.user,
+            status="failed",
+            )
+
+        self.call(self.item(status="blocked"), self.item(status="passed"))
+
+        self.assertFalse(self.refresh(old).is_latest)
+        latest = self.rcv1.results.get(is_latest=True)
+        self.assertEqual(latest.status, "passed")
+        self.assertEqual(
+            self.model.LatestResult.objects.get().result, latest)
+        summary = self.run.result_summary()
+        self.assertEqual(summary["passed"], 1)
+        self.assertEqual(summary["failed"], 0)
+        self.assertEqual(summary["blocked"], 0)
+
+
+    def test_crossed_pairs(self):
+        """Only latest results of the batch's rcv/env pairs are superseded."""
+        others = [
+            self.F.ResultFactory.create(
+                runcaseversion=rcv,
+                environment=env,
+                tester=self.user,
+                status="failed",
+                )
+            for rcv, env in [
+                (self.rcv1, self.envs[1]), (self.rcv2, self.envs[0])]
+            ]
+
+        self.call(
+            self.item(rcv=self.rcv1, env=self.envs[0]),
+            self.item(rcv=self.rcv2, env=self.envs[1]),
+            )
+
+        for other in others:
+            self.assertTrue(self.refresh(other).is_latest)
+        self.assertEqual(
+            set(self.model.LatestResult.objects.values_list(
+                "result", flat=True)),
+            set(self.model.Result.objects.filter(
+                is_latest=True).values_list("id", flat=True)),
+            )
+        self.assertEqual(self.model.LatestResult.objects.count(), 4)
+
+
+    def test_skip_all_envs(self):
+        """A skipped result is recorded for all environments."""
+        self.call(self.item(status="skipped"))
+
+        self.assertEqual(
+            set(self.rcv1.results.values_list("environment", "status")),
+            set([(e.id, "skipped") for e in self.envs]),
+            )
+
+
+    def test_failed_step(self):
+        """A failed result can mark a failed step with a bug."""
+        step = self.F.CaseStepFactory.create(
+            caseversion=self.rcv1.caseversion, number=1)
+
+        self.call(
+            self.item(
+                status="failed", stepnumber=1, bug="http://www.example.com/"))
+
+        sr = self.rcv1.results.get().stepresults.get()
+        self.assertEqual(sr.step, step)
+        self.assertEqual(sr.status, "failed")
+        self.assertEqual(sr.bug_url, "http://www.example.com/")
+        self.assertEqual(self.rcv1.bug_urls(), set(["http://www.example.com/"]))
+
+
+    def test_same_timestamp(self):
+        """Batches recorded at the same time each get their own results."""
+        for rcv in [self.rcv1, self.rcv2]:
+            self.F.CaseStepFactory.create(caseversion=rcv.caseversion, number=1)
+        now = datetime.datetime(2012, 1, 1)
+
+        with patch("moztrap.model.execution.ingest.utcnow") as mock_utcnow:
+            mock_utcnow.return_value = now
+            self.call(
+                self.item(status="failed", stepnumber=1, bug="http://a/"))
+            self.call(
+                self.item(env=self.envs[1], status="passed"),
+                self.item(
+                    rcv=self.rcv2, status="failed", stepnumber=1,
+                    bug="http://b/"),
+                )
+
+        self.assertEqual(
+            self.rcv1.results.get(environment=self.envs[0]).stepresults.get(
+                ).bug_url,
+            "http://a/",
+            )
+        r2 = self.rcv2.results.get()
+        self.assertEqual(r2.stepresults.get().bug_url, "http://b/")
+        self.assertEqual(
+            self.model.LatestResult.objects.get(
+                runcaseversion=self.rcv2).result,
+            r2,
+            )
+        self.assertEqual(
+            self.model.Result.objects.filter(
+                ingest_batch__isnull=False).count(),
+            0,
+            )
+
+
+    def test_step_only_for_failed(self):
+        """Only failed results with a stepnumber get a step result."""
+        self.F.CaseStepFactory.create(
+            caseversion=self.rcv1.caseversion, number=1)
+
+        self.call(
+            self.item(status="failed", stepnumber=1),
+            self.item(env=self.envs[1], status="passed", stepnumber=1),
+            self.item(rcv=self.rcv2, status="failed"),
+            )
+
+        self.assertEqual(
+            list(self.model.StepResult.objects.values_list(
+                "result__status", flat=True)),
+            ["failed"],
+            )
+
+
+    def test_completion(self):
+        """Stored completion of runcaseversions and runs is updated."""
+        self.call(
+            self.item(env=self.envs[0]), self.item(env=self.envs[1]))
+
+        self.assertEqual(self.refresh(self.rcv1).completion_cache, 1.0)
+        self.assertEqual(self.refresh(self.run).completion_cache, 0.5)
+
+
+    def test_errors(self):
+        """Bad items are reported by index; others are still recorded."""
+        other_env = self.F.EnvironmentFactory.create()
+
+        errors = self.call(
+            {"case": "1"},
+            self.item(status="started"),
+            self.item(),
+            dict(self.item(), environment="0"),
+            self.item(env=other_env),
+            dict(self.item(), run_id="x"),
+            )
+
+        self.assertEqual(sorted(errors.keys()), [0, 1, 3, 4, 5])
+        self.assertEqual(
+            errors[0], "bad result object data missing key: 'run_id'")
+        self.assertEqual(
+            errors[3], "Specified environment does not exist: 0")
+        self.assertEqual(
+            errors[4],
+            "RunCaseVersion not found for run: {0}, case: {1}, "
+            "environment: {2}".format(
+                self.run.id, self.rcv1.caseversion.case.id, other_env.id),
+            )
+        self.assertEqual(self.model.Result.objects.count(), 1)
+
+
+    def test_query_count(self):
+        """Items are recorded in a fixed number of queries."""
+        for rcv in [self.rcv1, self.rcv2]:
+            self.F.CaseStepFactory.create(caseversion=rcv.caseversion)
+            self.F.ResultFactory.create(
+                runcaseversion=rcv,
+                environment=self.envs[0],
+                tester=self.user,
+                status="passed",
+                )
+        items = [
+            self.item(rcv=rcv, env=env, status="failed", stepnumber=1)
+            for rcv in [self.rcv1, self.rcv2]
+            for env in self.envs
+            ]
+
+        with self.assertNumQueries(26):
+            self.call(*items)
+
+
+
+class RecordActionsTest(case.DBTestCase):
+    """Tests for record_actions."""
+    def setUp(self):
+        """Set up a run with two cases in two environments."""
+        self.envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["OS X", "Linux"]})
+        self.run = self.F.RunFactory.create(environments=self.envs)
+        self.rcv1 = self.F.RunCaseVersionFactory.create(
+            run=self.run, environments=self.envs)
+        self.rcv2 = self.F.RunCaseVersionFactory.create(
+            run=self.run, environments=self.envs)
+        # the factory sets environments directly; count them as locking does
+        from moztrap.model.execution.models import update_completion
+        update_completion(
+            runs=[self.run], runcaseversions=[self.rcv1, self.rcv2])
+        self.user = self.F.UserFactory.create()
+
+
+    def call(self, *actions):
+        """Apply given actions in first env; return affected ids and errors."""
+        from moztrap.model.execution.ingest import record_actions
+        return record_actions(self.run, self.envs[0], actions, self.user)
+
+
+    def latest(self, rcv):
+        """Return set of (env id, status) of latest results of ``rcv``."""
+        return set(
+            rcv.results.filter(is_latest=True).values_list(
+                "environment", "status"))
+
+
+    def test_applies_actions(self):
+        """Actions record results in the given environment."""
+        rcv_ids, errors = self.call(
+            {"runcaseversion": self.rcv1.id, "action": "result_pass"},
+            {
+                "runcaseversion": str(self.rcv2.id),
+                "action": "result_block",
+                "comment": "blocked",
+                },
+            )
+
+        self.assertEqual(rcv_ids, set([self.rcv1.id, self.rcv2.id]))
+        self.assertEqual(errors, {})
+        self.assertEqual(self.latest(self.rcv1), set([(self.envs[0].id, "passed")]))
+        self.assertEqual(self.rcv2.results.get().comment, "blocked")
+        self.assertEqual(self.refresh(self.run).completion_cache, 0.5)
+
+
+    def test_failed_step(self):
+        """A failed action can mark a failed step with a bug."""
+        step = self.F.CaseStepFactory.create(
+            caseversion=self.rcv1.caseversion, number=1)
+
+        self.call(
+            {
+                "runcaseversion": self.rcv1.id,
+                "action": "result_fail",
+                "stepnumber": "1",
+                "bug": "http://www.example.com/",
+                }
+            )
+
+        sr = self.rcv1.results.get().stepresults.get()
+        self.assertEqual(sr.step, step)
+        self.assertEqual(sr.bug_url, "http://www.example.com/")
+
+
+    def test_skip_and_restart_all_envs(self):
+        """Skipping, then starting, a case applies to all its environments."""
+        self.call({"runcaseversion": self.rcv1.id, "action": "result_skip"})
+
+        self.assertEqual(
+            self.latest(self.rcv1),
+            set([(e.id, "skipped") for e in self.envs]),
+            )
+
+        self.call({"runcaseversion": self.rcv1.id, "action": "start"})
+
+        self.assertEqual(
+            self.latest(self.rcv1),
+            set([(e.id, "started") for e in self.envs]),
+            )
+
+
+    def test_start_only_this_env(self):
+        """Starting a case that wasn't skipped starts it only here."""
+        self.call(
+            {"runcaseversion": self.rcv1.id, "action": "result_skip"},
+            {"runcaseversion": self.rcv1.id, "action": "result_pass"},
+            {"runcaseversion": self.rcv1.id, "action": "start"},
+            )
+
+        self.assertEqual(
+            self.latest(self.rcv1),
+            set([(self.envs[0].id, "started"), (self.envs[1].id, "skipped")]),
+            )
+
+
+    def test_errors(self):
+        """Bad actions are reported by index; others are still applied."""
+        other_rcv = self.F.RunCaseVersionFactory.create(
+            environments=self.envs)
+
+        rcv_ids, errors = self.call(
+            {"action": "result_pass"},
+            {"runcaseversion": "x", "action": "result_pass"},
+            {"runcaseversion": self.rcv1.id, "action": "delete"},
+            {"runcaseversion": other_rcv.id, "action": "result_pass"},
+            {"runcaseversion": self.rcv2.id, "action": "result_pass"},
+            )
+
+        self.assertEqual(rcv_ids, set([self.rcv2.id]))
+        self.assertEqual(sorted(errors.keys()), [0, 1, 2, 3])
+        self.assertEqual(
+            errors[0], "bad action data missing key: 'runcaseversion'")
+        self.assertEqual(errors[2], "delete is not a valid action.")
+        self.assertEqual(
+            errors[3],
+            "{0} is not a valid run/caseversion ID.".format(other_rcv.id))
+
+
+    def test_query_count(self):
+        """Actions are applied in a fixed number of queries."""
+        rcvs = [self.rcv1, self.rcv2] + [
+            self.F.RunCaseVersionFactory.create(
+                run=self.run, environments=self.envs)
+            for i in range(4)
+            ]
+        actions = [
+            {"runcaseversion": rcv.id, "action": action}
+            for rcv in rcvs
+            for action in ["start", "result_pass", "result_skip"]
+            ]
+
+        with self.assertNumQueries(20):
+            self.call(*actions)
@@ -156,7 +156,7 @@ class ImporterTest(ImporterTestBase, case.DBTestCase):
         Two caseversions that both use the same user.  Test that import caches
         the user and doesn't have to query for it a second time.
 
-        Expect 19 queries for this import:
+        Expect 21 queries for this import:
 
         Query 1: Ensure this caseversion does not already exist for this
         productversion::
@@ -265,6 +265,12 @@ class ImporterTest(ImporterTestBase, case.DBTestCase):
             `library_caseversion`.`case_id` ASC,
             `core_productversion`.`order` ASC
 
+        Query 9a: Record the change to the case for runs' next refresh::
+
+            INSERT INTO `execution_lockchange` (`run_id`, `suite_id`,
+            `case_id`, `created_on`) VALUES (None, None, 10, 2012-03-07
+            19:35:34)
+
         Query 10: Add the new step to the caseversion::
 
             INSERT INTO `library_casestep` (`created_on`, `created_by_id`,
@@ -376,6 +382,12 @@ class ImporterTest(ImporterTestBase, case.DBTestCase):
             `library_caseversion`.`case_id` ASC,
             `core_productversion`.`order` ASC
 
+        Query 18a: Record the change to the second case::
+
+            INSERT INTO `execution_lockchange` (`run_id`, `suite_id`,
+            `case_id`, `created_on`) VALUES (None, None, 11, 2012-03-07
+            19:35:34)
+
         Query 19: Add the step to the second caseversion::
 
             INSERT INTO `library_casestep` (`created_on`, `created_by_id`,
@@ -388,7 +400,7 @@ class ImporterTest(ImporterTestBase, case.DBTestCase):
 
         Note: Django 1.4 now logs transaction points in the connection.queries
 
-        EXPECT: 19 Queries + 4 Transaction actions = 23 queries.
+        EXPECT: 21 Queries + 4 Transaction actions = 25 queries.
 
         To re-capture this query list, use a block like this in place
             of the "with self.assertNumQueries..." block::
@@ -425,7 +437,7 @@ class ImporterTest(ImporterTestBase, case.DBTestCase):
             }
 
         # Test code as normal
-        with self.assertNumQueries(23):
+        with self.assertNumQueries(25):
             result = self.import_data(case_data)
 
         cv1 = self.model.CaseVersion.objects.get(name="Foo")
@@ -214,6 +214,78 @@ class SaveTest(MTModelMockNowTestCase):
 
 
 
+class ChangedFieldsTest(MTModelTestCase):
+    """Tests that saving an existing instance writes only changed fields."""
+    def save_sql(self, obj, **kwargs):
+        """Save ``obj``, return SQL of all queries run."""
+        from django.db import connection
+        connection.use_debug_cursor = True
+        connection.queries = []
+        try:
+            obj.save(**kwargs)
+            return " ".join(q["sql"] for q in connection.queries)
+        finally:
+            connection.use_debug_cursor = None
+
+
+    def test_changed_only(self):
+        """Only changed fields and tracking fields are written."""
+        p = self.refresh(
+            self.F.ProductFactory.create(name="Foo", description="Long"))
+        p.name = "Bar"
+
+        sql = self.save_sql(p, user=self.user)
+
+        self.assertIn('"name"', sql)
+        self.assertIn('"cc_version"', sql)
+        self.assertIn('"modified_on"', sql)
+        self.assertIn('"modified_by_id"', sql)
+        self.assertNotIn('"description"', sql)
+        self.assertNotIn('"created_on"', sql)
+        p = self.refresh(p)
+        self.assertEqual(p.name, "Bar")
+        self.assertEqual(p.description, "Long")
+
+
+    def test_unchanged_after_save(self):
+        """Fields written by a save aren't written again by the next save."""
+        p = self.F.ProductFactory.create(name="Foo")
+        p.name = "Bar"
+        p.save(notrack=True)
+
+        sql = self.save_sql(p, notrack=True)
+
+        self.assertNotIn('"name"', sql)
+        self.assertIn('"cc_version"', sql)
+
+
+    def test_deferred(self):
+        """Deferred fields are neither loaded nor written."""
+        p = self.F.ProductFactory.create(name="Foo", description="Long")
+        p = self.model.Product.objects.only("name", "cc_version").get(pk=p.pk)
+        p.name = "Bar"
+
+        with self.assertNumQueries(1):
+            p.save()
+
+        p = self.refresh(p)
+        self.assertEqual(p.name, "Bar")
+        self.assertEqual(p.description, "Long")
+
+
+    def test_concurrency(self):
+        """Concurrent edits are still caught."""
+        p = self.F.ProductFactory.create()
+        p2 = self.refresh(p)
+        p2.description = "One"
+        p2.save()
+        p.name = "Two"
+
+        with self.assertRaises(self.model.ConcurrencyError):
+            p.save()
+
+
+
 class UpdateTest(MTModelMockNowTestCase):
     """Tests for modified_(by/on) when using queryset.update."""
     def test_modified_by_none(self):
@@ -266,6 +338,163 @@ class UpdateTest(MTModelMockNowTestCase):
 
 
 
+class BulkCreateTest(MTModelMockNowTestCase):
+    """Tests for tracking fields when using queryset bulk_create."""
+    def test_tracked(self):
+        """bulk_create() sets creation and modification user and time."""
+        self.model.Product.objects.bulk_create(
+            [self.model.Product(name="Foo"), self.model.Product(name="Bar")],
+            user=self.user,
+            )
+
+        for p in self.model.Product.objects.all():
+            self.assertEqual(p.created_by, self.user)
+            self.assertEqual(p.modified_by, self.user)
+            self.assertEqual(p.created_on, self.utcnow)
+            self.assertEqual(p.modified_on, self.utcnow)
+
+
+    def test_preset_modified_by(self):
+        """bulk_create() keeps a preset modified_by, as create() does."""
+        other = self.F.UserFactory.create()
+
+        self.model.Product.objects.bulk_create(
+            [self.model.Product(name="Foo", modified_by=other)],
+            user=self.user,
+            )
+
+        self.assertEqual(self.model.Product.objects.get().modified_by, other)
+
+
+    def test_notrack(self):
+        """If notrack=True, tracking fields are left as set."""
+        self.model.Product.objects.bulk_create(
+            [self.model.Product(name="Foo")], user=self.user, notrack=True)
+
+        self.assertEqual(self.model.Product.objects.get().created_by, None)
+
+
+    def test_bulk_created(self):
+        """bulk_create() applies the model's side effects of saving."""
+        cv = self.F.CaseVersionFactory.create()
+        pv = self.F.ProductVersionFactory.create(
+            product=cv.productversion.product, version="2")
+
+        self.model.CaseVersion.objects.bulk_create(
+            [self.model.CaseVersion(
+                    productversion=pv, case=cv.case, name="Two")])
+
+        self.assertFalse(self.refresh(cv).latest)
+        self.assertTrue(cv.case.versions.get(productversion=pv).latest)
+
+
+
+class BulkUpdateTest(MTModelMockNowTestCase):
+    """Tests for concurrency-checked queryset bulk_update."""
+    def test_update(self):
+        """bulk_update() writes given fields, tracking the modification."""
+        p1 = self.F.ProductFactory.create(name="Foo", description="One")
+        p2 = self.F.ProductFactory.create(name="Bar", description="Two")
+        p1.name, p1.description, p2.name = "Foo2", "Changed", "Bar2"
+        new_now = datetime.datetime(2012, 1, 1, 12, 0)
+        self.mock_utcnow.return_value = new_now
+
+        lost = self.model.Product.objects.bulk_update(
+            [p1, p2], ["name"], user=self.user)
+
+        self.assertEqual(lost, [])
+        p1, p2 = self.refresh(p1), self.refresh(p2)
+        self.assertEqual((p1.name, p2.name), ("Foo2", "Bar2"))
+        self.assertEqual(p1.description, "One")
+        self.assertEqual(p1.cc_version, 1)
+        self.assertEqual(p2.modified_by, self.user)
+        self.assertEqual(p2.modified_on, new_now)
+
+
+    def test_instances_updated(self):
+        """Written instances get their new version and can be saved again."""
+        p = self.F.ProductFactory.create(name="Foo")
+        p.name = "Bar"
+
+        self.model.Product.objects.bulk_update([p], ["name"])
+        p.name = "Baz"
+        p.save()
+
+        self.assertEqual(p.cc_version, 2)
+        self.assertEqual(self.refresh(p).name, "Baz")
+
+
+    def test_lost(self):
+        """Out-of-date and deleted instances aren't written, but returned."""
+        p1 = self.F.ProductFactory.create(name="Foo")
+        p2 = self.F.ProductFactory.create(name="Bar")
+        p3 = self.F.ProductFactory.create(name="Baz")
+        self.refresh(p1).save()
+        self.refresh(p2).delete()
+        for p in [p1, p2, p3]:
+            p.name = "New"
+
+        lost = self.model.Product.objects.bulk_update(
+            [p1, p2, p3], ["name"], chunk_size=2)
+
+        self.assertEqual(lost, [p1, p2])
+        self.assertEqual(self.refresh(p1).name, "Foo")
+        self.assertEqual(self.refresh(p3).name, "New")
+
+
+    def test_bulk_updated(self):
+        """The model's bulk_updated is called with the objects written."""
+        p1 = self.F.ProductFactory.create(name="Foo")
+        p2 = self.F.ProductFactory.create(name="Bar")
+        self.refresh(p2).save()
+        p1.name = p2.name = "New"
+
+        with patch.object(self.model.Product, "bulk_updated") as hook:
+            self.model.Product.objects.bulk_update([p1, p2], ["name"])
+
+        hook.assert_called_once_with([p1], ["name"])
+
+
+    def test_notrack(self):
+        """If notrack=True, doesn't update modified_by."""
+        p = self.F.ProductFactory.create(name="Foo", user=self.user)
+        p.name = "Bar"
+
+        self.model.Product.objects.bulk_update([p], ["name"], notrack=True)
+
+        self.assertEqual(self.refresh(p).modified_by, self.user)
+
+
+    def test_null_values(self):
+        """NULL values are written, whether or not all values are NULL."""
+        runs = [
+            self.F.RunFactory.create(end=datetime.date(2012, 1, 1))
+            for i in range(2)
+            ]
+        for run in runs:
+            run.end = None
+
+        self.model.Run.objects.bulk_update(runs, ["end"])
+        runs[0].end = datetime.date(2012, 2, 2)
+        self.model.Run.objects.bulk_update(runs, ["end"])
+
+        self.assertEqual(
+            [self.refresh(run).end for run in runs],
+            [datetime.date(2012, 2, 2), None],
+            )
+
+
+    def test_queries(self):
+        """Each chunk is read and written in one query each."""
+        ps = [self.F.ProductFactory.create() for i in range(3)]
+        for i, p in enumerate(ps):
+            p.name = "New {0}".format(i)
+
+        with self.assertNumQueries(4):
+            self.model.Product.objects.bulk_update(ps, ["name"], chunk_size=2)
+
+
+
 class DeleteTest(MTModelMockNowTestCase):
     """Tests for deleted_(by/on) when using instance.delete or qs.delete."""
     def test_queryset_deleted_by_none(self):
@@ -511,6 +740,237 @@ class CascadeUndeleteTest(UndeleteMixin, MTModelTestCase):
 
 
 
+class SoftDeleteCascadeTest(UndeleteMixin, MTModelTestCase):
+    """Tests for SoftDeleteCascade."""
+    def cascade(self, queryset, **kwargs):
+        """Return a SoftDeleteCascade from given queryset."""
+        from moztrap.model.mtmodel import SoftDeleteCascade
+        return SoftDeleteCascade(queryset, **kwargs)
+
+
+    def test_delete_counts(self):
+        """Deleting returns the number of rows deleted per model."""
+        p = self.F.ProductFactory.create()
+        self.F.SuiteFactory.create(product=p)
+        self.F.SuiteFactory.create(product=p)
+        self.F.SuiteFactory.create(product=p).delete()
+
+        counts = p.delete()
+
+        self.assertEqual(
+            counts, {self.model.Product: 1, self.model.Suite: 2})
+
+
+    def test_undelete_counts(self):
+        """Undeleting returns the number of rows undeleted per model."""
+        p = self.F.ProductFactory.create()
+        self.F.SuiteFactory.create(product=p)
+        self.model.Product.objects.all().delete()
+
+        counts = self.model.Product.everything.all().undelete()
+
+        self.assertEqual(
+            counts, {self.model.Product: 1, self.model.Suite: 1})
+
+
+    def test_deletion_cascaded(self):
+        """Models are told which of their rows were deleted or undeleted."""
+        p = self.F.ProductFactory.create()
+        s1 = self.F.SuiteFactory.create(product=p)
+        s2 = self.F.SuiteFactory.create(product=p)
+        self.F.SuiteFactory.create()
+
+        for op in ["delete", "undelete"]:
+            with patch.object(self.model.Suite, "deletion_cascaded") as hook:
+                getattr(self.cascade(
+                    self.model.Product.everything.filter(pk=p.pk)), op)()
+
+            rows = set()
+            for queryset in hook.call_args[0][0]:
+                rows.update(queryset)
+            self.assertEqual(hook.call_count, 1)
+            self.assertEqual(rows, set([s1, s2]))
+
+
+    def test_undelete_stale_instance(self):
+        """An instance is undeleted even if its deleted_on is out of date."""
+        p = self.F.ProductFactory.create()
+        s = self.F.SuiteFactory.create(product=p)
+        p.delete()
+
+        p.undelete()
+
+        self.assertNotDeleted(self.refresh(p))
+        self.assertNotDeleted(self.refresh(s))
+
+
+    def test_deep_cascade(self):
+        """Cascades through several levels of dependents."""
+        r = self.F.ResultFactory.create()
+        self.F.StepResultFactory.create(result=r)
+        product = r.runcaseversion.run.productversion.product
+
+        counts = product.delete()
+
+        self.assertEqual(counts[self.model.Result], 1)
+        self.assertEqual(counts[self.model.StepResult], 1)
+        self.assertEqual(counts[self.model.RunCaseVersion], 1)
+        self.assertIsNot(self.refresh(r).deleted_on, None)
+
+
+    def test_self_cascade(self):
+        """Deleting a series deletes its member runs."""
+        series = self.F.RunFactory.create(is_series=True)
+        member = self.F.RunFactory.create(series=series)
+
+        counts = series.delete()
+
+        self.assertEqual(counts[self.model.Run], 2)
+        self.assertIsNot(self.refresh(member).deleted_on, None)
+
+
+    def test_chunks(self):
+        """Rows are deleted a chunk at a time, in a fixed number of queries."""
+        p = self.F.ProductFactory.create()
+        suites = [self.F.SuiteFactory.create(product=p) for i in range(3)]
+        for suite in suites:
+            for i in range(2):
+                self.F.SuiteCaseFactory.create(suite=suite)
+
+        # per chunk of up to two suites: select suite ids, update suites and
+        # their suitecases and runsuites
+        with self.assertNumQueries(8):
+            counts = self.cascade(
+                self.model.Suite.objects.filter(product=p),
+                chunk_size=2,
+                ).delete()
+
+        self.assertEqual(
+            counts, {self.model.Suite: 3, self.model.SuiteCase: 6})
+        self.assertEqual(self.model.SuiteCase.objects.count(), 0)
+
+
+    def test_dependent_chunks(self):
+        """Dependents are read a chunk at a time too, not all at once."""
+        from django.conf import settings
+        from django.db import connection
+
+        run = self.F.RunFactory.create()
+        for i in range(5):
+            self.F.ResultFactory.create(runcaseversion__run=run)
+
+        settings.DEBUG = True
+        connection.queries = []
+
+        try:
+            counts = self.cascade(
+                self.model.Run.objects.filter(pk=run.pk), chunk_size=2,
+                ).delete()
+            # pages of runcaseversion ids, read by keyset
+            reads = [
+                q["sql"] for q in connection.queries
+                if q["sql"].startswith("SELECT")
+                and "LIMIT" in q["sql"]
+                and "runcaseversion" in q["sql"].split(" FROM ")[1].split()[0]
+                ]
+        finally:
+            settings.DEBUG = False
+
+        self.assertEqual(counts[self.model.RunCaseVersion], 5)
+        self.assertEqual(counts[self.model.Result], 5)
+        self.assertEqual(len(reads), 3)
+
+
+    def test_delete_records_batch(self):
+        """Rows deleted together share a deletion batch, unique to them."""
+        p = self.F.ProductFactory.create()
+        s = self.F.SuiteFactory.create(product=p)
+        other = self.F.ProductFactory.create()
+        p.delete()
+        other.delete()
+
+        batch = self.refresh(p).deletion_batch
+        self.assertTrue(batch)
+        self.assertEqual(self.refresh(s).deletion_batch, batch)
+        self.assertNotEqual(self.refresh(other).deletion_batch, batch)
+
+
+    @patch("moztrap.model.mtmodel.datetime")
+    def test_undelete_by_batch(self, mock_dt):
+        """Only dependents deleted in the same batch are undeleted."""
+        mock_dt.datetime.utcnow.return_value = datetime.datetime(2012, 1, 30)
+        p = self.F.ProductFactory.create()
+        s = self.F.SuiteFactory.create(product=p)
+        s2 = self.F.SuiteFactory.create(product=p)
+        s2.delete()
+        p.delete()
+
+        counts = p.undelete()
+
+        self.assertEqual(
+            counts, {self.model.Product: 1, self.model.Suite: 1})
+        self.assertNotDeleted(self.refresh(s))
+        self.assertIsNot(self.refresh(s2).deleted_on, None)
+
+
+    def test_undelete_dependent(self):
+        """Undeleting a dependent leaves the rest of its batch deleted."""
+        p = self.F.ProductFactory.create()
+        s = self.F.SuiteFactory.create(product=p)
+        sc = self.F.SuiteCaseFactory.create(suite=s)
+        s2 = self.F.SuiteFactory.create(product=p)
+        sc2 = self.F.SuiteCaseFactory.create(suite=s2)
+        p.delete()
+
+        counts = self.refresh(s).undelete()
+
+        self.assertEqual(
+            counts, {self.model.Suite: 1, self.model.SuiteCase: 1})
+        self.assertNotDeleted(self.refresh(sc))
+        self.assertEqual(self.refresh(sc).deletion_batch, None)
+        self.assertIsNot(self.refresh(p).deleted_on, None)
+        self.assertIsNot(self.refresh(s2).deleted_on, None)
+        self.assertIsNot(self.refresh(sc2).deleted_on, None)
+
+
+    def test_undelete_unbatched(self):
+        """Rows deleted without a batch are undeleted by deletion time."""
+        p = self.F.ProductFactory.create()
+        s = self.F.SuiteFactory.create(product=p)
+        p.delete()
+        for model in [self.model.Product, self.model.Suite]:
+            model.everything.update(deletion_batch=None, notrack=True)
+
+        counts = p.undelete()
+
+        self.assertEqual(
+            counts, {self.model.Product: 1, self.model.Suite: 1})
+        self.assertNotDeleted(self.refresh(s))
+
+
+    def test_undelete_batch_queries(self):
+        """A whole batch is undeleted without selecting dependent rows."""
+        p = self.F.ProductFactory.create()
+        suites = [self.F.SuiteFactory.create(product=p) for i in range(3)]
+        for suite in suites:
+            for i in range(2):
+                self.F.SuiteCaseFactory.create(suite=suite)
+        self.model.Suite.objects.filter(product=p).delete()
+
+        # select batches, check for deletion of other suites or products,
+        # then update suites, suitecases and runsuites, whatever the chunk size
+        with self.assertNumQueries(6):
+            counts = self.cascade(
+                self.model.Suite.everything.filter(product=p),
+                chunk_size=2,
+                ).undelete()
+
+        self.assertEqual(
+            counts, {self.model.Suite: 3, self.model.SuiteCase: 6})
+        self.assertEqual(self.model.SuiteCase.objects.count(), 6)
+
+
+
 class CloneTest(UndeleteMixin, MTModelTestCase):
     """Tests for cloning."""
     def test_cascade_non_m2m_or_reverse_fk(self):
@@ -570,6 +1030,89 @@ class CloneTest(UndeleteMixin, MTModelTestCase):
         self.assertEqual(new.modified_by, u2)
 
 
+    def test_resets_denormalized_fields(self):
+        """Cloned objects get default values for denormalized fields."""
+        r = self.F.RunFactory.create()
+        self.model.Run.objects.update(completion_cache=0.5)
+
+        new = self.refresh(r).clone()
+
+        self.assertEqual(self.refresh(new).completion_cache, 0)
+
+
+    def test_cascade_nested(self):
+        """Cascade-cloned objects cascade with their own defaults."""
+        cv = self.F.CaseVersionFactory.create(name="Foo")
+        self.F.CaseStepFactory.create(caseversion=cv, number=1)
+        self.F.CaseStepFactory.create(caseversion=cv, number=2)
+
+        new = cv.case.clone(user=self.user)
+
+        new_cv = new.versions.get()
+        self.assertEqual(new_cv.name, "Cloned: Foo")
+        self.assertEqual(new_cv.created_by, self.user)
+        self.assertEqual(
+            list(new_cv.steps.values_list("number", flat=True)), [1, 2])
+        self.assertEqual(cv.steps.count(), 2)
+
+
+    def test_cascade_excludes_deleted(self):
+        """Deleted related objects aren't cloned."""
+        s = self.F.SuiteFactory.create()
+        self.F.SuiteCaseFactory.create(suite=s)
+        self.F.SuiteCaseFactory.create(suite=s).delete()
+
+        new = s.clone()
+
+        self.assertEqual(new.suitecases.count(), 1)
+
+
+    def test_cascade_filter(self):
+        """Only related objects returned by a cascade's filter are cloned."""
+        s = self.F.SuiteFactory.create()
+        self.F.SuiteCaseFactory.create(suite=s, order=1)
+        self.F.SuiteCaseFactory.create(suite=s, order=2)
+
+        new = s.clone(cascade={"suitecases": lambda qs: qs.filter(order=2)})
+
+        self.assertEqual(
+            list(new.suitecases.values_list("order", flat=True)), [2])
+
+
+    def test_cascade_queries(self):
+        """Related objects are cloned in bulk, in a fixed number of queries."""
+        s = self.F.SuiteFactory.create()
+        for i in range(5):
+            self.F.SuiteCaseFactory.create(suite=s, order=i)
+
+        # insert suite and record its change; select, insert and read back
+        # suitecases, and record the change
+        with self.assertNumQueries(6):
+            new = s.clone()
+
+        self.assertEqual(
+            list(new.suitecases.values_list("order", flat=True)),
+            range(5),
+            )
+
+
+
+class DenormalizedFieldsTest(MTModelTestCase):
+    """Tests for denormalized fields not written by save."""
+    def test_save_doesnt_clobber(self):
+        """Saving a stale instance leaves denormalized fields alone."""
+        r = self.F.RunFactory.create()
+        self.model.Run._base_manager.filter(pk=r.pk).update(
+            completion_cache=0.5)
+
+        r.name = "New name"
+        r.save()
+
+        r = self.refresh(r)
+        self.assertEqual(r.name, "New name")
+        self.assertEqual(r.completion_cache, 0.5)
+
+
 
 class MTManagerTest(MTModelTestCase):
     """Tests for MTManager."""
@@ -622,6 +1165,17 @@ class TeamModelTest(case.DBTestCase):
         self.assertIsNone(t.parent)
 
 
+    def test_add_to_team_then_save(self):
+        """A has_team cleared after add_to_team is saved."""
+        pv = self.F.ProductVersionFactory.create()
+        pv.add_to_team(self.F.UserFactory.create())
+        pv.has_team = False
+
+        pv.save()
+
+        self.assertFalse(self.refresh(pv).has_team)
+
+
 
 class DraftStatusModelTest(case.DBTestCase):
     """
@@ -8,5 +8,6 @@ DEFAULT_FILE_STORAGE = "tests.storage.MemoryStorage"
 ALLOW_ANONYMOUS_ACCESS = False
 SITE_URL = "http://localhost:80"
 USE_BROWSERID = True
+BACKGROUND_RUN_LOCK = False
 
 PASSWORD_HASHERS = ['django.contrib.auth.hashers.UnsaltedMD5PasswordHasher']
@@ -104,6 +104,18 @@ class RunsListTests(object):
         self.assertNotInList(res, "Foo 2")
 
 
+    def test_filter_by_completion(self):
+        """Can filter by completion range."""
+        one = self.factory.create(name="Foo 1")
+        self.factory.create(name="Foo 2")
+        self.model.Run.objects.filter(pk=one.pk).update(completion_cache=0.6)
+
+        res = self.get(params={"filter-completion": "0.5:0.75"})
+
+        self.assertInList(res, "Foo 1")
+        self.assertNotInList(res, "Foo 2")
+
+
     def test_sort_by_status(self):
         """Can sort by status."""
         self.factory.create(name="Run 1", status=self.model.Run.STATUS.active)
@@ -163,3 +175,15 @@ class RunsListTests(object):
             params={"sortfield": "end", "sortdirection": "asc"})
 
         self.assertOrderInList(res, "Run 2", "Run 1")
+
+
+    def test_sort_by_completion(self):
+        """Can sort by completion."""
+        one = self.factory.create(name="Run 1")
+        self.factory.create(name="Run 2")
+        self.model.Run.objects.filter(pk=one.pk).update(completion_cache=0.5)
+
+        res = self.get(
+            params={"sortfield": "completion_cache", "sortdirection": "desc"})
+
+        self.assertOrderInList(res, "Run 1", "Run 2")
@@ -557,6 +557,51 @@ class ChoicesFilterTest(FiltersTestCase):
 
 
 
+class RangeFilterTest(case.DBTestCase):
+    """Tests for RangeFilter."""
+    def filter(self, values):
+        """Filter runs by completion with the given selected ranges."""
+        from moztrap.view.lists.filters import RangeFilter
+        f = RangeFilter(
+            "completion",
+            lookup="completion_cache",
+            choices=[("0:0.5", "low"), ("0.5:1", "high"), ("1:", "done")],
+            )
+        return set(
+            f.filter(self.model.Run.objects.all(), values).values_list(
+                "name", flat=True)
+            )
+
+
+    def setUp(self):
+        """Create runs with varying completion."""
+        for name, completion in [("zero", 0), ("half", 0.5), ("done", 1.0)]:
+            r = self.F.RunFactory.create(name=name)
+            self.model.Run.objects.filter(pk=r.pk).update(
+                completion_cache=completion)
+
+
+    def test_filter(self):
+        """Filters by low <= value < high."""
+        self.assertEqual(self.filter(["0.5:1"]), set(["half"]))
+
+
+    def test_open_range(self):
+        """An empty bound leaves that end of the range open."""
+        self.assertEqual(self.filter(["1:"]), set(["done"]))
+
+
+    def test_multiple_ranges(self):
+        """Selected ranges are ORed."""
+        self.assertEqual(self.filter(["0:0.5", "1:"]), set(["zero", "done"]))
+
+
+    def test_no_values(self):
+        """With no selected ranges, queryset isn't filtered."""
+        self.assertEqual(self.filter([]), set(["zero", "half", "done"]))
+
+
+
 class ModelFilterTest(FiltersTestCase):
     """Tests for ModelFilter."""
     @property
@@ -175,6 +175,51 @@ class RunCaseVersionResultsViewTest(case.view.ListViewTestCase,
         self.assertNotInList(res, "Case 2")
 
 
+    def test_filter_by_flakiness(self):
+        """Can filter by flakiness of the case in its flakiest environment."""
+        rcv1 = self.F.RunCaseVersionFactory.create(caseversion__name="Case 1")
+        rcv2 = self.F.RunCaseVersionFactory.create(caseversion__name="Case 2")
+        self.F.RunCaseVersionFactory.create(caseversion__name="Case 3")
+        self.F.CaseFlakinessFactory.create(
+            case=rcv1.caseversion.case, score=0.6)
+        self.F.CaseFlakinessFactory.create(
+            case=rcv2.caseversion.case, score=0.6)
+        self.F.CaseFlakinessFactory.create(
+            case=rcv2.caseversion.case, score=0.0)
+
+        res = self.get(params={"filter-flakiness": "0.5:"})
+
+        self.assertInList(res, "Case 1")
+        self.assertInList(res, "Case 2")
+        self.assertNotInList(res, "Case 3")
+
+
+    def test_flakiness(self):
+        """Shows flakiness of the case in its flakiest environment."""
+        rcv = self.F.RunCaseVersionFactory.create()
+        self.F.CaseFlakinessFactory.create(case=rcv.caseversion.case, score=0.4)
+
+        res = self.get()
+
+        self.assertEqual(
+            res.html.find("div", "flakiness").text, "40%")
+
+
+    def test_sort_by_flakiness(self):
+        """Can sort by flakiness."""
+        rcv1 = self.F.RunCaseVersionFactory.create(caseversion__name="Case 1")
+        rcv2 = self.F.RunCaseVersionFactory.create(caseversion__name="Case 2")
+        self.F.CaseFlakinessFactory.create(
+            case=rcv1.caseversion.case, score=0.2)
+        self.F.CaseFlakinessFactory.create(
+            case=rcv2.caseversion.case, score=0.6)
+
+        res = self.get(
+            params={"sortfield": "flakiness", "sortdirection": "desc"})
+
+        self.assertOrderInList(res, "Case 2", "Case 1")
+
+
     def test_sort_by_status(self):
         """Can sort by status."""
         self.F.RunCaseVersionFactory.create(
@@ -4,6 +4,8 @@ Tests for run results view.
 """
 from django.core.urlresolvers import reverse
 
+from mock import patch
+
 from tests import case
 
 from ...lists.runs import RunsListTests
@@ -83,3 +85,234 @@ class RunDetailTest(case.view.AuthenticatedViewTestCase):
             "{0}?filter-run={1}".format(
                 reverse("results_runcaseversions"), self.testrun.id)
             )
+
+
+    def test_details_compare_builds(self):
+        """Details of a series member links to comparing its builds."""
+        series = self.F.RunFactory.create(is_series=True)
+        self.testrun.series = series
+        self.testrun.save()
+
+        res = self.get(headers={"X-Requested-With": "XMLHttpRequest"})
+
+        res.mustcontain(
+            "{0}?series={1}".format(
+                reverse("results_runs_compare"), series.id))
+
+
+
+class RunBugsTest(case.view.AuthenticatedViewTestCase):
+    """Tests for run bugs view."""
+    def setUp(self):
+        """Setup for run bugs tests; create a run."""
+        super(RunBugsTest, self).setUp()
+        self.testrun = self.F.RunFactory.create()
+
+
+    @property
+    def url(self):
+        """Shortcut for run bugs url."""
+        return reverse("results_run_bugs", kwargs={"run_id": self.testrun.id})
+
+
+    def test_bugs(self):
+        """Lists each bug filed, with the cases it was filed against."""
+        for name in ["Case A", "Case B"]:
+            rcv = self.F.RunCaseVersionFactory.create(
+                run=self.testrun, caseversion__name=name)
+            self.F.StepResultFactory.create(
+                result__runcaseversion=rcv, bug_url="http://example.com/1")
+
+        res = self.get(status=200)
+
+        self.assertEqual(
+            [a.text for a in res.html.findAll("a", "bug-url")],
+            ["http://example.com/1"])
+        res.mustcontain("Case A", "Case B")
+
+
+    def test_no_bugs(self):
+        """Says so if no bugs were filed."""
+        res = self.get(status=200)
+
+        res.mustcontain("No bugs have been filed in this run.")
+
+
+
+class ExportTest(case.view.AuthenticatedViewTestCase):
+    """Tests for run results export view."""
+    def setUp(self):
+        """Setup for export tests; create a result."""
+        super(ExportTest, self).setUp()
+        self.result = self.F.ResultFactory.create(
+            status="failed", comment="broken")
+        self.testrun = self.result.runcaseversion.run
+
+
+    @property
+    def url(self):
+        """Shortcut for run export url."""
+        return reverse(
+            "results_run_export", kwargs={"run_id": self.testrun.id})
+
+
+    def test_csv(self):
+        """Exports CSV attachment by default."""
+        res = self.get(status=200)
+
+        self.assertEqual(res.headers["Content-Type"], "text/csv")
+        self.assertEqual(
+            res.headers["Content-Disposition"],
+            "attachment; filename=run-{0}-results.csv".format(
+                self.testrun.id))
+        lines = res.body.splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("broken", lines[1])
+
+
+    def test_not_consumed_by_middleware(self):
+        """The configured middleware leaves the content to be streamed."""
+        from django.http import HttpResponse
+        content = HttpResponse.content
+        read = []
+
+        def get_content(response):
+            read.append(response)
+            return content.fget(response)
+
+        with patch.object(
+                HttpResponse, "content", property(get_content, content.fset)):
+            res = self.get(status=200)
+
+        self.assertEqual(read, [])
+        self.assertIn("broken", res.body)
+
+
+    def test_json(self):
+        """Exports JSON with format=json."""
+        res = self.get(params={"format": "json"}, status=200)
+
+        self.assertEqual(res.json[0]["result_id"], self.result.id)
+
+
+    def test_bad_format(self):
+        """Unknown format is a 400 error."""
+        res = self.get(params={"format": "xml"}, status=400)
+
+        res.mustcontain("Unknown export format: xml")
+
+
+    def test_bad_run_id_404(self):
+        """Bad run id returns 404."""
+        url = reverse("results_run_export", kwargs={"run_id": 9999})
+
+        self.app.get(url, user=self.user, status=404)
+
+
+
+class CompareTest(case.view.AuthenticatedViewTestCase):
+    """Tests for build comparison views."""
+    def setUp(self):
+        """Set up a series with two builds, where a case regressed."""
+        super(CompareTest, self).setUp()
+        self.env = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["Windows"]})[0]
+        cv = self.F.CaseVersionFactory.create(name="Some case")
+        self.series = self.F.RunFactory.create(
+            is_series=True, productversion=cv.productversion)
+        self.builds = []
+        for build, status in [("1", "passed"), ("2", "failed")]:
+            run = self.F.RunFactory.create(
+                series=self.series,
+                build=build,
+                status="active",
+                productversion=cv.productversion,
+                environments=[self.env],
+                )
+            rcv = self.F.RunCaseVersionFactory.create(
+                run=run, caseversion=cv, environments=[self.env])
+            self.F.ResultFactory.create(
+                runcaseversion=rcv, environment=self.env, status=status)
+            self.builds.append(run)
+        self.case_id = cv.case.id
+
+
+    @property
+    def url(self):
+        """Shortcut for build comparison url."""
+        return reverse("results_runs_compare")
+
+
+    def test_series(self):
+        """Lists regressions of all builds of a series."""
+        res = self.get(params={"series": self.series.id}, status=200)
+
+        res.mustcontain(
+            "Regressed (1)", "Some case", "Windows", "New failures (0)")
+
+
+    def test_runs(self):
+        """Compares the given runs."""
+        res = self.get(
+            params=[("run", self.builds[1].id), ("run", self.builds[0].id)],
+            status=200,
+            )
+
+        res.mustcontain("Regressed (1)")
+
+
+    def test_not_a_series(self):
+        """Runs of different series can't be compared."""
+        other = self.F.RunFactory.create()
+
+        res = self.get(
+            params=[("run", self.builds[0].id), ("run", other.id)],
+            status=400,
+            )
+
+        res.mustcontain("Only runs of the same series can be compared.")
+
+
+    def test_json(self):
+        """JSON comparison lists transitions by case and environment ID."""
+        res = self.app.get(
+            reverse("results_runs_compare_json"),
+            params={"series": self.series.id},
+            user=self.user,
+            status=200,
+            )
+
+        self.assertEqual(
+            res.json["comparisons"],
+            [
+                {
+                    "from": self.builds[0].id,
+                    "to": self.builds[1].id,
+                    "regressed": [
+                        {
+                            "case": self.case_id,
+                            "environment": self.env.id,
+                            "before": "passed",
+                            "after": "failed",
+                            },
+                        ],
+                    "new_failures": [],
+                    "fixed": [],
+                    },
+                ]
+            )
+        self.assertEqual(
+            [r["build"] for r in res.json["runs"]], ["1", "2"])
+
+
+    def test_json_too_few_runs(self):
+        """JSON comparison of less than two runs is a 400 error."""
+        res = self.app.get(
+            reverse("results_runs_compare_json"),
+            params={"run": self.builds[0].id},
+            user=self.user,
+            status=400,
+            )
+
+        self.assertEqual(
+            res.json, {"error": "At least two runs are needed to compare."})
@@ -1,7 +1,9 @@
 """
-Tests for home results view.
+Tests for home results and trends views.
 
 """
+import datetime
+
 from django.core.urlresolvers import reverse
 
 from tests import case
@@ -22,3 +24,84 @@ class ResultsHomeViewTest(case.view.AuthenticatedViewTestCase):
 
         self.assertRedirects(
             res, reverse("results_runs") + "?openfinder=1&filter-status=active")
+
+
+
+class TrendsViewTest(case.view.AuthenticatedViewTestCase):
+    """Tests for trends view."""
+    def setUp(self):
+        """Set up daily counts of a run in a series."""
+        super(TrendsViewTest, self).setUp()
+        series = self.F.RunFactory.create(is_series=True)
+        self.run = self.F.RunFactory.create(series=series)
+        for day, status, count in [
+                (1, "passed", 3), (1, "started", 2), (2, "failed", 1)]:
+            self.F.ResultRollupFactory.create(
+                day=datetime.date(2012, 1, day),
+                run=self.run,
+                status=status,
+                count=count,
+                )
+
+
+    @property
+    def url(self):
+        """Shortcut for trends url."""
+        return reverse("results_trends")
+
+
+    def test_series(self):
+        """Daily counts of completed statuses of a series."""
+        res = self.get(params={"series": self.run.series.id}, status=200)
+
+        self.assertEqual(res.json["days"], ["2012-01-01", "2012-01-02"])
+        self.assertEqual(res.json["counts"]["passed"], [3, 0])
+        self.assertEqual(res.json["counts"]["failed"], [0, 1])
+        self.assertNotIn("started", res.json["counts"])
+
+
+    def test_productversion_status_and_dates(self):
+        """Statuses and days can be limited."""
+        res = self.get(
+            params=[
+                ("productversion", self.run.productversion.id),
+                ("status", "passed"),
+                ("start", "2012-01-02"),
+                ("end", "2012-01-03"),
+                ],
+            status=200,
+            )
+
+        self.assertEqual(
+            res.json,
+            {
+                "days": ["2012-01-02", "2012-01-03"],
+                "counts": {"passed": [0, 0]},
+                }
+            )
+
+
+    def test_requires_one_filter(self):
+        """One of productversion, series or run is required."""
+        res = self.get(status=400)
+
+        self.assertEqual(
+            res.json["error"],
+            "Exactly one of productversion, series or run is required.")
+
+
+    def test_bad_date(self):
+        """Dates must be YYYY-MM-DD."""
+        res = self.get(
+            params={"run": self.run.id, "start": "yesterday"}, status=400)
+
+        self.assertEqual(
+            res.json["error"], "Dates must be YYYY-MM-DD: yesterday")
+
+
+    def test_bad_status(self):
+        """Unknown statuses are an error."""
+        res = self.get(
+            params={"run": self.run.id, "status": "happy"}, status=400)
+
+        self.assertEqual(res.json["error"], "Invalid status: happy")
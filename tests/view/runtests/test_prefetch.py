@@ -0,0 +1,173 @@
+"""
+Tests for batched loading of runtests execution data.
+
+"""
+import datetime
+
+from django.template import Template, Context
+
+from tests import case
+
+
+
+class ResultPrefetchTest(case.DBTestCase):
+    """Tests for ResultPrefetch."""
+    def setUp(self):
+        """Set up a run with two cases in one environment."""
+        self.envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["Windows"]})
+        self.env = self.envs[0]
+        pv = self.F.ProductVersionFactory.create(environments=self.envs)
+        self.run = self.F.RunFactory.create(productversion=pv)
+        self.rcv1 = self.F.RunCaseVersionFactory.create(
+            run=self.run, caseversion__productversion=pv)
+        self.rcv2 = self.F.RunCaseVersionFactory.create(
+            run=self.run, caseversion__productversion=pv)
+        self.user = self.F.UserFactory.create()
+
+
+    def prefetch(self):
+        """Return a ResultPrefetch loaded with both runcaseversions."""
+        from moztrap.view.runtests.prefetch import ResultPrefetch
+        prefetch = ResultPrefetch(self.run, self.env, self.user)
+        prefetch.load(
+            self.model.RunCaseVersion.objects.select_related(
+                "caseversion__case").order_by("id"))
+        return prefetch
+
+
+    def test_results(self):
+        """Loads the user's latest result for each case."""
+        r = self.F.ResultFactory.create(
+            runcaseversion=self.rcv1, environment=self.env, tester=self.user)
+        self.F.ResultFactory.create(
+            runcaseversion=self.rcv2, environment=self.env)
+
+        prefetch = self.prefetch()
+
+        self.assertEqual(prefetch.results, {self.rcv1.id: r})
+
+
+    def test_dupe_latest_results(self):
+        """Of dupe latest results, the last-modified one is kept latest."""
+        r1 = self.F.ResultFactory.create(
+            runcaseversion=self.rcv1, environment=self.env, tester=self.user)
+        r2 = self.F.ResultFactory.create(
+            runcaseversion=self.rcv1, environment=self.env, tester=self.user)
+        self.model.Result.objects.filter(pk=r1.pk).update(
+            is_latest=True,
+            modified_on=datetime.datetime(2012, 3, 24),
+            notrack=True,
+            )
+        self.model.Result.objects.filter(pk=r2.pk).update(
+            modified_on=datetime.datetime(2012, 3, 25), notrack=True)
+
+        prefetch = self.prefetch()
+
+        self.assertEqual(prefetch.results[self.rcv1.id], r2)
+        self.assertEqual(
+            self.model.Result.objects.get(is_latest=True).pk, r2.pk)
+
+
+    def test_other_results(self):
+        """Loads other testers' completed or skipped results."""
+        self.F.ResultFactory.create(
+            runcaseversion=self.rcv1, environment=self.env, status="started")
+        r = self.F.ResultFactory.create(
+            runcaseversion=self.rcv2, environment=self.env, status="skipped")
+        self.F.ResultFactory.create(
+            runcaseversion=self.rcv2,
+            environment=self.env,
+            tester=self.user,
+            status="passed",
+            )
+
+        prefetch = self.prefetch()
+
+        self.assertEqual(prefetch.other_results, {self.rcv2.id: r})
+
+
+    def test_stepresults(self):
+        """Loads step results of the user's results."""
+        r = self.F.ResultFactory.create(
+            runcaseversion=self.rcv1, environment=self.env, tester=self.user)
+        sr = self.F.StepResultFactory.create(
+            result=r, step__caseversion=self.rcv1.caseversion)
+
+        prefetch = self.prefetch()
+
+        self.assertEqual(prefetch.stepresults, {(r.id, sr.step.id): sr})
+
+
+    def test_suites(self):
+        """Loads the suites of the run that include each case."""
+        s = self.F.SuiteFactory.create(product=self.run.productversion.product)
+        self.F.SuiteCaseFactory.create(suite=s, case=self.rcv1.caseversion.case)
+        self.F.RunSuiteFactory.create(suite=s, run=self.run)
+        other = self.F.SuiteFactory.create(
+            product=self.run.productversion.product)
+        self.F.SuiteCaseFactory.create(
+            suite=other, case=self.rcv1.caseversion.case)
+
+        prefetch = self.prefetch()
+
+        self.assertEqual(
+            prefetch.suites, {self.rcv1.id: [s], self.rcv2.id: []})
+
+
+    def test_query_count(self):
+        """Loading a page costs a constant number of queries."""
+        for rcv in [self.rcv1, self.rcv2]:
+            r = self.F.ResultFactory.create(
+                runcaseversion=rcv, environment=self.env, tester=self.user)
+            self.F.StepResultFactory.create(
+                result=r, step__caseversion=rcv.caseversion)
+        rcvs = list(
+            self.model.RunCaseVersion.objects.select_related(
+                "caseversion__case"))
+        from moztrap.view.runtests.prefetch import ResultPrefetch
+        prefetch = ResultPrefetch(self.run, self.env, self.user)
+
+        with self.assertNumQueries(4):
+            prefetch.load(rcvs)
+
+
+    def test_tags_use_prefetch(self):
+        """Template tags read from a ResultPrefetch in context."""
+        r = self.F.ResultFactory.create(
+            runcaseversion=self.rcv1,
+            environment=self.env,
+            tester=self.user,
+            status="failed",
+            )
+        other = self.F.ResultFactory.create(
+            runcaseversion=self.rcv1, environment=self.env, status="passed")
+        step = self.F.CaseStepFactory.create(caseversion=self.rcv1.caseversion)
+        sr = self.F.StepResultFactory.create(result=r, step=step)
+        prefetch = self.prefetch()
+        t = Template(
+            "{% load execution %}"
+            "{% result_for rcv user env as result %}"
+            "{% other_result_for rcv user env as other_result %}"
+            "{% stepresult_for result step as stepresult %}"
+            "{% suites_for run rcv as suites %}"
+            "{{ result.id }} {{ other_result.id }} {{ stepresult.id }} "
+            "{{ suites|length }}"
+            )
+
+        with self.assertNumQueries(0):
+            rendered = t.render(
+                Context(
+                    {
+                        "result_prefetch": prefetch,
+                        "rcv": self.rcv1,
+                        "user": self.user,
+                        "env": self.env,
+                        "step": step,
+                        "run": self.run,
+                        }
+                    )
+                )
+
+        self.assertEqual(
+            rendered, "{0} {1} {2} 0".format(r.id, other.id, sr.id))
@@ -3,6 +3,7 @@ Tests for runtests views.
 
 """
 from datetime import datetime
+import json
 
 from django.core.urlresolvers import reverse
 
@@ -355,6 +356,36 @@ class RunTestsTest(case.view.ListViewTestCase,
             )
 
 
+    def test_pending_lock_redirects_to_wait(self):
+        """If the run's cases are still being locked in, wait for them."""
+        self.model.RunLockJob.enqueue(self.testrun)
+
+        res = self.get(status=302)
+
+        self.assertRedirects(
+            res,
+            reverse(
+                "runtests_wait",
+                kwargs={"run_id": self.testrun.id, "env_id": self.envs[0].id}),
+            )
+
+
+    def test_activating_run_redirects_to_wait(self):
+        """A draft run whose activation lock is pending waits for it."""
+        self.testrun.status = "draft"
+        self.testrun.save()
+        self.model.RunLockJob.enqueue(self.testrun, activate=True)
+
+        res = self.get(status=302)
+
+        self.assertRedirects(
+            res,
+            reverse(
+                "runtests_wait",
+                kwargs={"run_id": self.testrun.id, "env_id": self.envs[0].id}),
+            )
+
+
     def test_environment(self):
         """Environment is shown in template."""
         res = self.get(status=200)
@@ -464,6 +495,37 @@ class RunTestsTest(case.view.ListViewTestCase,
         self.assertOrderInList(res, "t1", "t2", "t3", "t4", "t5", "t6")
 
 
+    def test_sort_by_status_other_tester(self):
+        """Another tester's more recent result changes the sort order."""
+        user2 = self.F.UserFactory()
+        t1 = self.create_rcv(caseversion__name="t1")
+        t2 = self.create_rcv(caseversion__name="t2")
+        self.create_result(runcaseversion=t1, status="passed")
+        self.create_result(runcaseversion=t2, status="invalidated")
+        params = {"sortfield": "current_result", "sortdirection": "asc"}
+
+        self.assertOrderInList(self.get(params=params), "t2", "t1")
+
+        self.create_result(runcaseversion=t2, status="skipped", tester=user2)
+
+        self.assertOrderInList(self.get(params=params), "t1", "t2")
+
+
+    def test_sort_by_status_ignores_pending(self):
+        """Another tester's pending result doesn't hide a completed one."""
+        user2 = self.F.UserFactory()
+        t1 = self.create_rcv(caseversion__name="t1")
+        t2 = self.create_rcv(caseversion__name="t2")
+        self.create_result(runcaseversion=t1, status="passed")
+        self.create_result(runcaseversion=t2, status="blocked")
+        self.create_result(runcaseversion=t2, status="started", tester=user2)
+
+        res = self.get(
+            params={"sortfield": "current_result", "sortdirection": "asc"})
+
+        self.assertOrderInList(res, "t2", "t1")
+
+
     def test_sort_by_status_env_specific(self):
         """
         Can sort by status.  Specific to env in question.
@@ -489,6 +551,20 @@ class RunTestsTest(case.view.ListViewTestCase,
         self.assertOrderInList(res, "t1", "t2")
 
 
+    def test_sort_by_status_ignores_superseded(self):
+        """Sorting by status only considers latest results."""
+        t1 = self.create_rcv(caseversion__name="t1")
+        t2 = self.create_rcv(caseversion__name="t2")
+        self.create_result(runcaseversion=t1, status="passed")
+        self.create_result(runcaseversion=t1, status="blocked")
+        self.create_result(runcaseversion=t2, status="failed")
+
+        res = self.get(
+            params={"sortfield": "current_result", "sortdirection": "asc"})
+
+        self.assertOrderInList(res, "t1", "t2")
+
+
     def test_description(self):
         """Returns details HTML snippet for given caseversion"""
 
@@ -821,3 +897,285 @@ class RunTestsTest(case.view.ListViewTestCase,
 
         self.assertEqual(result.status, result.STATUS.invalidated)
         self.assertEqual(result.comment, "")
+
+
+
+class BulkTest(case.view.AuthenticatedViewTestCase):
+    """Tests for runtests bulk view."""
+    csrf_checks = False
+
+
+    def setUp(self):
+        """These tests all require a test run, envs and cases."""
+        super(BulkTest, self).setUp()
+        self.testrun = self.F.RunFactory.create(status="active")
+        self.envs = self.F.EnvironmentFactory.create_full_set(
+            {"OS": ["Windows 7", "Ubuntu Linux"]})
+        self.testrun.environments.add(*self.envs)
+        self.rcvs = [
+            self.F.RunCaseVersionFactory.create(
+                run=self.testrun, environments=self.envs)
+            for i in range(2)
+            ]
+        # the factory sets environments directly; count them as locking does
+        from moztrap.model.execution.models import update_completion
+        update_completion(runs=[self.testrun], runcaseversions=self.rcvs)
+        self.add_perm("execute")
+
+
+    @property
+    def url(self):
+        """Shortcut for runtests_bulk url."""
+        return reverse(
+            "runtests_bulk",
+            kwargs={"run_id": self.testrun.id, "env_id": self.envs[0].id})
+
+
+    def post(self, actions, **kwargs):
+        """POST given actions as JSON."""
+        kwargs.setdefault("user", self.user)
+        return self.app.post(
+            self.url,
+            json.dumps(actions),
+            content_type="application/json",
+            **kwargs
+            )
+
+
+    def test_requires_execute_permission(self):
+        """Requires execute permission."""
+        res = self.app.post(
+            self.url, "[]", user=self.F.UserFactory.create(), status=302)
+
+        self.assertRedirects(res, "/")
+
+
+    def test_requires_post(self):
+        """GET is not allowed."""
+        self.get(status=405)
+
+
+    def test_applies_actions(self):
+        """Applies all actions; returns statuses and completion as JSON."""
+        rcv1, rcv2 = self.rcvs
+
+        res = self.post(
+            [
+                {"runcaseversion": rcv1.id, "action": "result_pass"},
+                {"runcaseversion": rcv2.id, "action": "result_skip"},
+                {"runcaseversion": 0, "action": "result_pass"},
+                ],
+            status=200,
+            )
+
+        self.assertEqual(
+            res.json,
+            {
+                "rows": {
+                    str(rcv1.id): {"status": "passed", "completion": 0.5},
+                    str(rcv2.id): {"status": "skipped", "completion": 0.0},
+                    },
+                # skipped cases don't count against completion
+                "completion": 0.5,
+                "errors": [
+                    {
+                        "index": 2,
+                        "error": "0 is not a valid run/caseversion ID.",
+                        },
+                    ],
+                }
+            )
+        self.assertEqual(
+            rcv1.results.get(is_latest=True, tester=self.user).status,
+            "passed")
+
+
+    def test_crossed_cases_and_envs(self):
+        """Results in other cases and envs stay latest."""
+        rcv1, rcv2 = self.rcvs
+        other = self.F.ResultFactory.create(
+            runcaseversion=rcv2,
+            environment=self.envs[1],
+            tester=self.user,
+            status="failed",
+            )
+
+        # skipping rcv1 records results in both envs, passing rcv2 in one
+        self.post(
+            [
+                {"runcaseversion": rcv1.id, "action": "result_skip"},
+                {"runcaseversion": rcv2.id, "action": "result_pass"},
+                ],
+            status=200,
+            )
+
+        self.assertTrue(self.refresh(other).is_latest)
+        self.assertEqual(
+            set(self.model.Result.objects.filter(
+                is_latest=True).values_list(
+                    "runcaseversion", "environment", "status")),
+            set(
+                [
+                    (rcv1.id, self.envs[0].id, "skipped"),
+                    (rcv1.id, self.envs[1].id, "skipped"),
+                    (rcv2.id, self.envs[0].id, "passed"),
+                    (rcv2.id, self.envs[1].id, "failed"),
+                    ]
+                ),
+            )
+        self.assertEqual(
+            set(self.model.LatestResult.objects.values_list(
+                "result", flat=True)),
+            set(self.model.Result.objects.filter(
+                is_latest=True).values_list("id", flat=True)),
+            )
+
+
+    def test_not_a_list(self):
+        """A request body that isn't a JSON list is a 400 error."""
+        res = self.app.post(
+            self.url, "foo", user=self.user, status=400)
+
+        self.assertEqual(
+            res.json, {"error": "Request must contain a list of actions."})
+
+
+    def test_inactive_run(self):
+        """Actions can't be applied to a run that isn't active."""
+        self.testrun.deactivate()
+
+        res = self.post(
+            [{"runcaseversion": self.rcvs[0].id, "action": "result_pass"}],
+            status=400,
+            )
+
+        self.assertEqual(
+            res.json,
+            {"error": "That test run is currently not open for testing."},
+            )
+        self.assertEqual(self.model.Result.objects.count(), 0)
+
+
+    def test_bad_env_id_404(self):
+        """An environment not in the run returns 404."""
+        url = reverse(
+            "runtests_bulk",
+            kwargs={
+                "run_id": self.testrun.id,
+                "env_id": self.F.EnvironmentFactory.create().id,
+                }
+            )
+
+        self.app.post(url, "[]", user=self.user, status=404)
+
+
+
+class WaitTest(case.view.AuthenticatedViewTestCase,
+               case.view.NoCacheTest,
+               ):
+    """Tests for runtests wait view."""
+    def setUp(self):
+        """These tests all require a test run and env, and execute perm."""
+        super(WaitTest, self).setUp()
+        self.testrun = self.F.RunFactory.create(status="active")
+        self.env = self.F.EnvironmentFactory.create()
+        self.testrun.environments.add(self.env)
+        self.add_perm("execute")
+
+
+    @property
+    def url(self):
+        """Shortcut for runtests_wait url."""
+        return reverse(
+            "runtests_wait",
+            kwargs={"run_id": self.testrun.id, "env_id": self.env.id})
+
+
+    def test_requires_execute_permission(self):
+        """Requires execute permission."""
+        res = self.app.get(
+            self.url, user=self.F.UserFactory.create(), status=302)
+
+        self.assertRedirects(res, "/")
+
+
+    def test_progress(self):
+        """Shows stage and progress of a running lock, and reloads."""
+        job = self.model.RunLockJob.enqueue(self.testrun)
+        job.status = "running"
+        job.stage = "adding cases"
+        job.progress = 30
+        job.save()
+
+        res = self.get(status=200)
+
+        res.mustcontain("Adding cases (30% done)")
+        self.assertElement(
+            res.body, "meta", attrs={"http-equiv": "refresh"})
+
+
+    def test_done_redirects_to_run(self):
+        """Once the lock is done, redirects to the run."""
+        res = self.get(status=302)
+
+        self.assertRedirects(
+            res,
+            reverse(
+                "runtests_run",
+                kwargs={"run_id": self.testrun.id, "env_id": self.env.id}),
+            )
+
+
+
+class ProgressTest(case.view.AuthenticatedViewTestCase,
+                   case.view.NoCacheTest,
+                   ):
+    """Tests for runtests progress view."""
+    def setUp(self):
+        """These tests all require a test run, and execute perm."""
+        super(ProgressTest, self).setUp()
+        self.testrun = self.F.RunFactory.create(status="active")
+        self.add_perm("execute")
+
+
+    @property
+    def url(self):
+        """Shortcut for runtests_progress url."""
+        return reverse(
+            "runtests_progress", kwargs={"run_id": self.testrun.id})
+
+
+    def test_pending(self):
+        """Returns status, stage and progress of a pending lock."""
+        job = self.model.RunLockJob.enqueue(self.testrun)
+        job.status = "running"
+        job.stage = "setting environments"
+        job.progress = 65
+        job.save()
+
+        res = self.get(status=200)
+
+        self.assertEqual(
+            res.json,
+            {
+                "status": "running",
+                "stage": "setting environments",
+                "progress": 65,
+                "done": False,
+                }
+            )
+
+
+    def test_done(self):
+        """Reports done if no lock is pending."""
+        res = self.get(status=200)
+
+        self.assertEqual(res.json["done"], True)
+        self.assertEqual(res.json["progress"], 100)
+
+
+    def test_bad_run_id_404(self):
+        """Bad run id returns 404."""
+        url = reverse("runtests_progress", kwargs={"run_id": 9999})
+
+        self.app.get(url, user=self.user, status=404)